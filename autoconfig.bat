@@ -247,7 +247,7 @@ if not exist "%LOGS_DIR%" mkdir "%LOGS_DIR%"
 
 :: ---- Start Backend ----
 cd /d "%BACKEND_DIR%"
-start "EcoLens-Backend" /min cmd /c "call venv\Scripts\activate.bat && python -m uvicorn main:app --host 0.0.0.0 --port %BACKEND_PORT% --log-level info > "%LOGS_DIR%\backend.log" 2>&1"
+start "EcoLens-Backend" /min cmd /c "call venv\Scripts\activate.bat && python -m uvicorn main:app --host 0.0.0.0 --port %BACKEND_PORT% --ws-per-message-deflate false --log-level info > "%LOGS_DIR%\backend.log" 2>&1"
 
 :: Wait for backend PID
 timeout /t 4 /nobreak >nul 2>&1
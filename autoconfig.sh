@@ -276,6 +276,7 @@ launch_services() {
     nohup python -m uvicorn main:app \
         --host 0.0.0.0 \
         --port "$BACKEND_PORT" \
+        --ws-per-message-deflate false \
         --log-level info \
         > "$LOGS_DIR/backend.log" 2>&1 &
     local B_PID=$!
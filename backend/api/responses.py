@@ -0,0 +1,52 @@
+"""
+Response helpers for the Eco-Lens REST API.
+
+FastAPI's default path for endpoints declaring a ``response_model`` runs
+the returned object through ``jsonable_encoder`` and re-validates it
+against the model before serializing.  The data served here is produced
+by our own services and is already well-typed, so that work is pure
+overhead.  ``PydanticResponse`` serializes Pydantic models (or plain
+containers of them) straight to JSON bytes in a single Rust-native pass
+via ``pydantic_core``.
+
+Because endpoints return a ``Response`` instance, FastAPI skips its own
+serialization entirely; ``response_model=`` can stay on the route
+decorators purely to document the schema in OpenAPI.
+"""
+
+import asyncio
+from typing import Any, Mapping, Optional
+
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class PydanticResponse(Response):
+    """JSON response rendered directly from Pydantic models."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+    @classmethod
+    async def create(
+        cls,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        offload: bool = False,
+    ) -> "PydanticResponse":
+        """
+        Build a response, optionally serializing in a worker thread.
+
+        Set ``offload=True`` for large payloads (e.g. the pollution grid)
+        so JSON encoding does not block the event loop.
+        """
+        if offload:
+            body = await asyncio.to_thread(to_json, content)
+        else:
+            body = to_json(content)
+        return cls(content=body, status_code=status_code, headers=headers)
@@ -6,10 +6,11 @@ green routing, pollution grids, and global statistics.
 """
 
 import logging
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from starlette.responses import Response
 
 from models import (
     SensorData,
@@ -19,6 +20,8 @@ from models import (
     GlobalStats,
     HealthData,
 )
+from api.responses import PydanticResponse
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -29,23 +32,67 @@ router = APIRouter()
 # ---------------------------------------------------------------------------
 # This dict is shared with main.py's simulation loop. It holds:
 #   "sensors": Dict[str, SensorData]     -- current sensor readings
+#   "sensor_list": List[SensorData]      -- the same, in camera order
 #   "services": Dict[str, Any]           -- service instances
 #   "grid": Optional[GridData]           -- latest interpolated grid
 #   "stats": GlobalStats                 -- latest global stats
+#   "version": int                       -- bumped once per simulation cycle
 
 _state: dict = {}
 
+# Serialized response bodies keyed by endpoint, tagged with the state
+# version they were built from. Readers within one simulation cycle share
+# a single computation and serialization.
+_response_cache: Dict[str, Tuple[int, bytes]] = {}
+
+# Versioned bodies only change once per simulation cycle, so clients may
+# reuse them for that long and revalidate with If-None-Match afterwards.
+_CACHE_CONTROL = f"private, max-age={settings.SENSOR_UPDATE_INTERVAL}"
+
 
 def set_state(state: dict) -> None:
     """Called by main.py to inject the shared state dict."""
     global _state
     _state = state
+    _response_cache.clear()
+
+
+async def _versioned_response(
+    key: str,
+    build: Callable[[], Any],
+    request: Optional[Request] = None,
+    offload: bool = False,
+) -> Response:
+    """
+    Serve ``build()`` as JSON, reusing the body until the state changes.
+
+    Responses carry an ETag derived from the state version; a request
+    whose If-None-Match still matches gets an empty 304.
+    """
+    version = _state.get("version")
+    if version is None:
+        return await PydanticResponse.create(build(), offload=offload)
+
+    etag = f'"{version:x}"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return PydanticResponse(content=cached[1], headers=headers)
+
+    response = await PydanticResponse.create(build(), headers=headers, offload=offload)
+    _response_cache[key] = (version, response.body)
+    return response
 
 
 def _get_sensors_list() -> List[SensorData]:
     """Return all current sensor data as a list."""
-    sensors_dict = _state.get("sensors", {})
-    return list(sensors_dict.values())
+    sensor_list = _state.get("sensor_list")
+    if sensor_list is not None:
+        return sensor_list
+    return list(_state.get("sensors", {}).values())
 
 
 def _get_sensor(sensor_id: str) -> SensorData:
@@ -74,9 +121,9 @@ async def health_check():
 
 
 @router.get("/api/sensors", response_model=List[SensorData])
-async def list_sensors():
+async def list_sensors(request: Request) -> Response:
     """List all sensors with current data."""
-    return _get_sensors_list()
+    return await _versioned_response("sensors", _get_sensors_list, request)
 
 
 @router.get("/api/sensors/{sensor_id}", response_model=SensorData)
@@ -96,7 +143,9 @@ async def get_sensor_history(
 
     from database import get_history
     history = await get_history(sensor_id, hours=hours)
-    return {"sensor_id": sensor_id, "hours": hours, "readings": history}
+    return await PydanticResponse.create(
+        {"sensor_id": sensor_id, "hours": hours, **history}
+    )
 
 
 @router.get("/api/forecast/{sensor_id}", response_model=List[ForecastPoint])
@@ -115,7 +164,7 @@ async def get_forecast(sensor_id: str):
 
 
 @router.get("/api/health-impact")
-async def get_health_impact():
+async def get_health_impact() -> PydanticResponse:
     """Get health impact summary across all sensors."""
     sensors = _get_sensors_list()
     services = _state.get("services", {})
@@ -124,8 +173,16 @@ async def get_health_impact():
     if health_service is None:
         raise HTTPException(status_code=503, detail="Health service unavailable")
 
-    health_data_list = [s.health for s in sensors]
-    summary = health_service.get_aggregate_health_summary(health_data_list)
+    # Prefer the columnar snapshot kept by the simulation loop
+    soa = _state.get("sensors_soa")
+    if soa is not None:
+        summary = health_service.aggregate_health_arrays(
+            soa["health_score"], soa["cigarettes"], soa["risk_idx"]
+        )
+    else:
+        summary = health_service.get_aggregate_health_summary(
+            [s.health for s in sensors]
+        )
 
     # Include per-sensor breakdown
     per_sensor = []
@@ -139,11 +196,11 @@ async def get_health_impact():
             "advisory": s.health.vulnerable_advisory,
         })
 
-    return {
+    return await PydanticResponse.create({
         "summary": summary,
         "sensors": per_sensor,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+        "timestamp": _state.get("timestamp_iso") or datetime.now(timezone.utc).isoformat(),
+    })
 
 
 @router.get("/api/routing/green-path", response_model=GreenRoute)
@@ -160,58 +217,41 @@ async def get_green_route(
     if routing_service is None:
         raise HTTPException(status_code=503, detail="Routing service unavailable")
 
-    # Update routing service with current sensor data
-    sensors = _get_sensors_list()
-    routing_service.update_sensors(sensors)
+    # Refresh the routing service's readings once per state version
+    routing_service.update_sensors(
+        _state.get("sensors", {}).values(), _state.get("version")
+    )
 
     route = routing_service.find_green_route(from_lat, from_lng, to_lat, to_lng)
     return route
 
 
-@router.get("/api/grid", response_model=GridData)
-async def get_pollution_grid():
-    """Get interpolated pollution grid for heatmap visualization."""
+def _build_grid() -> GridData:
+    """Return the cached grid, interpolating on demand if not yet built."""
     grid = _state.get("grid")
     if grid is not None:
         return grid
 
-    # Generate on demand if not cached
     services = _state.get("services", {})
     mesh_service = services.get("mesh")
     if mesh_service is None:
         raise HTTPException(status_code=503, detail="Mesh service unavailable")
 
-    sensors = _get_sensors_list()
-    grid = mesh_service.generate_grid(sensors)
-    return grid
+    return mesh_service.generate_grid(_get_sensors_list())
+
+
+def _build_stats() -> GlobalStats:
+    """Return the stats precomputed by the simulation loop."""
+    return _state.get("stats") or GlobalStats()
+
+
+@router.get("/api/grid", response_model=GridData)
+async def get_pollution_grid(request: Request) -> Response:
+    """Get interpolated pollution grid for heatmap visualization."""
+    return await _versioned_response("grid", _build_grid, request, offload=True)
 
 
 @router.get("/api/stats", response_model=GlobalStats)
-async def get_global_stats():
+async def get_global_stats(request: Request) -> Response:
     """Get global statistics across all sensors."""
-    stats = _state.get("stats")
-    if stats is not None:
-        return stats
-
-    # Calculate on demand if not cached
-    sensors = _get_sensors_list()
-    if not sensors:
-        return GlobalStats()
-
-    total_vehicles = sum(s.vehicles.total for s in sensors)
-    avg_aqi = sum(s.pollution.aqi for s in sensors) / len(sensors)
-    avg_pm25 = sum(s.pollution.pm25 for s in sensors) / len(sensors)
-    avg_noise = sum(s.noise.db_level for s in sensors) / len(sensors)
-
-    healthiest = min(sensors, key=lambda s: s.pollution.aqi)
-    most_polluted = max(sensors, key=lambda s: s.pollution.aqi)
-
-    return GlobalStats(
-        active_sensors=len(sensors),
-        avg_aqi=round(avg_aqi, 1),
-        avg_pm25=round(avg_pm25, 1),
-        avg_noise_db=round(avg_noise, 1),
-        total_vehicles_detected=total_vehicles,
-        healthiest_zone=healthiest.name,
-        most_polluted_zone=most_polluted.name,
-    )
+    return await _versioned_response("stats", _build_stats, request)
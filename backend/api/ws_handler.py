@@ -8,117 +8,336 @@ sensor updates at configurable intervals.
 import asyncio
 import json
 import logging
+import zlib
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Set
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Set, Tuple
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic_core import to_json
 
 from models import (
     SensorData,
     GridData,
-    ParticleData,
     GlobalStats,
     ForecastPoint,
-    WebSocketMessage,
 )
 from config import settings
+from services.physics_engine import particles_to_records
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Pre-encoded reply to client "ping" messages
+_PONG_FRAME = b'{"type": "pong"}'
+
+# Per-client outbound queue depth (matches the websockets library default)
+CLIENT_QUEUE_SIZE = 32
+
+# Clients enqueued per broadcast step before yielding to the event loop
+BROADCAST_BATCH_SIZE = 50
+
+# Broadcasts are deltas against the previous cycle; every FULL_SYNC_CYCLES
+# (~60 s) one carries the full state as a periodic reconciliation.  A client
+# that loses a queued frame is resynced on the next broadcast instead.
+FULL_SYNC_CYCLES = max(1, round(60 / settings.SENSOR_UPDATE_INTERVAL))
+
+# How long the broadcaster waits after a notification so that state
+# updates arriving in a burst go out as one frame
+COALESCE_DELAY = 0.05
+
+# zlib level for pre-compressed frames; level 1 already shrinks a full
+# frame ~4x and is the cheapest to run on every cycle
+DEFLATE_LEVEL = 1
+
+
+@lru_cache(maxsize=4)
+def _deflate(frame: bytes) -> bytes:
+    """
+    Compress a frame for clients connected with ``?encoding=deflate``.
+
+    Frames are shared objects cached per state version, so each one is
+    compressed once no matter how many clients receive it.  Server-side
+    permessage-deflate is disabled (see main.py) because it would
+    compress every frame again, separately for every client.
+    """
+    return zlib.compress(frame, DEFLATE_LEVEL)
+
 
 class ConnectionManager:
     """
     Manages WebSocket connections for broadcasting real-time updates
     to all connected clients.
+
+    Every client gets its own bounded outbound queue drained by a
+    dedicated relay task, so a slow consumer only delays itself: a
+    broadcast is an O(1) enqueue per client, and when a client falls
+    behind its oldest pending frame is dropped in favour of the newest.
+    The dropped frame may have been a delta, so that client is sent the
+    full state instead of the next delta.
     """
 
     def __init__(self) -> None:
-        self._active_connections: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._relays: Dict[WebSocket, asyncio.Task] = {}
+        # Clients that asked for pre-compressed frames
+        self._deflating: Set[WebSocket] = set()
+        # Immutable snapshot of (queue, wants deflate) pairs, rebuilt on
+        # connect/disconnect (rare) so broadcast (every cycle) iterates
+        # it without copying.
+        self._targets: Tuple[Tuple[asyncio.Queue, bool], ...] = ()
+        # Queues that lost a frame and need the full state next broadcast
+        self._resync: Set[asyncio.Queue] = set()
+
+    async def connect(self, websocket: WebSocket, deflate: bool = False) -> None:
+        """
+        Accept and register a new WebSocket connection.
 
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept and register a new WebSocket connection."""
+        With ``deflate=True`` every frame queued for this client is sent
+        zlib-compressed.
+        """
         await websocket.accept()
-        async with self._lock:
-            self._active_connections.add(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._queues[websocket] = queue
+        if deflate:
+            self._deflating.add(websocket)
+        self._targets = self._targets + ((queue, deflate),)
+        self._relays[websocket] = asyncio.create_task(self._relay(websocket, queue))
         logger.info(
             "WebSocket client connected. Total clients: %d",
-            len(self._active_connections),
+            len(self._queues),
         )
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection from the active set."""
-        async with self._lock:
-            self._active_connections.discard(websocket)
-        logger.info(
-            "WebSocket client disconnected. Total clients: %d",
-            len(self._active_connections),
-        )
+        """Remove a WebSocket connection and stop its relay task."""
+        if self._remove(websocket):
+            logger.info(
+                "WebSocket client disconnected. Total clients: %d",
+                len(self._queues),
+            )
+
+    def _remove(self, websocket: WebSocket) -> bool:
+        """Unregister a connection; returns False if it was already gone."""
+        queue = self._queues.pop(websocket, None)
+        if queue is not None:
+            self._targets = tuple(t for t in self._targets if t[0] is not queue)
+            self._resync.discard(queue)
+        self._deflating.discard(websocket)
+        relay = self._relays.pop(websocket, None)
+        if relay is None:
+            return False
+        if relay is not asyncio.current_task():
+            relay.cancel()
+        return True
+
+    async def _relay(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Drain one client's queue onto its socket until a send fails."""
+        while True:
+            message = await queue.get()
+            try:
+                await websocket.send_bytes(message)
+            except Exception:
+                self._remove(websocket)
+                logger.info("Removed dead WebSocket connection")
+                return
 
-    async def broadcast(self, message: str) -> None:
-        """
-        Send a message to all connected clients.
-        Disconnects clients that fail to receive.
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, message: bytes) -> bool:
         """
-        dead_connections: List[WebSocket] = []
+        Queue a message, dropping the oldest pending one when full.
 
-        async with self._lock:
-            connections = list(self._active_connections)
+        Returns True if a frame was dropped to make room.
+        """
+        try:
+            queue.put_nowait(message)
+            return False
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(message)
+            return True
+
+    def send_personal(self, websocket: WebSocket, message: bytes) -> None:
+        """Queue a message for a single client."""
+        queue = self._queues.get(websocket)
+        if queue is not None:
+            if websocket in self._deflating:
+                message = _deflate(message)
+            if self._enqueue(queue, message):
+                self._resync.add(queue)
+
+    async def broadcast(
+        self,
+        message: bytes,
+        full: Optional[Callable[[], bytes]] = None,
+    ) -> None:
+        """
+        Queue a message for every connected client.
 
-        for websocket in connections:
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                dead_connections.append(websocket)
+        ``message`` is a delta when ``full`` is given: ``full`` then
+        builds the full-state frame, which replaces the delta for clients
+        that lost a frame since their last full state.  Without ``full``,
+        ``message`` is itself a full-state frame.
 
-        # Clean up dead connections
-        if dead_connections:
-            async with self._lock:
-                for ws in dead_connections:
-                    self._active_connections.discard(ws)
-            logger.info("Removed %d dead WebSocket connections", len(dead_connections))
+        Large audiences are processed in batches of BROADCAST_BATCH_SIZE
+        with a yield in between, so a big fan-out cannot hold the event
+        loop for the whole client list.
+        """
+        targets = self._targets
+        deflated = _deflate(message) if self._deflating else message
+        if len(targets) <= BROADCAST_BATCH_SIZE:
+            self._broadcast_batch(targets, message, deflated, full)
+            return
+
+        for start in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            self._broadcast_batch(
+                targets[start:start + BROADCAST_BATCH_SIZE], message, deflated, full
+            )
+            await asyncio.sleep(0)
+
+    def _broadcast_batch(
+        self,
+        targets: Tuple[Tuple[asyncio.Queue, bool], ...],
+        message: bytes,
+        deflated: bytes,
+        full: Optional[Callable[[], bytes]],
+    ) -> None:
+        """Enqueue one broadcast for ``targets``, tracking lost deltas."""
+        resync = self._resync
+        for queue, deflate in targets:
+            if full is None or queue in resync:
+                # A full state supersedes anything the queue dropped
+                frame = message if full is None else full()
+                self._enqueue(queue, _deflate(frame) if deflate else frame)
+                resync.discard(queue)
+            elif self._enqueue(queue, deflated if deflate else message):
+                resync.add(queue)
 
     @property
     def client_count(self) -> int:
         """Number of currently connected clients."""
-        return len(self._active_connections)
+        return len(self._queues)
 
 
 # Singleton connection manager
 manager = ConnectionManager()
 
+
+def has_active_clients() -> bool:
+    """Whether any WebSocket client is connected to receive updates."""
+    return manager.client_count > 0
+
 # Shared state reference - injected by main.py
 _state: dict = {}
 
 
 def set_state(state: dict) -> None:
     """Called by main.py to inject the shared state dict."""
-    global _state
+    global _state, _cached_frame, _cached_delta, _broadcast_count, _broadcast_version
+    global _update_pending
     _state = state
+    _cached_frame = None
+    _cached_delta = None
+    _broadcast_count = 0
+    _broadcast_version = None
+    _update_pending = asyncio.Event()
 
 
-def _build_ws_message() -> str:
-    """Build a WebSocketMessage JSON string from current state."""
-    sensors_dict: Dict[str, SensorData] = _state.get("sensors", {})
-    sensors_list = list(sensors_dict.values())
+# Last serialized frame, keyed by the state version it was built from.
+# The simulation loop bumps ``_state["version"]`` once per cycle, so every
+# broadcast and per-connection push within a cycle shares one payload.
+_cached_frame: Optional[Tuple[int, bytes]] = None
+_cached_delta: Optional[Tuple[int, bytes]] = None
+_broadcast_count = 0
+_broadcast_version: Optional[int] = None
+
+# Set by notify_update(); consumed by broadcaster_loop()
+_update_pending = asyncio.Event()
+
+
+def _sensor_list() -> List[SensorData]:
+    """Current sensors in camera order, as published by the simulation loop."""
+    sensor_list = _state.get("sensor_list")
+    if sensor_list is not None:
+        return sensor_list
+    return list(_state.get("sensors", {}).values())
+
+
+def _build_ws_message() -> bytes:
+    """Return the WebSocketMessage JSON for the current state version."""
+    global _cached_frame
+
+    version = _state.get("version")
+    if version is not None and _cached_frame is not None and _cached_frame[0] == version:
+        return _cached_frame[1]
+
+    sensors_list = _sensor_list()
     grid: Optional[GridData] = _state.get("grid")
-    particles: List[ParticleData] = _state.get("particles", [])
     stats: GlobalStats = _state.get("stats", GlobalStats())
     forecast: List[ForecastPoint] = _state.get("forecast", [])
 
-    message = WebSocketMessage(
-        type="sensor_update",
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        sensors=sensors_list,
-        grid=grid,
-        particles=particles,
-        stats=stats,
-        forecast=forecast,
-    )
+    # Plain dict mirroring WebSocketMessage: the columnar particles go in
+    # as plain records rather than one model each, and the sub-models are
+    # already validated so there is nothing for an envelope model to check
+    message = {
+        "type": "sensor_update",
+        "timestamp": _state.get("timestamp_iso") or datetime.now(timezone.utc).isoformat(),
+        "sensors": sensors_list,
+        "grid": grid,
+        "particles": particles_to_records(_state.get("particles")),
+        "stats": stats,
+        "forecast": forecast,
+    }
+
+    # The state holds Pydantic models, so pydantic-core's compiled
+    # serializer is the fastest encoder available here: routing them
+    # through msgspec or orjson needs a model_dump() hook per object and
+    # measured roughly 2x slower for a full frame.  Encoding straight to
+    # bytes means every client is sent the same buffer as a binary frame
+    # instead of each send re-encoding a str to UTF-8.
+    frame = to_json(message)
+    if version is not None:
+        _cached_frame = (version, frame)
+    return frame
+
+
+def _build_ws_delta() -> bytes:
+    """
+    Return the WebSocketDelta JSON for the current state version.
+
+    Carries only the sensors and grid the simulation loop marked dirty
+    in ``_state["dirty"]``; stats, particles and forecast are small and
+    change every cycle, so they are always included.
+    """
+    global _cached_delta
 
-    return message.model_dump_json()
+    version = _state.get("version")
+    if version is not None and _cached_delta is not None and _cached_delta[0] == version:
+        return _cached_delta[1]
+
+    sensors_dict: Dict[str, SensorData] = _state.get("sensors", {})
+    dirty: dict = _state.get("dirty") or {}
+    changed_ids = dirty.get("sensors")
+    if changed_ids is None:
+        changed = _sensor_list()
+    else:
+        changed = [sensors_dict[i] for i in changed_ids if i in sensors_dict]
+
+    # Same shape as WebSocketDelta; see _build_ws_message
+    message = {
+        "type": "sensor_delta",
+        "timestamp": _state.get("timestamp_iso") or datetime.now(timezone.utc).isoformat(),
+        "sensors": changed,
+        "grid": _state.get("grid") if dirty.get("grid", True) else None,
+        "particles": particles_to_records(_state.get("particles")),
+        "stats": _state.get("stats", GlobalStats()),
+        "forecast": _state.get("forecast", []),
+    }
+
+    frame = to_json(message)
+    if version is not None:
+        _cached_delta = (version, frame)
+    return frame
 
 
 @router.websocket("/ws")
@@ -126,37 +345,26 @@ async def websocket_endpoint(websocket: WebSocket):
     """
     WebSocket endpoint for real-time sensor data.
 
-    On connect: immediately sends current state.
-    Then sends updates every SENSOR_UPDATE_INTERVAL seconds.
+    On connect: immediately sends the full current state.  After that
+    the client's relay task pushes each delta from ``broadcast_update``
+    as soon as it is queued, while this coroutine answers pings.
+
+    Clients connecting with ``?encoding=deflate`` receive every frame
+    zlib-compressed.
     """
-    await manager.connect(websocket)
+    deflate = websocket.query_params.get("encoding") == "deflate"
+    await manager.connect(websocket, deflate=deflate)
 
     try:
-        # Send initial state immediately
-        initial_message = _build_ws_message()
-        await websocket.send_text(initial_message)
+        # Send initial state immediately; broadcasts after this are deltas
+        manager.send_personal(websocket, _build_ws_message())
 
-        # Keep connection alive and send periodic updates
+        # Outbound frames go through the client's relay task, so this
+        # coroutine only has to serve inbound messages (e.g. ping)
         while True:
-            try:
-                # Wait for either a client message or timeout
-                # This allows us to detect disconnections via ping/pong
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=float(settings.SENSOR_UPDATE_INTERVAL),
-                )
-
-                # Handle client messages (e.g., ping)
-                if data == "ping":
-                    await websocket.send_text('{"type": "pong"}')
-
-            except asyncio.TimeoutError:
-                # Timeout is normal - send an update
-                try:
-                    update = _build_ws_message()
-                    await websocket.send_text(update)
-                except Exception:
-                    break
+            data = await websocket.receive_text()
+            if data == "ping":
+                manager.send_personal(websocket, _PONG_FRAME)
 
     except WebSocketDisconnect:
         pass
@@ -169,13 +377,47 @@ async def websocket_endpoint(websocket: WebSocket):
 async def broadcast_update() -> None:
     """
     Broadcast the current state to all connected WebSocket clients.
-    Called by the main simulation loop after each update.
+    Called by ``broadcaster_loop`` once per coalesced batch of updates.
     """
-    if manager.client_count == 0:
+    global _broadcast_count, _broadcast_version
+
+    if not has_active_clients():
         return
 
     try:
-        message = _build_ws_message()
-        await manager.broadcast(message)
+        version = _state.get("version")
+        # A delta only covers one cycle; if cycles were coalesced (or
+        # skipped while nobody was connected) send the full state instead
+        skipped = (
+            version is None
+            or _broadcast_version is None
+            or version - _broadcast_version != 1
+        )
+        _broadcast_version = version
+        _broadcast_count += 1
+        if skipped or _broadcast_count % FULL_SYNC_CYCLES == 0:
+            await manager.broadcast(_build_ws_message())
+        else:
+            await manager.broadcast(_build_ws_delta(), full=_build_ws_message)
     except Exception as exc:
         logger.error("Broadcast error: %s", exc)
+
+
+def notify_update() -> None:
+    """Signal that a new state version is ready to broadcast."""
+    _update_pending.set()
+
+
+async def broadcaster_loop() -> None:
+    """
+    Broadcast state updates signalled by ``notify_update``.
+
+    Waits ``COALESCE_DELAY`` after the first signal so a burst of updates
+    collapses into a single frame of the latest state, and the producer
+    never waits on serialization or client fan-out.
+    """
+    while True:
+        await _update_pending.wait()
+        await asyncio.sleep(COALESCE_DELAY)
+        _update_pending.clear()
+        await broadcast_update()
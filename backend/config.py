@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 import os
@@ -45,4 +46,10 @@ class Settings(BaseSettings):
     model_config = {"env_file": [".env", "../.env"], "env_file_encoding": "utf-8", "extra": "ignore"}
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once; later calls reuse the parsed instance."""
+    return Settings()
+
+
+settings = get_settings()
@@ -3,7 +3,7 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
 
-from sqlalchemy import Column, Integer, Float, String, DateTime, create_engine, text
+from sqlalchemy import Column, Index, Integer, Float, String, DateTime, create_engine, event, insert, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -35,6 +35,11 @@ class SensorReading(Base):
     wind_direction = Column(Float, default=0.0)
     temperature = Column(Float, default=20.0)
 
+    # Serves both "history for one sensor" and "latest per sensor" lookups
+    __table_args__ = (
+        Index("ix_sensor_ts", "sensor_id", timestamp.desc()),
+    )
+
 
 def _get_async_url(url: str) -> str:
     """Convert a standard SQLite URL to an async-compatible one using aiosqlite."""
@@ -51,14 +56,36 @@ def _get_engine():
     global _async_engine
     if _async_engine is None:
         async_url = _get_async_url(settings.DATABASE_URL)
+        is_sqlite = async_url.startswith("sqlite")
         _async_engine = create_async_engine(
             async_url,
             echo=False,
-            pool_pre_ping=True,
+            # A local SQLite file cannot go stale; pinging it is pure overhead
+            pool_pre_ping=not is_sqlite,
         )
+        if is_sqlite:
+            event.listen(_async_engine.sync_engine, "connect", _set_sqlite_pragmas)
     return _async_engine
 
 
+# Applied to every new SQLite connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",       # readers don't block the writer
+    "PRAGMA synchronous=NORMAL",     # no fsync per commit under WAL
+    "PRAGMA temp_store=MEMORY",      # sorts / temp indexes stay in RAM
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-64000",      # ~64 MB page cache
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune SQLite for a write-heavy time-series workload."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 def _get_session_factory():
     global _async_session_factory
     if _async_session_factory is None:
@@ -76,6 +103,13 @@ async def init_db() -> None:
     engine = _get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all() skips indexes on tables that already exist
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_sensor_ts "
+                "ON sensor_readings (sensor_id, timestamp DESC)"
+            )
+        )
     logger.info("Database initialized successfully")
 
 
@@ -122,46 +156,79 @@ async def save_reading(
             raise
 
 
-async def get_history(sensor_id: str, hours: int = 24) -> List[Dict[str, Any]]:
-    """Return historical readings for a sensor within the last N hours."""
+async def save_readings_batch(readings: List[Dict[str, Any]]) -> None:
+    """
+    Persist several sensor readings in a single transaction.
+
+    Each dict uses the keyword names of ``save_reading``; rows without a
+    ``timestamp`` share the time of the call. Issued as one executemany
+    INSERT and one commit instead of a transaction per sensor.
+    """
+    if not readings:
+        return
+
+    now = datetime.now(timezone.utc)
+    rows = [{"timestamp": now, **reading} for reading in readings]
+
+    session_factory = _get_session_factory()
+    async with session_factory() as session:
+        try:
+            await session.execute(insert(SensorReading), rows)
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            logger.error("Failed to save batch of %d readings: %s", len(rows), exc)
+            raise
+
+
+# Column order of the rows returned by get_history()
+HISTORY_COLUMNS = (
+    "id", "sensor_id", "timestamp", "pm25", "pm10", "no2", "co", "aqi",
+    "noise_db", "trucks", "cars", "buses", "wind_speed", "wind_direction",
+    "temperature",
+)
+
+# Read statements are built once at import and reused for every request
+_COLUMN_LIST = ", ".join(HISTORY_COLUMNS)
+
+_HISTORY_STMT = text(
+    f"SELECT {_COLUMN_LIST} "
+    "FROM sensor_readings "
+    "WHERE sensor_id = :sid AND timestamp >= :cutoff "
+    "ORDER BY timestamp ASC"
+)
+
+_LATEST_STMT = text(
+    "WITH ranked AS ("
+    f"  SELECT {_COLUMN_LIST}, "
+    "  ROW_NUMBER() OVER (PARTITION BY sensor_id ORDER BY timestamp DESC) AS rn "
+    "  FROM sensor_readings"
+    ") "
+    f"SELECT {_COLUMN_LIST} "
+    "FROM ranked WHERE rn = 1"
+)
+
+
+async def get_history(sensor_id: str, hours: int = 24) -> Dict[str, Any]:
+    """
+    Return historical readings for a sensor within the last N hours.
+
+    The result is columnar -- ``{"columns": [...], "rows": [[...], ...]}``
+    with rows in ``HISTORY_COLUMNS`` order -- so long ranges are shipped
+    as plain tuples instead of one dict per row.
+    """
     session_factory = _get_session_factory()
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
     async with session_factory() as session:
         result = await session.execute(
-            text(
-                "SELECT id, sensor_id, timestamp, pm25, pm10, no2, co, aqi, "
-                "noise_db, trucks, cars, buses, wind_speed, wind_direction, temperature "
-                "FROM sensor_readings "
-                "WHERE sensor_id = :sid AND timestamp >= :cutoff "
-                "ORDER BY timestamp ASC"
-            ),
-            {"sid": sensor_id, "cutoff": cutoff},
+            _HISTORY_STMT, {"sid": sensor_id, "cutoff": cutoff}
         )
         rows = result.fetchall()
 
-    records: List[Dict[str, Any]] = []
-    for row in rows:
-        records.append(
-            {
-                "id": row[0],
-                "sensor_id": row[1],
-                "timestamp": row[2].isoformat() if isinstance(row[2], datetime) else str(row[2]),
-                "pm25": row[3],
-                "pm10": row[4],
-                "no2": row[5],
-                "co": row[6],
-                "aqi": row[7],
-                "noise_db": row[8],
-                "trucks": row[9],
-                "cars": row[10],
-                "buses": row[11],
-                "wind_speed": row[12],
-                "wind_direction": row[13],
-                "temperature": row[14],
-            }
-        )
-    return records
+    # Timestamps come back from SQLite as strings; pydantic-core encodes
+    # any datetime from other backends as ISO 8601 when serializing.
+    return {"columns": list(HISTORY_COLUMNS), "rows": [tuple(row) for row in rows]}
 
 
 async def get_latest_readings() -> Dict[str, Dict[str, Any]]:
@@ -169,18 +236,7 @@ async def get_latest_readings() -> Dict[str, Dict[str, Any]]:
     session_factory = _get_session_factory()
 
     async with session_factory() as session:
-        result = await session.execute(
-            text(
-                "SELECT sr.id, sr.sensor_id, sr.timestamp, sr.pm25, sr.pm10, sr.no2, sr.co, "
-                "sr.aqi, sr.noise_db, sr.trucks, sr.cars, sr.buses, sr.wind_speed, "
-                "sr.wind_direction, sr.temperature "
-                "FROM sensor_readings sr "
-                "INNER JOIN ("
-                "  SELECT sensor_id, MAX(timestamp) AS max_ts "
-                "  FROM sensor_readings GROUP BY sensor_id"
-                ") latest ON sr.sensor_id = latest.sensor_id AND sr.timestamp = latest.max_ts"
-            )
-        )
+        result = await session.execute(_LATEST_STMT)
         rows = result.fetchall()
 
     latest: Dict[str, Dict[str, Any]] = {}
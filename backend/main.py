@@ -14,6 +14,7 @@ from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,10 +29,9 @@ from models import (
     HealthData,
     GridData,
     GlobalStats,
-    ParticleData,
     ForecastPoint,
 )
-from database import init_db, save_reading, close_db
+from database import init_db, save_readings_batch, close_db
 from services import (
     VisionService,
     PhysicsEngine,
@@ -42,11 +42,15 @@ from services import (
     RoutingService,
     MeshService,
 )
+from services.health_service import RISK_RANK
+from services.physics_engine import new_particle_batch
 from api.rest_routes import router as rest_router, set_state as set_rest_state
 from api.ws_handler import (
     router as ws_router,
     set_state as set_ws_state,
-    broadcast_update,
+    broadcaster_loop,
+    has_active_clients,
+    notify_update,
 )
 
 # ---------------------------------------------------------------------------
@@ -71,6 +75,12 @@ CAMERAS = [
     {"id": "cam-006", "name": "Chandni Chowk",      "lat": 28.6506, "lng": 77.2302},
 ]
 
+# Visualization particles emitted per camera per cycle
+PARTICLES_PER_SENSOR = 12
+
+# Per-cycle random draws are made in one vectorized call
+_rng = np.random.default_rng()
+
 # ---------------------------------------------------------------------------
 # Service instances
 # ---------------------------------------------------------------------------
@@ -87,11 +97,16 @@ mesh_service = MeshService()
 # Shared application state
 # ---------------------------------------------------------------------------
 app_state: Dict = {
-    "sensors": {},         # Dict[str, SensorData]
+    "sensors": {},         # Dict[str, SensorData], for lookup by id
+    "sensor_list": [],     # List[SensorData] same readings in CAMERAS order
     "grid": None,          # Optional[GridData]
-    "particles": [],       # List[ParticleData]
+    "particles": None,     # Optional[ParticleBatch] columnar, see new_particle_batch
     "stats": GlobalStats(),
     "forecast": [],        # List[ForecastPoint]
+    "sensors_soa": None,   # Optional[Dict] columnar snapshot, see new_sensor_soa
+    "version": 0,          # bumped once per simulation cycle
+    "timestamp_iso": None, # Optional[str] ISO time of the current cycle
+    "dirty": None,         # Optional[Dict] what changed this cycle, for WS deltas
     "services": {
         "vision": vision_service,
         "physics": physics_engine,
@@ -107,6 +122,7 @@ app_state: Dict = {
 # Background task handles
 _simulation_task: Optional[asyncio.Task] = None
 _weather_task: Optional[asyncio.Task] = None
+_broadcast_task: Optional[asyncio.Task] = None
 
 # Current weather (shared across all sensors in simulation)
 _current_weather: WeatherData = WeatherData()
@@ -139,31 +155,86 @@ async def weather_update_loop() -> None:
         await asyncio.sleep(settings.WEATHER_UPDATE_INTERVAL)
 
 
+# ---------------------------------------------------------------------------
+# Columnar sensor snapshot
+# ---------------------------------------------------------------------------
+def new_sensor_soa(cameras: List[Dict]) -> Dict:
+    """
+    Allocate a structure-of-arrays snapshot for the given cameras.
+
+    Row ``i`` of every array belongs to ``cameras[i]``.  The simulation
+    loop overwrites the rows in place each cycle, so aggregations run as
+    vectorized NumPy reductions instead of per-sensor attribute lookups.
+    """
+    n = len(cameras)
+    return {
+        "ids": [c["id"] for c in cameras],
+        "names": [c["name"] for c in cameras],
+        "aqi": np.zeros(n, dtype=np.float64),
+        "pm25": np.zeros(n, dtype=np.float64),
+        "noise_db": np.zeros(n, dtype=np.float64),
+        "vehicles": np.zeros(n, dtype=np.int64),
+        "health_score": np.zeros(n, dtype=np.float64),
+        "cigarettes": np.zeros(n, dtype=np.float64),
+        "risk_idx": np.zeros(n, dtype=np.int8),
+    }
+
+
+def fill_sensor_soa(soa: Dict, i: int, sensor: SensorData) -> None:
+    """Write one sensor's readings into row ``i`` of the snapshot."""
+    soa["aqi"][i] = sensor.pollution.aqi
+    soa["pm25"][i] = sensor.pollution.pm25
+    soa["noise_db"][i] = sensor.noise.db_level
+    soa["vehicles"][i] = sensor.vehicles.total
+    soa["health_score"][i] = sensor.health.score
+    soa["cigarettes"][i] = sensor.health.equivalent_cigarettes
+    soa["risk_idx"][i] = RISK_RANK[sensor.health.risk_level]
+
+
+def _sensor_changed(prev: Optional[SensorData], sensor: SensorData) -> bool:
+    """
+    True if a sensor's readings differ from the previous cycle.
+
+    The timestamp is left out: it changes every cycle, and the delta's
+    own timestamp is applied to every sensor it does not list.
+    """
+    if prev is None:
+        return True
+    return (
+        prev.status != sensor.status
+        or prev.vehicles != sensor.vehicles
+        or prev.pollution != sensor.pollution
+        or prev.weather != sensor.weather
+        or prev.noise != sensor.noise
+        or prev.health != sensor.health
+    )
+
+
 # ---------------------------------------------------------------------------
 # Compute global statistics
 # ---------------------------------------------------------------------------
-def compute_global_stats(sensors: Dict[str, SensorData]) -> GlobalStats:
-    """Compute aggregate statistics across all sensors."""
-    sensor_list = list(sensors.values())
-    if not sensor_list:
+def compute_global_stats(soa: Dict) -> GlobalStats:
+    """
+    Compute aggregate statistics from the columnar sensor snapshot.
+
+    Runs once per simulation cycle so /api/stats and the WebSocket frame
+    only ever read the finished result.
+    """
+    n = len(soa["ids"])
+    if n == 0:
         return GlobalStats()
 
-    total_vehicles = sum(s.vehicles.total for s in sensor_list)
-    avg_aqi = sum(s.pollution.aqi for s in sensor_list) / len(sensor_list)
-    avg_pm25 = sum(s.pollution.pm25 for s in sensor_list) / len(sensor_list)
-    avg_noise = sum(s.noise.db_level for s in sensor_list) / len(sensor_list)
-
-    healthiest = min(sensor_list, key=lambda s: s.pollution.aqi)
-    most_polluted = max(sensor_list, key=lambda s: s.pollution.aqi)
-
-    return GlobalStats(
-        active_sensors=len(sensor_list),
-        avg_aqi=round(avg_aqi, 1),
-        avg_pm25=round(avg_pm25, 1),
-        avg_noise_db=round(avg_noise, 1),
-        total_vehicles_detected=total_vehicles,
-        healthiest_zone=healthiest.name,
-        most_polluted_zone=most_polluted.name,
+    aqi = soa["aqi"]
+
+    # Values come from our own services; skip Pydantic re-validation
+    return GlobalStats.model_construct(
+        active_sensors=n,
+        avg_aqi=round(float(aqi.mean()), 1),
+        avg_pm25=round(float(soa["pm25"].mean()), 1),
+        avg_noise_db=round(float(soa["noise_db"].mean()), 1),
+        total_vehicles_detected=int(soa["vehicles"].sum()),
+        healthiest_zone=soa["names"][int(aqi.argmin())],
+        most_polluted_zone=soa["names"][int(aqi.argmax())],
     )
 
 
@@ -176,13 +247,17 @@ async def simulation_loop() -> None:
     1. Detect vehicles at each camera (simulated)
     2. Calculate pollution using Gaussian plume model
     3. Estimate noise levels
-    4. Compute health impacts
+    4. Compute health impacts and accumulate exposure dose
     5. Generate forecast
     6. Build interpolated grid
     7. Generate particles
     8. Update global stats
     9. Save to database
     10. Broadcast via WebSocket
+
+    Steps 5-7 and 10 only feed the live view, so they are skipped while
+    no WebSocket client is connected, except on persistence cycles which
+    keep the REST snapshot reasonably fresh.
     """
     logger.info(
         "Simulation loop started (interval: %ds, cameras: %d)",
@@ -200,16 +275,42 @@ async def simulation_loop() -> None:
     except Exception:
         logger.warning("Initial weather fetch failed, using defaults")
 
+    soa = new_sensor_soa(CAMERAS)
+    app_state["sensors_soa"] = soa
+    # Exposure time each cycle's readings stand for, in hours
+    dose_hours = settings.SENSOR_UPDATE_INTERVAL / 3600.0
+
     cycle = 0
+    grid_stale = True
     while True:
         try:
             cycle += 1
             now = datetime.now(timezone.utc)
             timestamp = now.isoformat()
 
-            all_particles: List[ParticleData] = []
-
-            for cam in CAMERAS:
+            persist = cycle % 12 == 0
+            # Particles, grid, forecast and broadcast are only worth
+            # computing when someone is watching
+            active = has_active_clients() or persist
+            # One preallocated batch per cycle; each camera fills its slice
+            if active:
+                particles = new_particle_batch(len(CAMERAS) * PARTICLES_PER_SENSOR)
+            pending_readings: List[Dict] = []
+            changed_sensors: List[str] = []
+            # Built off to the side and published after the camera loop, so
+            # readers served while the loop yields never see a mixed cycle
+            sensors: Dict[str, SensorData] = {}
+            sensor_list: List[SensorData] = []
+
+            # Traffic speed/distance are shared, so single-vehicle noise
+            # levels are the same for every camera this cycle
+            single_noise_levels = acoustic_service.precompute_single_levels()
+            noise_jitter = _rng.standard_normal(len(CAMERAS)).tolist()
+
+            vehicles_list: List[VehicleCounts] = []
+            pollutions: List[PollutionData] = []
+            noises: List[NoiseData] = []
+            for i, cam in enumerate(CAMERAS):
                 cam_id = cam["id"]
 
                 # 1. Vehicle detection
@@ -219,27 +320,43 @@ async def simulation_loop() -> None:
                 pollution = physics_engine.calculate_pollution(vehicles, _current_weather)
 
                 # 3. Noise estimation
-                noise = acoustic_service.estimate_noise(vehicles)
-
-                # 4. Health impact
-                health = health_service.calculate_health_impact(pollution, noise)
+                noise = acoustic_service.estimate_noise_fast(
+                    vehicles, single_noise_levels, jitter=noise_jitter[i]
+                )
 
                 # 5. Record observation for forecasting
                 forecast_service.record_observation(cam_id, pollution.pm25)
 
                 # 6. Generate particles
-                particles = physics_engine.generate_particles(
-                    sensor_id=cam_id,
-                    lat=cam["lat"],
-                    lng=cam["lng"],
-                    pollution=pollution,
-                    weather=_current_weather,
-                    count=12,
-                )
-                all_particles.extend(particles)
+                if active:
+                    physics_engine.generate_particles(
+                        sensor_id=cam_id,
+                        lat=cam["lat"],
+                        lng=cam["lng"],
+                        pollution=pollution,
+                        weather=_current_weather,
+                        count=PARTICLES_PER_SENSOR,
+                        out=particles,
+                        start=i * PARTICLES_PER_SENSOR,
+                    )
+
+                vehicles_list.append(vehicles)
+                pollutions.append(pollution)
+                noises.append(noise)
+
+                # Let API and WebSocket handlers run between cameras
+                await asyncio.sleep(0)
+
+            # 4. Health impact, scored for every camera in one vectorized pass
+            healths = health_service.calculate_health_impact_batch(pollutions, noises)
+
+            for cam, vehicles, pollution, noise, health in zip(
+                CAMERAS, vehicles_list, pollutions, noises, healths
+            ):
+                cam_id = cam["id"]
 
                 # Build sensor data
-                sensor = SensorData(
+                sensor = SensorData.model_construct(
                     id=cam_id,
                     name=cam["name"],
                     lat=cam["lat"],
@@ -252,48 +369,77 @@ async def simulation_loop() -> None:
                     health=health,
                     timestamp=timestamp,
                 )
-                app_state["sensors"][cam_id] = sensor
-
-                # 9. Save to database (every 12th cycle = ~1 minute to avoid DB bloat)
-                if cycle % 12 == 0:
-                    try:
-                        await save_reading(
-                            sensor_id=cam_id,
-                            pm25=pollution.pm25,
-                            pm10=pollution.pm10,
-                            no2=pollution.no2,
-                            co=pollution.co,
-                            aqi=pollution.aqi,
-                            noise_db=noise.db_level,
-                            trucks=vehicles.trucks,
-                            cars=vehicles.cars,
-                            buses=vehicles.buses,
-                            wind_speed=_current_weather.wind_speed,
-                            wind_direction=_current_weather.wind_direction,
-                            temperature=_current_weather.temperature,
-                        )
-                    except Exception as exc:
-                        logger.error("DB save failed for %s: %s", cam_id, exc)
-
-            # 7. Build interpolated grid (every 3rd cycle to save CPU)
-            if cycle % 3 == 0:
-                sensors_list = list(app_state["sensors"].values())
-                grid = mesh_service.generate_grid(sensors_list)
+                if _sensor_changed(app_state["sensors"].get(cam_id), sensor):
+                    changed_sensors.append(cam_id)
+                sensors[cam_id] = sensor
+                sensor_list.append(sensor)
+
+                # 9. Queue for database (every 12th cycle = ~1 minute to avoid DB bloat)
+                if persist:
+                    pending_readings.append({
+                        "sensor_id": cam_id,
+                        "pm25": pollution.pm25,
+                        "pm10": pollution.pm10,
+                        "no2": pollution.no2,
+                        "co": pollution.co,
+                        "aqi": pollution.aqi,
+                        "noise_db": noise.db_level,
+                        "trucks": vehicles.trucks,
+                        "cars": vehicles.cars,
+                        "buses": vehicles.buses,
+                        "wind_speed": _current_weather.wind_speed,
+                        "wind_direction": _current_weather.wind_direction,
+                        "temperature": _current_weather.temperature,
+                    })
+
+            app_state["sensors"] = sensors
+            app_state["sensor_list"] = sensor_list
+            for i, sensor in enumerate(sensor_list):
+                fill_sensor_soa(soa, i, sensor)
+
+            # Accumulate each camera's exposure dose over this cycle
+            health_service.update_cumulative_dose_batch(
+                soa["ids"], soa["pm25"], dose_hours
+            )
+
+            # 7. Build interpolated grid (every 3rd cycle to save CPU, or
+            # straight away if it went stale while nobody was connected)
+            grid_due = cycle % 3 == 0 or grid_stale
+            grid_changed = active and grid_due
+            grid_stale = grid_due and not active
+            if grid_changed:
+                grid = mesh_service.generate_grid(sensor_list)
                 app_state["grid"] = grid
 
             # 8. Update global stats
-            app_state["stats"] = compute_global_stats(app_state["sensors"])
-            app_state["particles"] = all_particles
+            app_state["stats"] = compute_global_stats(soa)
+            if active:
+                app_state["particles"] = particles
 
             # Generate forecast for the first sensor (representative)
-            if app_state["sensors"]:
+            if active and app_state["sensors"]:
                 first_id = CAMERAS[0]["id"]
                 app_state["forecast"] = forecast_service.generate_forecast(
                     first_id, hours_ahead=6, interval_minutes=30
                 )
 
-            # 10. Broadcast to WebSocket clients
-            await broadcast_update()
+            # Publish the new state version before broadcasting so
+            # cached serializations are rebuilt exactly once per cycle
+            app_state["timestamp_iso"] = timestamp
+            app_state["dirty"] = {"sensors": changed_sensors, "grid": grid_changed}
+            app_state["version"] += 1
+
+            # 10. Hand off to the WebSocket broadcaster
+            if active:
+                notify_update()
+
+            # 9. Save all queued readings in one transaction, after the
+            # hand-off so the DB round-trip never delays the broadcast
+            if pending_readings:
+                try:
+                    await save_readings_batch(pending_readings)
+                except Exception as exc:
+                    logger.error("DB save failed for cycle %d: %s", cycle, exc)
 
             if cycle % 12 == 0:
                 stats = app_state["stats"]
@@ -317,7 +463,7 @@ async def simulation_loop() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown logic for the FastAPI application."""
-    global _simulation_task, _weather_task
+    global _simulation_task, _weather_task, _broadcast_task
 
     logger.info("Eco-Lens backend starting up...")
 
@@ -331,6 +477,7 @@ async def lifespan(app: FastAPI):
 
     # Start background tasks
     _weather_task = asyncio.create_task(weather_update_loop())
+    _broadcast_task = asyncio.create_task(broadcaster_loop())
 
     if settings.SIMULATION_MODE:
         logger.info("Starting simulation mode")
@@ -363,6 +510,13 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    if _broadcast_task is not None:
+        _broadcast_task.cancel()
+        try:
+            await _broadcast_task
+        except asyncio.CancelledError:
+            pass
+
     await close_db()
     logger.info("Shutdown complete")
 
@@ -400,8 +554,10 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers["Permissions-Policy"] = (
             "camera=(), microphone=(), geolocation=()"
         )
-        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
+        # Endpoints that support ETag revalidation set their own policy
+        if "Cache-Control" not in response.headers:
+            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+            response.headers["Pragma"] = "no-cache"
         return response
 
 
@@ -466,4 +622,7 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=False,
         log_level="info",
+        # Frames are compressed once per broadcast (ws_handler._deflate);
+        # per-connection deflate would redo that work for every client
+        ws_per_message_deflate=False,
     )
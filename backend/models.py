@@ -1,9 +1,15 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+# Per-cycle readings are rebuilt each simulation cycle and never mutated;
+# freezing them lets cached serializations and snapshots share instances.
+_READING_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
 
 class VehicleCounts(BaseModel):
+    model_config = _READING_CONFIG
+
     trucks: int = 0
     cars: int = 0
     buses: int = 0
@@ -12,6 +18,8 @@ class VehicleCounts(BaseModel):
 
 
 class PollutionData(BaseModel):
+    model_config = _READING_CONFIG
+
     pm25: float = 0.0
     pm10: float = 0.0
     no2: float = 0.0
@@ -21,6 +29,8 @@ class PollutionData(BaseModel):
 
 
 class WeatherData(BaseModel):
+    model_config = _READING_CONFIG
+
     wind_speed: float = 0.0
     wind_direction: float = 0.0
     temperature: float = 20.0
@@ -28,11 +38,15 @@ class WeatherData(BaseModel):
 
 
 class NoiseData(BaseModel):
+    model_config = _READING_CONFIG
+
     db_level: float = 0.0
     category: str = "Quiet"
 
 
 class HealthData(BaseModel):
+    model_config = _READING_CONFIG
+
     score: int = 100
     risk_level: str = "Low"
     equivalent_cigarettes: float = 0.0
@@ -40,6 +54,8 @@ class HealthData(BaseModel):
 
 
 class SensorData(BaseModel):
+    model_config = _READING_CONFIG
+
     id: str
     name: str
     lat: float
@@ -80,6 +96,8 @@ class GreenRoute(BaseModel):
 
 
 class ParticleData(BaseModel):
+    model_config = _READING_CONFIG
+
     x: float
     y: float
     vx: float
@@ -90,6 +108,8 @@ class ParticleData(BaseModel):
 
 
 class GlobalStats(BaseModel):
+    model_config = _READING_CONFIG
+
     active_sensors: int = 0
     avg_aqi: float = 0.0
     avg_pm25: float = 0.0
@@ -107,3 +127,14 @@ class WebSocketMessage(BaseModel):
     particles: List[ParticleData] = []
     stats: GlobalStats
     forecast: List[ForecastPoint] = []
+
+
+class WebSocketDelta(BaseModel):
+    """Incremental update: only what changed since the previous cycle."""
+    type: str = "sensor_delta"
+    timestamp: str                        # cycle time, also for unchanged sensors
+    sensors: List[SensorData]             # changed sensors only
+    grid: Optional[GridData] = None       # None = unchanged
+    particles: List[ParticleData] = []
+    stats: GlobalStats
+    forecast: List[ForecastPoint] = []
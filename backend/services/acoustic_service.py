@@ -37,12 +37,25 @@ References:
 import math
 import random
 import logging
-from typing import Dict, List
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from models import VehicleCounts, NoiseData, GridData
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT for the noise grid kernel
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+    _prange = numba.prange
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    _prange = range
+
 # ---------------------------------------------------------------------------
 # Reference emission levels
 # ---------------------------------------------------------------------------
@@ -86,19 +99,134 @@ _NOISE_CATEGORIES = [
     (75.0, 999.0, "Extreme"),
 ]
 
+# Upper bounds and labels of _NOISE_CATEGORIES for bisection; levels at
+# or above the last bound fall through to the trailing "Extreme"
+_NOISE_UPPERS = tuple(high for _, high, _ in _NOISE_CATEGORIES)
+_NOISE_LABELS = tuple(label for _, _, label in _NOISE_CATEGORIES) + ("Extreme",)
+
+
+# Fleet slots in the level array built by estimate_noise()
+_VEHICLE_TYPES = ("trucks", "cars", "buses", "motorcycles")
+
+# 10*log10(x) == ln(x) / _DB_PER_NEPER and 10^(L/10) == exp(L * _DB_PER_NEPER);
+# exp/log are single libm calls, cheaper than pow with a float exponent
+_DB_PER_NEPER = math.log(10.0) / 10.0
+
+# Acoustic energy of the 35 dB ambient background
+_AMBIENT_ENERGY = math.exp(35.0 * _DB_PER_NEPER)
 
-def _db_add(*levels: float) -> float:
+
+def _db_add(levels: np.ndarray) -> float:
     """
     Add decibel levels using energy summation:
         L_total = 10 * log10( sum(10^(L_i/10)) )
 
     This is the physically correct way to combine independent sound
-    sources (incoherent addition).
+    sources (incoherent addition).  Non-positive entries are treated as
+    absent.  The sum is done as a log-sum-exp in natural-log units, so
+    it is a single reduction and cannot overflow for loud sources.
     """
-    total_energy = sum(10.0 ** (lev / 10.0) for lev in levels if lev > 0)
-    if total_energy <= 0:
+    levels = levels[levels > 0]
+    if levels.size == 0:
         return 0.0
-    return 10.0 * math.log10(total_energy)
+    return float(np.logaddexp.reduce(levels * _DB_PER_NEPER)) / _DB_PER_NEPER
+
+
+def _noise_grid_kernel(
+    sensor_lats: np.ndarray,
+    sensor_lngs: np.ndarray,
+    sensor_db: np.ndarray,
+    cos_lats: np.ndarray,
+    north: float,
+    west: float,
+    lat_step: float,
+    lng_step: float,
+    resolution: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Received noise level (dB) at every grid cell centre, written into
+    the ``(resolution, resolution)`` array ``out``.
+
+    Written as plain loops over arrays so Numba can compile it to native
+    code (rows run in parallel).  ``_noise_grid_broadcast`` is used
+    instead when Numba is not installed.
+    """
+    for row in _prange(resolution):
+        cell_lat = north - (row + 0.5) * lat_step
+
+        for col in range(resolution):
+            cell_lng = west + (col + 0.5) * lng_step
+
+            energy_sum = 0.0
+
+            for k in range(sensor_lats.shape[0]):
+                # Distance in meters (flat-earth approximation for short distances)
+                dlat_m = (cell_lat - sensor_lats[k]) * 111320.0
+                dlng_m = (cell_lng - sensor_lngs[k]) * 111320.0 * cos_lats[k]
+                dist = max(math.sqrt(dlat_m * dlat_m + dlng_m * dlng_m), 1.0)
+
+                # Distance attenuation from source (reference at 15m)
+                if dist <= 15.0:
+                    atten = 0.0
+                else:
+                    atten = 15.0 * math.log10(dist / 15.0)
+
+                # Atmospheric absorption
+                atmos = _ATMOS_ABSORPTION * (dist / 1000.0)
+
+                received_db = sensor_db[k] - atten - atmos
+                if received_db > 0:
+                    energy_sum += math.exp(received_db * _DB_PER_NEPER)
+
+            # Add ambient background (35 dB)
+            out[row, col] = math.log(energy_sum + _AMBIENT_ENERGY) / _DB_PER_NEPER
+
+    return out
+
+
+def _noise_grid_broadcast(
+    sensor_lats: np.ndarray,
+    sensor_lngs: np.ndarray,
+    sensor_db: np.ndarray,
+    cos_lats: np.ndarray,
+    north: float,
+    west: float,
+    lat_step: float,
+    lng_step: float,
+    resolution: int,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    NumPy equivalent of ``_noise_grid_kernel`` for when Numba is absent.
+
+    Evaluates all (row, col, sensor) triples as one broadcast
+    ``(R, R, N)`` tensor instead of three nested Python loops.
+    """
+    idx = np.arange(resolution) + 0.5
+    cell_lat = north - idx * lat_step                    # (R,)
+    cell_lng = west + idx * lng_step                     # (R,)
+
+    dlat_m = (cell_lat[:, None, None] - sensor_lats) * 111320.0    # (R, 1, N)
+    dlng_m = (cell_lng[None, :, None] - sensor_lngs) * (111320.0 * cos_lats)  # (1, R, N)
+    dist = np.maximum(np.sqrt(dlat_m ** 2 + dlng_m ** 2), 1.0)     # (R, R, N)
+
+    atten = 15.0 * np.log10(np.maximum(dist, 15.0) / 15.0)  # 0 within 15 m
+    received_db = sensor_db - atten - _ATMOS_ABSORPTION * (dist / 1000.0)
+
+    energy = np.where(received_db > 0, np.exp(received_db * _DB_PER_NEPER), 0.0).sum(axis=-1)
+    energy += _AMBIENT_ENERGY
+    np.log(energy, out=out)
+    out /= _DB_PER_NEPER
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    _noise_grid = numba.njit(cache=True, fastmath=True, parallel=True)(
+        _noise_grid_kernel
+    )
+else:
+    _noise_grid = _noise_grid_broadcast
 
 
 class AcousticService:
@@ -108,13 +236,25 @@ class AcousticService:
     """
 
     def __init__(self) -> None:
-        pass
+        # Noise grid output buffers, reused across calls per resolution
+        self._grid_buf: Dict[int, np.ndarray] = {}
+
+        # Everything reported by get_status() is a module constant, so
+        # the status dict is built once and shared by every caller
+        self._status = {
+            "service": "AcousticService",
+            "model": "FHWA Traffic Noise Model",
+            "reference_levels": {k: v["L_ref"] for k, v in _NOISE_REF.items()},
+            "atmospheric_absorption_db_km": _ATMOS_ABSORPTION,
+            "ground_factor": _GROUND_FACTOR,
+        }
 
     # ==================================================================
     # Single vehicle noise
     # ==================================================================
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _single_vehicle_level(
         vehicle_type: str,
         speed_kmh: float = 50.0,
@@ -145,6 +285,12 @@ class AcousticService:
         -------
         float
             Sound pressure level in dB(A).
+
+        Notes
+        -----
+        Pure function of its arguments, and the simulation only ever uses
+        four vehicle types at a fixed speed and distance, so results are
+        memoized.
         """
         ref = _NOISE_REF.get(vehicle_type, _NOISE_REF["cars"])
         speed = max(speed_kmh, 5.0)
@@ -153,14 +299,16 @@ class AcousticService:
         # Speed correction
         speed_correction = 10.0 * math.log10(speed / ref["v_ref"])
 
-        # Distance attenuation (line source: 10*log10)
-        distance_attenuation = 10.0 * math.log10(dist / ref["d_ref"])
+        # Distance attenuation (line source: 10*log10); the ground effect
+        # below scales the same log-distance term
+        log_dist = math.log10(dist / ref["d_ref"])
+        distance_attenuation = 10.0 * log_dist
 
         # Atmospheric absorption
         atmos = _ATMOS_ABSORPTION * (dist / 1000.0)
 
         # Ground effect
-        ground_effect = _GROUND_FACTOR * max(0, 3.0 * math.log10(dist / ref["d_ref"]))
+        ground_effect = _GROUND_FACTOR * max(0.0, 3.0 * log_dist)
 
         level = (
             ref["L_ref"]
@@ -172,20 +320,6 @@ class AcousticService:
 
         return level
 
-    # ==================================================================
-    # Fleet noise
-    # ==================================================================
-
-    @staticmethod
-    def _fleet_noise_level(single_db: float, count: int) -> float:
-        """
-        Compute combined noise from N identical incoherent sources.
-            L_N = L_single + 10 * log10(N)
-        """
-        if count <= 0:
-            return 0.0
-        return single_db + 10.0 * math.log10(count)
-
     # ==================================================================
     # Public API: estimate noise from vehicle counts
     # ==================================================================
@@ -214,37 +348,87 @@ class AcousticService:
         NoiseData
             Pydantic model with db_level and category.
         """
-        vehicle_types = {
-            "trucks": vehicles.trucks,
-            "cars": vehicles.cars,
-            "buses": vehicles.buses,
-            "motorcycles": vehicles.motorcycles,
-        }
+        return self.estimate_noise_fast(
+            vehicles, self.precompute_single_levels(avg_speed, distance)
+        )
 
-        fleet_levels = []
-        for vtype, count in vehicle_types.items():
-            if count <= 0:
-                continue
-            single_db = self._single_vehicle_level(vtype, avg_speed, distance)
-            fleet_db = self._fleet_noise_level(single_db, count)
-            fleet_levels.append(fleet_db)
+    def precompute_single_levels(
+        self,
+        avg_speed: float = 40.0,
+        distance: float = 15.0,
+    ) -> np.ndarray:
+        """
+        Single-vehicle levels for every vehicle type at one speed/distance.
+
+        Callers estimating noise for many cameras under the same traffic
+        conditions compute this once and pass it to
+        ``estimate_noise_fast``.
+
+        Returns
+        -------
+        np.ndarray
+            dB(A) per vehicle type, in ``_VEHICLE_TYPES`` order.
+        """
+        return np.array(
+            [self._single_vehicle_level(vtype, avg_speed, distance) for vtype in _VEHICLE_TYPES],
+            dtype=np.float64,
+        )
+
+    def estimate_noise_fast(
+        self,
+        vehicles: VehicleCounts,
+        single_levels: np.ndarray,
+        jitter: Optional[float] = None,
+    ) -> NoiseData:
+        """
+        Estimate Leq from precomputed single-vehicle levels.
+
+        Parameters
+        ----------
+        vehicles : VehicleCounts
+            Current vehicle counts by type.
+        single_levels : np.ndarray
+            Output of ``precompute_single_levels``.
+        jitter : float, optional
+            Standard-normal perturbation (dB) added for realism.  Callers
+            estimating many sensors should draw these in one batch; one
+            is drawn here when omitted.
+
+        Returns
+        -------
+        NoiseData
+            Pydantic model with db_level and category.
+        """
+        counts = np.array(
+            [vehicles.trucks, vehicles.cars, vehicles.buses, vehicles.motorcycles],
+            dtype=np.float64,
+        )
+        present = counts > 0
+
+        # One slot per vehicle type plus the ambient floor; empty fleets
+        # stay at 0 and are skipped by _db_add.  L_N = L_single + 10*log10(N)
+        levels = np.zeros(len(_VEHICLE_TYPES) + 1, dtype=np.float64)
+        fleet = levels[:-1]
+        np.log10(counts, out=fleet, where=present)
+        fleet *= 10.0
+        np.add(fleet, single_levels, out=fleet, where=present)
 
-        if fleet_levels:
-            combined_db = _db_add(*fleet_levels)
-        else:
-            combined_db = 35.0  # quiet background
+        if not present.any():
+            levels[0] = 35.0  # quiet background
 
         # Add urban ambient background noise floor (~45 dB)
-        ambient = 45.0
-        total_db = _db_add(combined_db, ambient)
+        levels[-1] = 45.0
+        total_db = _db_add(levels)
 
         # Small Gaussian perturbation for realism
-        total_db += random.gauss(0, 1.0)
+        if jitter is None:
+            jitter = random.gauss(0, 1.0)
+        total_db += jitter
         total_db = max(30.0, round(total_db, 1))
 
         category = self._categorize_noise(total_db)
 
-        return NoiseData(db_level=total_db, category=category)
+        return NoiseData.model_construct(db_level=total_db, category=category)
 
     # ==================================================================
     # Noise category classification
@@ -253,10 +437,7 @@ class AcousticService:
     @staticmethod
     def _categorize_noise(db_level: float) -> str:
         """Map dB(A) level to a WHO-based noise category."""
-        for low, high, label in _NOISE_CATEGORIES:
-            if db_level < high:
-                return label
-        return "Extreme"
+        return _NOISE_LABELS[bisect_right(_NOISE_UPPERS, db_level)]
 
     # ==================================================================
     # Noise grid (for heatmap visualization)
@@ -297,57 +478,26 @@ class AcousticService:
         lat_step = (north - south) / resolution
         lng_step = (east - west) / resolution
 
-        grid: List[List[float]] = []
-
-        for row in range(resolution):
-            grid_row: List[float] = []
-            cell_lat = north - (row + 0.5) * lat_step
-
-            for col in range(resolution):
-                cell_lng = west + (col + 0.5) * lng_step
-
-                energy_sum = 0.0
-
-                for sensor in sensors:
-                    s_lat = sensor["lat"]
-                    s_lng = sensor["lng"]
-                    source_db = sensor.get("db_level", 65.0)
-
-                    # Distance in meters (flat-earth approximation for short distances)
-                    dlat_m = (cell_lat - s_lat) * 111320.0
-                    dlng_m = (cell_lng - s_lng) * 111320.0 * math.cos(math.radians(s_lat))
-                    dist = math.sqrt(dlat_m ** 2 + dlng_m ** 2)
-                    dist = max(dist, 1.0)
-
-                    # Distance attenuation from source (reference at 15m)
-                    if dist <= 15.0:
-                        atten = 0.0
-                    else:
-                        atten = 15.0 * math.log10(dist / 15.0)
-
-                    # Atmospheric absorption
-                    atmos = _ATMOS_ABSORPTION * (dist / 1000.0)
+        sensor_lats = np.array([s["lat"] for s in sensors], dtype=np.float64)
+        sensor_lngs = np.array([s["lng"] for s in sensors], dtype=np.float64)
+        sensor_db = np.array([s.get("db_level", 65.0) for s in sensors], dtype=np.float64)
+        cos_lats = np.cos(np.radians(sensor_lats))
 
-                    received_db = source_db - atten - atmos
-                    if received_db > 0:
-                        energy_sum += 10.0 ** (received_db / 10.0)
+        buf = self._grid_buf.get(resolution)
+        if buf is None:
+            buf = self._grid_buf[resolution] = np.empty((resolution, resolution))
 
-                # Add ambient background (35 dB)
-                energy_sum += 10.0 ** (35.0 / 10.0)
-
-                if energy_sum > 0:
-                    total_db = 10.0 * math.log10(energy_sum)
-                else:
-                    total_db = 35.0
-
-                grid_row.append(round(total_db, 1))
-
-            grid.append(grid_row)
+        _noise_grid(
+            sensor_lats, sensor_lngs, sensor_db, cos_lats,
+            north, west, lat_step, lng_step, resolution, buf,
+        )
+        np.round(buf, 1, out=buf)
 
-        return GridData(
+        # Nested lists are only built at the model boundary
+        return GridData.model_construct(
             bounds=grid_bounds,
             resolution=resolution,
-            values=grid,
+            values=buf.tolist(),
         )
 
     # ==================================================================
@@ -355,11 +505,5 @@ class AcousticService:
     # ==================================================================
 
     def get_status(self) -> dict:
-        """Return service status information."""
-        return {
-            "service": "AcousticService",
-            "model": "FHWA Traffic Noise Model",
-            "reference_levels": {k: v["L_ref"] for k, v in _NOISE_REF.items()},
-            "atmospheric_absorption_db_km": _ATMOS_ABSORPTION,
-            "ground_factor": _GROUND_FACTOR,
-        }
+        """Return service status information (shared; do not mutate)."""
+        return self._status
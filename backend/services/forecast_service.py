@@ -4,7 +4,7 @@ Eco-Lens Forecast Service
 Predictive pollution forecasting using Triple Exponential Smoothing
 (Holt-Winters additive method) with a 24-hour seasonal cycle.
 
-Maintains a rolling history buffer of PM2.5 readings per sensor.
+Maintains rolling hourly PM2.5 averages per sensor.
 When sufficient data is available (>= 2 full seasonal cycles = 48 hourly
 readings), uses the full Holt-Winters seasonal model. With less data,
 falls back to Holt's linear trend method or a simple flat forecast.
@@ -36,19 +36,213 @@ References:
 """
 
 import math
-import random
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Tuple, Deque
-from collections import deque
+from typing import List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
 
 from models import ForecastPoint, PollutionData
 
 logger = logging.getLogger(__name__)
 
-# Maximum history length per sensor (in 5-second readings, ~1 hour)
+# Bound once: read on every observation
+_time = time.time
+
+# Optional JIT for the Holt-Winters recurrence
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Cap on the reported short-interval reading count per sensor
+# (in 5-second readings, ~1 hour)
 _MAX_HISTORY = 720
 
+# Maximum hourly history per sensor for Holt-Winters (3 seasons)
+_MAX_HOURLY = 72
+
+# One-step-ahead residuals kept for the rolling std (~5 minutes)
+_RESIDUAL_WINDOW = 60
+
+# Gaussian rush-hour exponents, -0.5 / sigma**2, folded once
+_MORNING_RUSH_COEF = -0.5 / 1.5 ** 2
+_EVENING_RUSH_COEF = -0.5 / 1.8 ** 2
+
+
+class _RingBuffer:
+    """
+    Fixed-capacity FIFO of scalars backed by a preallocated NumPy array.
+
+    Appends are O(1) and unboxed; once full, each append overwrites the
+    oldest value, so there is never a list slice to truncate history.
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the
+    newest ``capacity`` values always sit contiguously in the backing
+    array and ``latest`` can return a view instead of stitching the
+    wrapped halves together.  Views are only valid until the next append.
+    """
+
+    __slots__ = ("_data", "_capacity", "_head", "_count")
+
+    def __init__(self, capacity: int, dtype=np.float64) -> None:
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._capacity = capacity
+        self._head = 0   # next write position, in [0, capacity)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value) -> Optional[float]:
+        """Add a value; returns the value it evicted, if the ring was full."""
+        data = self._data
+        head = self._head
+        cap = self._capacity
+        evicted = None
+        if self._count == cap:
+            # ndarray.item(i) unboxes without an intermediate NumPy scalar
+            evicted = data.item(head)
+        else:
+            self._count += 1
+        data[head] = value
+        data[head + cap] = value
+        self._head = (head + 1) % cap
+        return evicted
+
+    def latest(self, k: Optional[int] = None) -> np.ndarray:
+        """Return the newest ``k`` values (all if omitted), oldest first."""
+        count = self._count if k is None else min(k, self._count)
+        end = self._head + self._capacity
+        return self._data[end - count:end]
+
+
+@dataclass
+class _SensorState:
+    """All forecasting state for one sensor, fetched with one dict lookup."""
+
+    level: float
+    trend: float = 0.0
+    # Short-interval (5-second) readings seen; the smoothing state and
+    # hourly bins carry everything forecasts need, so only the count is kept
+    n_readings: int = 0
+    # Hourly averages for Holt-Winters, with their epoch-second timestamps
+    hourly: _RingBuffer = field(
+        default_factory=lambda: _RingBuffer(_MAX_HOURLY, dtype=np.float32)
+    )
+    hourly_ts: _RingBuffer = field(
+        default_factory=lambda: _RingBuffer(_MAX_HOURLY, dtype=np.int64)
+    )
+    # Bumped whenever an hourly bin is committed; keys hw_fit
+    hourly_version: int = 0
+    # Last Holt-Winters fit: (hourly_version, forecasts, std error)
+    hw_fit: Optional[Tuple[int, Sequence[float], float]] = None
+    # Accumulator for the current hour
+    hour_sum: float = 0.0
+    hour_n: int = 0
+    last_hour: Optional[int] = None  # Unix hour (epoch seconds // 3600)
+    # Rolling one-step-ahead residuals with their Welford mean / M2.
+    # Kept float64: evicted values are subtracted back out of the sums,
+    # and must match what was added exactly.
+    residuals: _RingBuffer = field(default_factory=lambda: _RingBuffer(_RESIDUAL_WINDOW))
+    resid_mean: float = 0.0
+    resid_m2: float = 0.0
+
+
+def _hw_init(data: Sequence[float], m: int) -> Tuple[float, float]:
+    """
+    Initial Holt-Winters level and trend for ``data``.
+
+    Exactly rounded sums (fsum), so the initial level and seasonal
+    deviations the whole recurrence builds on carry no drift.  Numba has
+    no ``fsum``, so the compiled kernel takes these as arguments.  ``data``
+    is a list of floats or a float64 array (float32 slopes would round).
+    """
+    first_season = data[:m]
+    level = math.fsum(first_season) / m
+
+    if len(data) >= 2 * m:
+        # Mean of the per-point slopes between the first two seasons
+        trend = math.fsum(
+            b - a for a, b in zip(first_season, data[m: 2 * m])
+        ) / (m * m)
+    else:
+        trend = 0.0
+    return level, trend
+
+
+def _hw_kernel(
+    y: np.ndarray,
+    m: int,
+    alpha: float,
+    beta: float,
+    gamma: float,
+    level: float,
+    trend: float,
+) -> Tuple[np.ndarray, float, int]:
+    """
+    Holt-Winters smoothing and forecast over a float64 array, starting
+    from the ``_hw_init`` level and trend.
+
+    Same computation as ``ForecastService._holt_winters``, written as
+    plain loops over preallocated arrays so Numba can compile it.  Only
+    used when Numba is installed; under CPython, indexing NumPy scalars
+    makes this slower than the list-based method.
+    """
+    n = y.shape[0]
+
+    # One season of seasonal indices, used as a ring: slot t % m holds
+    # s_{t-m} until step t overwrites it with s_t
+    seasonals = np.empty(m, dtype=np.float64)
+    for i in range(m):
+        seasonals[i] = y[i] - level
+
+    oma, omb, omg = 1.0 - alpha, 1.0 - beta, 1.0 - gamma
+    sse = 0.0
+    si = 0
+    for t in range(m, n):
+        s_prev = seasonals[si]
+        err = y[t] - (level + trend + s_prev)
+        sse += err * err
+        new_level = alpha * (y[t] - s_prev) + oma * (level + trend)
+        trend = beta * (new_level - level) + omb * trend
+        level = new_level
+        seasonals[si] = gamma * (y[t] - level) + omg * s_prev
+        si += 1
+        if si == m:
+            si = 0
+
+    forecasts = np.empty(m, dtype=np.float64)
+    for h in range(1, m + 1):
+        forecasts[h - 1] = level + h * trend + seasonals[(si + h - 1) % m]
+
+    n_resid = n - m
+    return forecasts, (sse / n_resid if n_resid > 0 else 0.0), n_resid
+
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: results must match the interpreted method exactly
+    _hw_jit = numba.njit(cache=True)(_hw_kernel)
+
+    @numba.njit(cache=True, parallel=True)
+    def _hw_batch(data2d, counts, m, alpha, beta, gamma, level0, trend0,
+                  forecasts_out, mse_out):
+        """
+        Run ``_hw_kernel`` over every row of a NaN-padded ``(S, n)``
+        matrix, one sensor per thread.  Row ``s`` holds ``counts[s]``
+        valid values and starts from ``level0[s]``/``trend0[s]``; results
+        land in ``forecasts_out[s]``/``mse_out[s]``.
+        """
+        for s in numba.prange(data2d.shape[0]):
+            fc, mse, _ = _hw_jit(
+                data2d[s, :counts[s]], m, alpha, beta, gamma, level0[s], trend0[s]
+            )
+            forecasts_out[s, :] = fc
+            mse_out[s] = mse
+
 
 class ForecastService:
     """
@@ -74,18 +268,25 @@ class ForecastService:
         self.alpha = alpha
         self.beta = beta
         self.gamma = gamma
-
-        # Per-sensor short-interval history (5-second readings)
-        self._history: Dict[str, Deque[float]] = {}
-
-        # Per-sensor exponential smoothing state (updated incrementally)
-        self._level: Dict[str, float] = {}
-        self._trend: Dict[str, float] = {}
-
-        # Per-sensor hourly aggregated history for Holt-Winters
-        self._hourly_history: Dict[str, List[Tuple[datetime, float]]] = {}
-        self._hourly_buf: Dict[str, List[float]] = {}  # accumulator for current hour
-        self._last_hour: Dict[str, int] = {}
+        # Complements for the per-observation smoothing update
+        self._one_minus_alpha = 1.0 - alpha
+        self._one_minus_beta = 1.0 - beta
+
+        # Per-sensor history buffers, smoothing state and hourly bins
+        self._sensors: Dict[str, _SensorState] = {}
+
+        # Batch source for the forecast perturbation noise
+        self._rng = np.random.default_rng()
+
+        if _NUMBA_AVAILABLE:
+            # Compile (or load the cached) kernel now, not on the first forecast
+            m = self.SEASON_LENGTH
+            _hw_jit(np.zeros(2 * m), m, alpha, beta, gamma, 0.0, 0.0)
+            _hw_batch(
+                np.zeros((1, 2 * m)), np.full(1, 2 * m, dtype=np.int64), m,
+                alpha, beta, gamma, np.zeros(1), np.zeros(1),
+                np.empty((1, m)), np.empty(1),
+            )
 
     # ==================================================================
     # Data ingestion
@@ -106,17 +307,13 @@ class ForecastService:
         pm25 : float
             PM2.5 concentration in ug/m3.
         """
-        # Short-interval history
-        if sensor_id not in self._history:
-            self._history[sensor_id] = deque(maxlen=_MAX_HISTORY)
-            self._level[sensor_id] = pm25
-            self._trend[sensor_id] = 0.0
-            self._hourly_buf[sensor_id] = []
-            self._hourly_history[sensor_id] = []
+        state = self._sensors.get(sensor_id)
+        if state is None:
+            state = self._sensors[sensor_id] = _SensorState(level=pm25)
 
-        self._history[sensor_id].append(pm25)
-        self._update_smoothing(sensor_id, pm25)
-        self._accumulate_hourly(sensor_id, pm25)
+        state.n_readings += 1
+        self._update_smoothing(state, pm25)
+        self._accumulate_hourly(state, pm25)
 
     def add_reading(self, sensor_id: str, timestamp: datetime, pm25: float) -> None:
         """
@@ -131,76 +328,104 @@ class ForecastService:
         pm25 : float
             PM2.5 concentration in ug/m3.
         """
-        if sensor_id not in self._hourly_history:
-            self._hourly_history[sensor_id] = []
-            self._level[sensor_id] = pm25
-            self._trend[sensor_id] = 0.0
-            self._history[sensor_id] = deque(maxlen=_MAX_HISTORY)
-            self._hourly_buf[sensor_id] = []
+        state = self._sensors.get(sensor_id)
+        if state is None:
+            state = self._sensors[sensor_id] = _SensorState(level=pm25)
 
-        self._hourly_history[sensor_id].append((timestamp, pm25))
-
-        # Keep at most 72 hours of hourly data
-        if len(self._hourly_history[sensor_id]) > 72:
-            self._hourly_history[sensor_id] = self._hourly_history[sensor_id][-72:]
+        # The ring buffers keep at most _MAX_HOURLY hours of hourly data
+        state.hourly.append(pm25)
+        state.hourly_ts.append(int(timestamp.timestamp()))
+        state.hourly_version += 1
 
     # ------------------------------------------------------------------
     # Incremental smoothing (fast path)
     # ------------------------------------------------------------------
 
-    def _update_smoothing(self, sensor_id: str, observation: float) -> None:
+    def _update_smoothing(self, state: _SensorState, observation: float) -> None:
         """Holt's linear exponential smoothing update (O(1) per call)."""
-        prev_level = self._level[sensor_id]
-        prev_trend = self._trend[sensor_id]
+        prev_level = state.level
+        prev_trend = state.trend
 
-        new_level = self.alpha * observation + (1 - self.alpha) * (prev_level + prev_trend)
-        new_trend = self.beta * (new_level - prev_level) + (1 - self.beta) * prev_trend
+        alpha, oma = self.alpha, self._one_minus_alpha
+        beta, omb = self.beta, self._one_minus_beta
 
-        self._level[sensor_id] = new_level
-        self._trend[sensor_id] = new_trend
+        new_level = alpha * observation + oma * (prev_level + prev_trend)
+        new_trend = beta * (new_level - prev_level) + omb * prev_trend
 
-    def _accumulate_hourly(self, sensor_id: str, pm25: float) -> None:
-        """Accumulate 5-second readings into hourly bins."""
-        now = datetime.now(timezone.utc)
-        current_hour = now.hour
+        state.level = new_level
+        state.trend = new_trend
+
+        self._push_residual(state, observation - (prev_level + prev_trend))
 
-        if sensor_id not in self._last_hour:
-            self._last_hour[sensor_id] = current_hour
+    @staticmethod
+    def _push_residual(state: _SensorState, residual: float) -> None:
+        """
+        Add a residual to the rolling window, updating its mean and M2 in
+        O(1) with Welford's algorithm (and its inverse for the sample the
+        full window evicts).
+        """
+        evicted = state.residuals.append(residual)
+        n = len(state.residuals)
+        mean = state.resid_mean
+        m2 = state.resid_m2
+
+        if evicted is not None:
+            # Remove the oldest sample from the full window of n
+            delta = evicted - mean
+            mean -= delta / (n - 1)
+            m2 -= delta * (evicted - mean)
+
+        # Add the new sample, bringing the window to n
+        delta = residual - mean
+        mean += delta / n
+        m2 += delta * (residual - mean)
+
+        state.resid_mean = mean
+        # Rounding can push a near-zero M2 slightly negative
+        state.resid_m2 = max(m2, 0.0)
+
+    def _accumulate_hourly(self, state: _SensorState, pm25: float) -> None:
+        """
+        Accumulate 5-second readings into hourly bins.
 
-        if current_hour != self._last_hour[sensor_id]:
-            # Hour rolled over: commit the accumulated buffer
-            buf = self._hourly_buf[sensor_id]
-            if buf:
-                hourly_avg = sum(buf) / len(buf)
-                ts = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
-                self._hourly_history.setdefault(sensor_id, []).append((ts, hourly_avg))
+        Hours are tracked as integer Unix hours, so the common case (same
+        hour) is one clock read and an integer compare, with no datetime.
+        """
+        current_hour = int(_time()) // 3600
+
+        if state.last_hour is None:
+            state.last_hour = current_hour
 
-                # Prune to 72 hours
-                if len(self._hourly_history[sensor_id]) > 72:
-                    self._hourly_history[sensor_id] = self._hourly_history[sensor_id][-72:]
+        if current_hour != state.last_hour:
+            # Hour rolled over: commit the accumulated mean, stamped with
+            # the start of the hour it covers
+            if state.hour_n:
+                state.hourly.append(state.hour_sum / state.hour_n)
+                state.hourly_ts.append(state.last_hour * 3600)
+                state.hourly_version += 1
 
-            self._hourly_buf[sensor_id] = []
-            self._last_hour[sensor_id] = current_hour
+            state.hour_sum = 0.0
+            state.hour_n = 0
+            state.last_hour = current_hour
 
-        self._hourly_buf[sensor_id].append(pm25)
+        state.hour_sum += pm25
+        state.hour_n += 1
 
     # ==================================================================
     # Residual standard deviation
     # ==================================================================
 
     def _compute_residual_std(self, sensor_id: str) -> float:
-        """Compute standard deviation of recent 5-second forecast residuals."""
-        history = self._history.get(sensor_id)
-        if history is None or len(history) < 10:
-            return 3.0
+        """
+        Standard deviation of recent 5-second one-step-ahead residuals.
 
-        recent = list(history)[-60:]  # last ~5 minutes
-        if len(recent) < 5:
+        O(1): reads the rolling Welford state kept by ``_push_residual``.
+        """
+        state = self._sensors.get(sensor_id)
+        if state is None or len(state.residuals) < 10:
             return 3.0
 
-        mean = sum(recent) / len(recent)
-        variance = sum((x - mean) ** 2 for x in recent) / len(recent)
-        return max(1.0, math.sqrt(variance))
+        return max(1.0, math.sqrt(state.resid_m2 / len(state.residuals)))
 
     # ==================================================================
     # Time-of-day adjustment
@@ -219,18 +444,30 @@ class ForecastService:
         overnight_dip = -0.10 if (target_hour < 6 or target_hour > 22) else 0.0
         return 1.0 + morning_rush + evening_rush + overnight_dip
 
+    @staticmethod
+    def _hour_of_day_adjustment_vec(hours: np.ndarray) -> np.ndarray:
+        """
+        Array form of ``_hour_of_day_adjustment`` for a whole horizon.
+        """
+        morning = hours - 8.5
+        evening = hours - 17.5
+        adj = np.exp(morning * morning * _MORNING_RUSH_COEF) * 0.15
+        adj += np.exp(evening * evening * _EVENING_RUSH_COEF) * 0.20
+        adj += np.where((hours < 6) | (hours > 22), 0.9, 1.0)
+        return adj
+
     # ==================================================================
     # Full Holt-Winters Triple Exponential Smoothing
     # ==================================================================
 
     def _holt_winters(
         self,
-        data: List[float],
+        data: Sequence[float],
         season_length: int,
         alpha: float,
         beta: float,
         gamma: float,
-    ) -> Tuple[List[float], List[float]]:
+    ) -> Tuple[Sequence[float], float, int]:
         """
         Holt-Winters additive seasonal method.
 
@@ -250,7 +487,7 @@ class ForecastService:
 
         Parameters
         ----------
-        data : list of float
+        data : list of float or np.ndarray
             Historical PM2.5 values (equally spaced, hourly).
         season_length : int
             Number of observations per season (24).
@@ -259,67 +496,72 @@ class ForecastService:
 
         Returns
         -------
-        forecasts : list of float
+        forecasts : list of float or np.ndarray
             Predicted values for the next ``season_length`` steps.
-        residuals : list of float
-            One-step-ahead prediction errors.
+        mse : float
+            Mean squared one-step-ahead prediction error, accumulated
+            during the smoothing pass (0.0 if there were no residuals).
+        n_resid : int
+            Number of one-step-ahead errors behind ``mse``.
         """
         n = len(data)
         m = season_length
 
-        # --- Initialization ---
-        first_season = data[:m]
-        level = sum(first_season) / m
-
-        if n >= 2 * m:
-            second_season = data[m: 2 * m]
-            trend = sum(
-                (second_season[i] - first_season[i]) / m for i in range(m)
-            ) / m
-        else:
-            trend = 0.0
+        if _NUMBA_AVAILABLE and n >= m:
+            y = np.asarray(data, dtype=np.float64)
+            return _hw_jit(y, m, alpha, beta, gamma, *_hw_init(y, m))
 
-        # Initial seasonal indices: deviation from first-season mean
-        seasonal = [data[i] - level for i in range(m)]
+        if isinstance(data, np.ndarray):
+            data = data.tolist()
+
+        # --- Initialization ---
+        level, trend = _hw_init(data, m)
 
         # --- Smoothing pass over all data after first season ---
-        residuals: List[float] = []
-        levels = [level]
-        trends = [trend]
-        seasonals = list(seasonal)  # grows as we append new seasonal estimates
+        # The recurrence is sequential and n is at most a few seasons, so
+        # it stays on Python floats (NumPy scalar indexing is slower at
+        # this size).  Buffers are preallocated, and only the latest level
+        # and trend are kept rather than their full history.  Residuals
+        # are only needed as their mean square, so they are reduced as
+        # they are produced instead of being stored.
+        n_resid = max(n - m, 0)
+        sse = 0.0
+        # Initial seasonal indices: deviation from first-season mean.
+        # Only the last season is ever read, so the list is a fixed
+        # ring of m slots: slot t % m holds s_{t-m} until step t
+        # overwrites it with s_t.
+        seasonals = [v - level for v in data[:m]]
+        si = 0
+
+        # Smoothing complements, hoisted out of the loop
+        oma, omb, omg = 1.0 - alpha, 1.0 - beta, 1.0 - gamma
 
         for t in range(m, n):
             y = data[t]
-            s_prev = seasonals[t - m]  # seasonal from one cycle ago
+            s_prev = seasonals[si]  # seasonal from one cycle ago
 
-            # One-step-ahead prediction
-            y_hat = levels[-1] + trends[-1] + s_prev
-            residuals.append(y - y_hat)
+            # One-step-ahead prediction error
+            err = y - (level + trend + s_prev)
+            sse += err * err
 
             # Update level
-            new_level = alpha * (y - s_prev) + (1 - alpha) * (levels[-1] + trends[-1])
+            new_level = alpha * (y - s_prev) + oma * (level + trend)
             # Update trend
-            new_trend = beta * (new_level - levels[-1]) + (1 - beta) * trends[-1]
+            trend = beta * (new_level - level) + omb * trend
+            level = new_level
             # Update seasonal
-            new_seasonal = gamma * (y - new_level) + (1 - gamma) * s_prev
-
-            levels.append(new_level)
-            trends.append(new_trend)
-            seasonals.append(new_seasonal)
+            seasonals[si] = gamma * (y - level) + omg * s_prev
+            si += 1
+            if si == m:
+                si = 0
 
         # --- Generate forecasts ---
-        final_level = levels[-1]
-        final_trend = trends[-1]
-
-        forecasts: List[float] = []
-        for h in range(1, m + 1):
-            # Get the appropriate seasonal index
-            # We need s_{t+h-m} from the most recent cycle
-            s_idx = len(seasonals) - m + ((h - 1) % m)
-            s_val = seasonals[s_idx] if 0 <= s_idx < len(seasonals) else 0.0
-            forecasts.append(final_level + h * final_trend + s_val)
+        # s_{t+h-m} comes from the most recent cycle, oldest slot first
+        forecasts = [
+            level + h * trend + seasonals[(si + h - 1) % m] for h in range(1, m + 1)
+        ]
 
-        return forecasts, residuals
+        return forecasts, (sse / n_resid if n_resid else 0.0), n_resid
 
     # ==================================================================
     # Public forecast generation
@@ -353,108 +595,272 @@ class ForecastService:
             Each point has timestamp, predicted_pm25, confidence_lower,
             confidence_upper.
         """
-        now = datetime.now(timezone.utc)
-        current_hour = now.hour + now.minute / 60.0
+        state = self._sensors.get(sensor_id)
+        return self._forecast_points(
+            sensor_id, state, *self._try_fit_seasonal(sensor_id, state),
+            hours_ahead, interval_minutes,
+        )
 
-        # Check if we have enough hourly data for full Holt-Winters
-        hourly_data = self._hourly_history.get(sensor_id, [])
-        hw_values = [v for _, v in hourly_data]
+    def generate_forecast_arrays(
+        self,
+        sensor_id: str,
+        hours_ahead: int = 6,
+        interval_minutes: int = 30,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columnar form of ``generate_forecast``.
 
-        hw_forecasts = None
-        hw_se = None
+        Skips building a ForecastPoint and formatting an ISO timestamp per
+        point, for callers that only need the numbers.
 
-        if len(hw_values) >= 2 * self.SEASON_LENGTH:
-            # Full Holt-Winters with seasonal decomposition
-            try:
-                fc, residuals = self._holt_winters(
-                    hw_values, self.SEASON_LENGTH,
-                    self.alpha, self.beta, self.gamma,
-                )
-                hw_forecasts = fc
-                if residuals:
-                    mse = sum(r ** 2 for r in residuals) / len(residuals)
-                    hw_se = math.sqrt(mse)
-                else:
-                    hw_se = 3.0
-            except Exception as exc:
-                logger.warning("Holt-Winters failed for %s: %s", sensor_id, exc)
+        Returns
+        -------
+        dict
+            ``timestamps`` (int64 epoch milliseconds), ``predicted``,
+            ``lower`` and ``upper`` (float32 PM2.5 in ug/m3), all of the
+            same length.
+        """
+        state = self._sensors.get(sensor_id)
+        now, minutes_ahead, predicted, lower, upper = self._forecast_series(
+            sensor_id, state, *self._try_fit_seasonal(sensor_id, state),
+            hours_ahead, interval_minutes,
+        )
+        now_ms = int(now.timestamp() * 1000)
+        return {
+            "timestamps": now_ms + minutes_ahead.astype(np.int64) * 60_000,
+            "predicted": predicted.astype(np.float32),
+            "lower": lower.astype(np.float32),
+            "upper": upper.astype(np.float32),
+        }
 
-        # Fallback: use incremental Holt linear smoothing state
-        level = self._level.get(sensor_id, 15.0)
-        trend = self._trend.get(sensor_id, 0.0)
-        residual_std = self._compute_residual_std(sensor_id)
+    def generate_forecasts_bulk(
+        self,
+        sensor_ids: Sequence[str],
+        hours_ahead: int = 6,
+        interval_minutes: int = 30,
+    ) -> Dict[str, List[ForecastPoint]]:
+        """
+        Generate forecasts for several sensors at once.
 
-        steps_per_minute = 12  # 5-second intervals per minute
+        Equivalent to calling ``generate_forecast`` per sensor, except
+        that the Holt-Winters fits of all sensors with enough hourly
+        history are run together.  With Numba installed they are stacked
+        into one NaN-padded matrix and fitted in parallel, one sensor per
+        thread; the recurrences share no state, so this scales with cores.
 
-        points: List[ForecastPoint] = []
-        total_intervals = (hours_ahead * 60) // interval_minutes
+        Returns
+        -------
+        dict
+            Mapping of sensor ID to its list of ForecastPoint.
+        """
+        m = self.SEASON_LENGTH
+        seasonal = [
+            (sid, state) for sid in sensor_ids
+            if (state := self._sensors.get(sid)) is not None
+            and len(state.hourly) >= 2 * m
+        ]
+
+        fits: Dict[str, Tuple[Sequence[float], float]] = {}
+        # Sensors whose hourly history is unchanged reuse their last fit
+        stale = []
+        for sid, st in seasonal:
+            if st.hw_fit is not None and st.hw_fit[0] == st.hourly_version:
+                fits[sid] = st.hw_fit[1:]
+            else:
+                stale.append((sid, st))
+        seasonal = stale
 
-        for i in range(1, total_intervals + 1):
-            minutes_ahead = i * interval_minutes
-            hours_offset = minutes_ahead / 60.0
-
-            if hw_forecasts is not None and hw_se is not None:
-                # Use Holt-Winters forecast (interpolate between hourly steps)
-                hw_idx = hours_offset - 1  # 0-indexed
-                lower_idx = max(0, int(math.floor(hw_idx)))
-                upper_idx = min(len(hw_forecasts) - 1, lower_idx + 1)
-                frac = hw_idx - lower_idx
-
-                if lower_idx < len(hw_forecasts):
-                    predicted = (
-                        hw_forecasts[lower_idx] * (1 - frac)
-                        + hw_forecasts[upper_idx] * frac
+        if seasonal:
+            try:
+                if _NUMBA_AVAILABLE:
+                    counts = np.array([len(st.hourly) for _, st in seasonal], dtype=np.int64)
+                    data = np.full((len(seasonal), _MAX_HOURLY), np.nan)
+                    level0 = np.empty(len(seasonal))
+                    trend0 = np.empty(len(seasonal))
+                    for i, (row, (_, st)) in enumerate(zip(data, seasonal)):
+                        n = len(st.hourly)
+                        row[:n] = st.hourly.latest()
+                        level0[i], trend0[i] = _hw_init(row[:n], m)
+                    forecasts = np.empty((len(seasonal), m))
+                    mse = np.empty(len(seasonal))
+                    _hw_batch(
+                        data, counts, m, self.alpha, self.beta, self.gamma,
+                        level0, trend0, forecasts, mse,
                     )
+                    se = np.sqrt(mse).tolist()
+                    for i, (sid, st) in enumerate(seasonal):
+                        fits[sid] = (forecasts[i], se[i])
+                        st.hw_fit = (st.hourly_version, forecasts[i], se[i])
                 else:
-                    predicted = hw_forecasts[-1]
+                    for sid, st in seasonal:
+                        fits[sid] = self._fit_seasonal(st)
+            except Exception as exc:
+                logger.warning("Batched Holt-Winters failed: %s", exc)
+                for sid, _ in seasonal:
+                    fits.pop(sid, None)
 
-                se = hw_se
-            else:
-                # Holt linear with time-of-day adjustment
-                steps_ahead = minutes_ahead * steps_per_minute
-                base_forecast = level + trend * steps_ahead
+        return {
+            sid: self._forecast_points(
+                sid, self._sensors.get(sid), *fits.get(sid, (None, None)),
+                hours_ahead, interval_minutes,
+            )
+            for sid in sensor_ids
+        }
 
-                target_hour = (current_hour + hours_offset) % 24.0
-                tod_adj = self._hour_of_day_adjustment(target_hour)
-                predicted = base_forecast * tod_adj
+    def _try_fit_seasonal(
+        self, sensor_id: str, state: Optional[_SensorState]
+    ) -> Tuple[Optional[Sequence[float]], Optional[float]]:
+        """
+        Holt-Winters fit when there are >= 2 seasons of hourly data,
+        otherwise (or if the fit fails) ``(None, None)``.
+        """
+        if state is not None and len(state.hourly) >= 2 * self.SEASON_LENGTH:
+            # Full Holt-Winters with seasonal decomposition
+            try:
+                return self._fit_seasonal(state)
+            except Exception as exc:
+                logger.warning("Holt-Winters failed for %s: %s", sensor_id, exc)
+        return None, None
 
-                se = residual_std
+    def _fit_seasonal(self, state: _SensorState) -> Tuple[Sequence[float], float]:
+        """
+        Fit Holt-Winters to a sensor's hourly history: (forecasts, std error).
 
-            # Add small stochastic perturbation for visual realism
-            predicted += random.gauss(0, se * 0.05)
-            predicted = max(1.0, round(predicted, 1))
+        The hourly history only changes once an hour, while forecasts are
+        requested every cycle, so the fit is cached until the next bin.
+        """
+        cached = state.hw_fit
+        if cached is not None and cached[0] == state.hourly_version:
+            return cached[1], cached[2]
+
+        # Oldest-first, zero-copy view of the hourly ring
+        fc, mse, n_resid = self._holt_winters(
+            state.hourly.latest(), self.SEASON_LENGTH,
+            self.alpha, self.beta, self.gamma,
+        )
+        se = math.sqrt(mse) if n_resid else 3.0
+        state.hw_fit = (state.hourly_version, fc, se)
+        return fc, se
+
+    def _forecast_points(
+        self,
+        sensor_id: str,
+        state: Optional[_SensorState],
+        hw_forecasts: Optional[Sequence[float]],
+        hw_se: Optional[float],
+        hours_ahead: int,
+        interval_minutes: int,
+    ) -> List[ForecastPoint]:
+        """
+        Turn a Holt-Winters fit, or the incremental Holt state when there
+        is none, into timestamped points with confidence intervals.
+        """
+        now, _, predicted, lower, upper = self._forecast_series(
+            sensor_id, state, hw_forecasts, hw_se, hours_ahead, interval_minutes
+        )
+
+        # Hot loop: globals and attributes bound to locals.  The plain
+        # constructor is used because, for a four-field model, pydantic's
+        # Rust validator beats model_construct's Python-level field walk.
+        point = ForecastPoint
+        step = timedelta(minutes=interval_minutes)
+        timestamp = now
+        points: List[ForecastPoint] = []
+        append = points.append
+        for p, lo, hi in zip(predicted.tolist(), lower.tolist(), upper.tolist()):
+            timestamp += step
+            append(point(
+                timestamp=timestamp.isoformat(),
+                predicted_pm25=p,
+                confidence_lower=lo,
+                confidence_upper=hi,
+            ))
 
-            # 95% confidence interval, widening with sqrt(horizon)
-            horizon_factor = math.sqrt(max(1.0, minutes_ahead / 30.0))
-            margin = se * 1.96 * horizon_factor
+        return points
 
-            confidence_lower = max(0.0, round(predicted - margin, 1))
-            confidence_upper = round(predicted + margin, 1)
+    def _forecast_series(
+        self,
+        sensor_id: str,
+        state: Optional[_SensorState],
+        hw_forecasts: Optional[Sequence[float]],
+        hw_se: Optional[float],
+        hours_ahead: int,
+        interval_minutes: int,
+    ) -> Tuple[datetime, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Forecast as arrays: (now, minutes ahead, predicted, lower, upper).
+        """
+        now = datetime.now(timezone.utc)
+        current_hour = now.hour + now.minute / 60.0
 
-            timestamp = (now + timedelta(minutes=minutes_ahead)).isoformat()
+        # Fallback: use incremental Holt linear smoothing state
+        level = state.level if state is not None else 15.0
+        trend = state.trend if state is not None else 0.0
+        residual_std = self._compute_residual_std(sensor_id)
 
-            points.append(
-                ForecastPoint(
-                    timestamp=timestamp,
-                    predicted_pm25=predicted,
-                    confidence_lower=confidence_lower,
-                    confidence_upper=confidence_upper,
-                )
+        steps_per_minute = 12  # 5-second intervals per minute
+
+        total_intervals = (hours_ahead * 60) // interval_minutes
+        minutes_ahead = np.arange(1, total_intervals + 1) * interval_minutes
+        hours_offset = minutes_ahead / 60.0
+
+        if hw_forecasts is not None and hw_se is not None:
+            # Use Holt-Winters forecast (interpolate between hourly steps).
+            # Same indexing as the scalar form: the first hour extrapolates
+            # back from steps 0-1, anything past the end holds the last step.
+            fc = np.asarray(hw_forecasts, dtype=np.float64)
+            n_fc = len(fc)
+            hw_idx = hours_offset - 1  # 0-indexed
+            lower_idx = np.maximum(0, np.floor(hw_idx)).astype(np.intp)
+            frac = hw_idx - lower_idx
+            in_range = lower_idx < n_fc
+            lower_idx = np.minimum(lower_idx, n_fc - 1)
+            upper_idx = np.minimum(n_fc - 1, lower_idx + 1)
+            predicted = np.where(
+                in_range,
+                fc[lower_idx] * (1 - frac) + fc[upper_idx] * frac,
+                fc[-1],
             )
+            se = hw_se
+        else:
+            # Holt linear with time-of-day adjustment
+            base_forecast = level + trend * (minutes_ahead * steps_per_minute)
+            target_hours = (current_hour + hours_offset) % 24.0
+            predicted = base_forecast * self._hour_of_day_adjustment_vec(target_hours)
+            se = residual_std
 
-        return points
+        # Add small stochastic perturbation for visual realism
+        predicted = predicted + self._rng.normal(0.0, se * 0.05, total_intervals)
+        predicted = np.maximum(1.0, np.round(predicted, 1))
+
+        # 95% confidence interval, widening with sqrt(horizon)
+        horizon_factor = np.sqrt(np.maximum(1.0, minutes_ahead / 30.0))
+        margin = se * 1.96 * horizon_factor
+
+        lower = np.maximum(0.0, np.round(predicted - margin, 1))
+        upper = np.round(predicted + margin, 1)
+
+        return now, minutes_ahead, predicted, lower, upper
 
     # ==================================================================
     # Diagnostics
     # ==================================================================
 
     def get_history_length(self, sensor_id: str) -> int:
-        """Return the number of stored short-interval readings."""
-        return len(self._history.get(sensor_id, []))
+        """
+        Return how many short-interval readings the sensor has received,
+        capped at ``_MAX_HISTORY`` (about an hour of 5-second readings).
+
+        This is a count, not a buffer size: the readings themselves are
+        folded into the smoothing state and hourly bins, not stored.
+        """
+        state = self._sensors.get(sensor_id)
+        return min(state.n_readings, _MAX_HISTORY) if state is not None else 0
 
     def get_hourly_history_length(self, sensor_id: str) -> int:
         """Return the number of stored hourly readings."""
-        return len(self._hourly_history.get(sensor_id, []))
+        state = self._sensors.get(sensor_id)
+        return len(state.hourly) if state is not None else 0
 
     def get_status(self) -> dict:
         """Return service status information."""
@@ -465,11 +871,13 @@ class ForecastService:
             "beta": self.beta,
             "gamma": self.gamma,
             "season_length": self.SEASON_LENGTH,
-            "sensors_tracked": list(self._history.keys()),
+            "sensors_tracked": list(self._sensors.keys()),
+            # Capped reading counts (see get_history_length)
             "history_lengths": {
-                sid: len(buf) for sid, buf in self._history.items()
+                sid: min(state.n_readings, _MAX_HISTORY)
+                for sid, state in self._sensors.items()
             },
             "hourly_history_lengths": {
-                sid: len(buf) for sid, buf in self._hourly_history.items()
+                sid: len(state.hourly) for sid, state in self._sensors.items()
             },
         }
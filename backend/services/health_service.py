@@ -29,14 +29,26 @@ References:
     - EPA (2024) Revised AQI Breakpoints for PM2.5
 """
 
+import sys
 import math
 import logging
-from typing import Dict, List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 from models import PollutionData, NoiseData, HealthData
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT for the health-score kernel
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 # ---------------------------------------------------------------------------
 # WHO / EPA guideline thresholds (ug/m3)
 # ---------------------------------------------------------------------------
@@ -44,6 +56,13 @@ _WHO_PM25_GUIDELINE = 5.0     # ug/m3 (2021 annual mean guideline)
 _WHO_PM10_GUIDELINE = 15.0    # ug/m3 (2021 annual mean guideline)
 _WHO_NO2_GUIDELINE = 10.0     # ug/m3 (2021 annual mean guideline)
 
+# Health-score penalty per ug/m3 above each guideline: the penalty
+# coefficient folded with the guideline reciprocal, so the score needs
+# one subtract and one multiply per pollutant instead of a division
+_PM25_PENALTY_COEF = 10.0 / _WHO_PM25_GUIDELINE
+_PM10_PENALTY_COEF = 5.0 / _WHO_PM10_GUIDELINE
+_NO2_PENALTY_COEF = 4.0 / _WHO_NO2_GUIDELINE
+
 # ---------------------------------------------------------------------------
 # Cigarette equivalence (Berkeley Earth)
 # ---------------------------------------------------------------------------
@@ -61,6 +80,106 @@ _VULNERABILITY_MULTIPLIERS: Dict[str, float] = {
     "pregnant":  1.3,   # fetal development sensitivity
 }
 
+# ---------------------------------------------------------------------------
+# Risk levels, least to most severe
+# ---------------------------------------------------------------------------
+# Interned: "Very High" has a space, so it is not interned automatically,
+# and levels are compared and used as dict keys on every aggregation
+RISK_LEVELS = tuple(
+    sys.intern(level) for level in ("Low", "Moderate", "High", "Very High", "Severe")
+)
+# Level name -> index into RISK_LEVELS, for O(1) ranking
+RISK_RANK: Dict[str, int] = {level: i for i, level in enumerate(RISK_LEVELS)}
+
+# Risk level for every possible health score 0..100 (see _determine_risk_level):
+# one level per 20-point band, 80+ -> Low down to <20 -> Severe.  Entries are
+# the interned RISK_LEVELS objects themselves.
+_RISK_LEVEL_LUT = tuple(RISK_LEVELS[4 - min(4, s // 20)] for s in range(101))
+
+# ---------------------------------------------------------------------------
+# Advisory text (EPA AQI health messaging), one base message per score band
+# from 80+ down to <20, plus notes for loud (> 70 dB) and smoky (PM2.5 > 55)
+# conditions.  Indexed by band * 4 + loud * 2 + smoky.
+# ---------------------------------------------------------------------------
+_ADVISORY_BANDS = (
+    "Safe for all groups",
+    "Sensitive individuals (children, elderly, respiratory "
+    "conditions) should limit prolonged outdoor exertion",
+    "Everyone should reduce prolonged outdoor exertion. "
+    "Sensitive groups should avoid outdoor activity",
+    "Health alert: everyone may experience health effects. "
+    "Sensitive groups at serious risk. Stay indoors if possible",
+    "Emergency conditions: all outdoor activity should be "
+    "avoided. Keep windows closed. Use air purifiers indoors",
+)
+_HEARING_NOTE = ". Hearing protection recommended for extended exposure"
+_MASK_NOTE = ". Consider wearing N95 masks outdoors"
+
+# Variants without a note reuse the band literal itself; the rest are joined
+# from their fragments once, at import time.
+_ADVISORY_TABLE = tuple(
+    "".join((text, *notes)) if notes else text
+    for band, text in enumerate(_ADVISORY_BANDS)
+    for loud in (False, True)
+    for smoky in (False, True)
+    for notes in [
+        ((_HEARING_NOTE,) if loud and band == 1 else ())
+        + ((_MASK_NOTE,) if smoky and band == 2 else ())
+    ]
+)
+_RISK_LEVEL_ARR = np.array(_RISK_LEVEL_LUT, dtype=object)
+
+# Pope et al. (2002) all-cause mortality coefficient, per ug/m3
+_RR_BETA = 0.006
+
+# Cumulative dose storage grows in blocks of this many sensors
+_DOSE_CHUNK = 1024
+
+# Record count from which the summary histogram switches from per-record
+# dict increments to np.bincount (measured crossover is ~50)
+_BINCOUNT_MIN_SENSORS = 64
+_get_risk_level = attrgetter("risk_level")
+_get_score = attrgetter("score")
+_get_cigarettes = attrgetter("equivalent_cigarettes")
+
+
+def _score_kernel(pm25: float, pm10: float, no2: float, noise_db: float) -> float:
+    """
+    Unrounded composite health score for one sensor (see
+    ``HealthService._compute_health_score``).
+
+    Pure float arithmetic so Numba can compile it; with Numba absent the
+    same function runs interpreted.
+    """
+    score = 100.0
+
+    # PM2.5: heaviest weight (most harmful pollutant)
+    # Log-linear: penalty grows with log(1 + excess/guideline)
+    if pm25 > _WHO_PM25_GUIDELINE:
+        # Exponential decay-style penalty
+        score -= min(40.0, (pm25 - _WHO_PM25_GUIDELINE) * _PM25_PENALTY_COEF)
+
+    # PM10
+    if pm10 > _WHO_PM10_GUIDELINE:
+        score -= min(15.0, (pm10 - _WHO_PM10_GUIDELINE) * _PM10_PENALTY_COEF)
+
+    # NO2
+    if no2 > _WHO_NO2_GUIDELINE:
+        score -= min(15.0, (no2 - _WHO_NO2_GUIDELINE) * _NO2_PENALTY_COEF)
+
+    # Noise (WHO recommends < 55 dB for outdoor residential areas)
+    if noise_db > 55.0:
+        score -= min(15.0, (noise_db - 55.0) * 0.5)
+
+    return score
+
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: the score must round exactly like the batch path
+    _score = numba.njit(cache=True, boundscheck=False)(_score_kernel)
+else:
+    _score = _score_kernel
+
 
 class HealthService:
     """
@@ -69,16 +188,24 @@ class HealthService:
     Berkeley Earth cigarette-equivalence methodology.
     """
 
+    __slots__ = ("_dose_arr", "_sensor_index")
+
     def __init__(self) -> None:
-        # Cumulative dose tracking: sensor_id -> dose (ug/m3 * hours)
-        self._cumulative_dose: Dict[str, float] = {}
+        # Cumulative dose tracking (ug/m3 * hours), one slot per sensor:
+        # sensor_id -> index into the dose array
+        self._dose_arr = np.zeros(0, dtype=np.float64)
+        self._sensor_index: Dict[str, int] = {}
+
+        if _NUMBA_AVAILABLE:
+            # Compile (or load the cached) kernel now, not on the first request
+            _score(0.0, 0.0, 0.0, 0.0)
 
     # ==================================================================
     # Primary health score computation
     # ==================================================================
 
+    @staticmethod
     def _compute_health_score(
-        self,
         pm25: float,
         pm10: float,
         no2: float,
@@ -93,33 +220,50 @@ class HealthService:
         - NO2 penalty (15% weight): excess over WHO guideline
         - Noise penalty (15% weight): threshold-based from WHO 2018
         - CO (implicit via PM2.5 correlation, 15% reserve)
-        """
-        score = 100.0
 
-        # PM2.5: heaviest weight (most harmful pollutant)
-        # Log-linear: penalty grows with log(1 + excess/guideline)
-        if pm25 > _WHO_PM25_GUIDELINE:
-            excess_ratio = (pm25 - _WHO_PM25_GUIDELINE) / _WHO_PM25_GUIDELINE
-            # Exponential decay-style penalty
-            pm25_penalty = min(40.0, excess_ratio * 10.0)
-            score -= pm25_penalty
+        The arithmetic lives in ``_score``; only the rounding and clamp
+        happen here.
+        """
+        return max(0, min(100, round(_score(pm25, pm10, no2, noise_db))))
 
-        # PM10
-        if pm10 > _WHO_PM10_GUIDELINE:
-            excess_ratio = (pm10 - _WHO_PM10_GUIDELINE) / _WHO_PM10_GUIDELINE
-            score -= min(15.0, excess_ratio * 5.0)
+    @staticmethod
+    def _compute_health_scores_batch(
+        pm25: np.ndarray,
+        pm10: np.ndarray,
+        no2: np.ndarray,
+        noise_db: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized ``_compute_health_score`` over parallel sensor arrays.
 
-        # NO2
-        if no2 > _WHO_NO2_GUIDELINE:
-            excess_ratio = (no2 - _WHO_NO2_GUIDELINE) / _WHO_NO2_GUIDELINE
-            score -= min(15.0, excess_ratio * 4.0)
+        Each penalty is zero below its guideline, so the scalar branches
+        become a clamp at 0 followed by the usual cap.
 
-        # Noise (WHO recommends < 55 dB for outdoor residential areas)
-        if noise_db > 55.0:
-            noise_excess = noise_db - 55.0
-            score -= min(15.0, noise_excess * 0.5)
+        Returns
+        -------
+        np.ndarray
+            int32 health score per sensor.
+        """
+        pm25 = np.asarray(pm25, dtype=np.float64)
+        pm10 = np.asarray(pm10, dtype=np.float64)
+        no2 = np.asarray(no2, dtype=np.float64)
+        noise_db = np.asarray(noise_db, dtype=np.float64)
+
+        # Penalties are subtracted in the scalar order so the float
+        # result, and therefore its rounding, is identical
+        score = 100.0 - np.minimum(
+            40.0, np.maximum(0.0, pm25 - _WHO_PM25_GUIDELINE) * _PM25_PENALTY_COEF
+        )
+        score -= np.minimum(
+            15.0, np.maximum(0.0, pm10 - _WHO_PM10_GUIDELINE) * _PM10_PENALTY_COEF
+        )
+        score -= np.minimum(
+            15.0, np.maximum(0.0, no2 - _WHO_NO2_GUIDELINE) * _NO2_PENALTY_COEF
+        )
+        score -= np.minimum(15.0, np.maximum(0.0, noise_db - 55.0) * 0.5)
 
-        return max(0, min(100, round(score)))
+        # np.round, like round(), rounds halves to even
+        return np.clip(np.round(score), 0, 100).astype(np.int32)
 
     # ==================================================================
     # Risk level classification
@@ -136,23 +280,22 @@ class HealthService:
             >= 40  -> High       (AQI USG)
             >= 20  -> Very High  (AQI Unhealthy)
             <  20  -> Severe     (AQI Very Unhealthy / Hazardous)
+
+        Scores are integers clamped to [0, 100], so this is a table lookup.
         """
-        if score >= 80:
-            return "Low"
-        elif score >= 60:
-            return "Moderate"
-        elif score >= 40:
-            return "High"
-        elif score >= 20:
-            return "Very High"
-        else:
-            return "Severe"
+        return _RISK_LEVEL_LUT[score]
+
+    @staticmethod
+    def _risk_levels_batch(scores: np.ndarray) -> np.ndarray:
+        """Vectorized ``_determine_risk_level`` over integer scores."""
+        return _RISK_LEVEL_ARR[scores]
 
     # ==================================================================
     # Cigarette equivalence
     # ==================================================================
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _compute_cigarette_equivalent(pm25: float, hours: float = 24.0) -> float:
         """
         Compute equivalent daily cigarette consumption.
@@ -160,6 +303,9 @@ class HealthService:
         Berkeley Earth: 22 ug/m3 PM2.5 inhaled over 24 hours = 1 cigarette.
         For partial-day exposure, scale linearly.
 
+        Memoized: PollutionData rounds PM2.5 to 0.1 ug/m3, so a fleet only
+        ever produces a few hundred distinct inputs.
+
         Parameters
         ----------
         pm25 : float
@@ -174,7 +320,9 @@ class HealthService:
         """
         if pm25 <= 0 or hours <= 0:
             return 0.0
-        return round((pm25 / _PM25_PER_CIGARETTE) * (hours / 24.0), 2)
+        # Display rounding to 2 d.p., half up: int() truncation on a
+        # non-negative value is about twice as fast as round(x, 2)
+        return int((pm25 / _PM25_PER_CIGARETTE) * (hours / 24.0) * 100.0 + 0.5) / 100.0
 
     # ==================================================================
     # Vulnerable population advisory
@@ -187,35 +335,12 @@ class HealthService:
 
         Based on EPA AQI health messaging guidelines and WHO recommendations
         for sensitive groups.
+
+        The text depends only on the score band and two exposure flags,
+        so every variant is prebuilt in ``_ADVISORY_TABLE``.
         """
-        if score >= 80:
-            return "Safe for all groups"
-        elif score >= 60:
-            advisory = (
-                "Sensitive individuals (children, elderly, respiratory "
-                "conditions) should limit prolonged outdoor exertion"
-            )
-            if noise_db > 70:
-                advisory += ". Hearing protection recommended for extended exposure"
-            return advisory
-        elif score >= 40:
-            advisory = (
-                "Everyone should reduce prolonged outdoor exertion. "
-                "Sensitive groups should avoid outdoor activity"
-            )
-            if pm25 > 55:
-                advisory += ". Consider wearing N95 masks outdoors"
-            return advisory
-        elif score >= 20:
-            return (
-                "Health alert: everyone may experience health effects. "
-                "Sensitive groups at serious risk. Stay indoors if possible"
-            )
-        else:
-            return (
-                "Emergency conditions: all outdoor activity should be "
-                "avoided. Keep windows closed. Use air purifiers indoors"
-            )
+        band = 4 - min(4, score // 20)
+        return _ADVISORY_TABLE[band * 4 + (noise_db > 70) * 2 + (pm25 > 55)]
 
     # ==================================================================
     # Public API: calculate health impact
@@ -243,23 +368,62 @@ class HealthService:
             Pydantic model with score, risk_level, equivalent_cigarettes,
             vulnerable_advisory.
         """
-        score = self._compute_health_score(
-            pm25=pollution.pm25,
-            pm10=pollution.pm10,
-            no2=pollution.no2,
-            noise_db=noise.db_level,
-        )
-        risk_level = self._determine_risk_level(score)
-        cigarettes = self._compute_cigarette_equivalent(pollution.pm25)
-        advisory = self._generate_advisory(score, pollution.pm25, noise.db_level)
+        pm25 = pollution.pm25
+        noise_db = noise.db_level
+        score = self._compute_health_score(pm25, pollution.pm10, pollution.no2, noise_db)
 
+        # The plain constructor validates in pydantic-core, which for this
+        # four-field model is faster than model_construct's Python loop
         return HealthData(
             score=score,
-            risk_level=risk_level,
-            equivalent_cigarettes=cigarettes,
-            vulnerable_advisory=advisory,
+            risk_level=_RISK_LEVEL_LUT[score],
+            equivalent_cigarettes=self._compute_cigarette_equivalent(pm25),
+            vulnerable_advisory=self._generate_advisory(score, pm25, noise_db),
         )
 
+    def calculate_health_impact_batch(
+        self,
+        pollutions: List[PollutionData],
+        noises: List[NoiseData],
+    ) -> List[HealthData]:
+        """
+        ``calculate_health_impact`` for many sensors at once.
+
+        Scores are computed in one vectorized pass; the per-sensor risk
+        level, cigarette equivalent and advisory text are then looked up
+        from each score.
+
+        Parameters
+        ----------
+        pollutions : list of PollutionData
+            Pollution per sensor.
+        noises : list of NoiseData
+            Noise per sensor, in the same order.
+
+        Returns
+        -------
+        list of HealthData
+            One entry per sensor, in input order.
+        """
+        n = len(pollutions)
+        pm25 = np.fromiter((p.pm25 for p in pollutions), dtype=np.float64, count=n)
+        pm10 = np.fromiter((p.pm10 for p in pollutions), dtype=np.float64, count=n)
+        no2 = np.fromiter((p.no2 for p in pollutions), dtype=np.float64, count=n)
+        noise_db = [nz.db_level for nz in noises]
+
+        scores = self._compute_health_scores_batch(pm25, pm10, no2, noise_db)
+        levels = self._risk_levels_batch(scores)
+
+        results: List[HealthData] = []
+        for score, level, pm, db in zip(scores.tolist(), levels.tolist(), pm25.tolist(), noise_db):
+            results.append(HealthData(
+                score=score,
+                risk_level=level,
+                equivalent_cigarettes=self._compute_cigarette_equivalent(pm),
+                vulnerable_advisory=self._generate_advisory(score, pm, db),
+            ))
+        return results
+
     # ==================================================================
     # Vulnerability-adjusted risk
     # ==================================================================
@@ -292,17 +456,17 @@ class HealthService:
         multiplier = _VULNERABILITY_MULTIPLIERS.get(population_group, 1.0)
 
         # Beta coefficient from Pope et al. (2002): ~0.006 per ug/m3
-        beta = 0.006
-        rr = math.exp(beta * pm25 * multiplier)
+        rr = math.exp(_RR_BETA * pm25 * multiplier)
         excess_mortality = (rr - 1.0) * 100.0
         adj_cigs = self._compute_cigarette_equivalent(pm25) * multiplier
 
         return {
             "population_group": population_group,
             "vulnerability_multiplier": multiplier,
-            "relative_risk": round(rr, 4),
-            "excess_mortality_percent": round(excess_mortality, 2),
-            "adjusted_equivalent_cigarettes": round(adj_cigs, 3),
+            # Half-up display rounding; all three are non-negative
+            "relative_risk": int(rr * 10000.0 + 0.5) / 10000.0,
+            "excess_mortality_percent": int(excess_mortality * 100.0 + 0.5) / 100.0,
+            "adjusted_equivalent_cigarettes": int(adj_cigs * 1000.0 + 0.5) / 1000.0,
         }
 
     # ==================================================================
@@ -332,14 +496,62 @@ class HealthService:
         float
             Updated cumulative dose (ug/m3 * hours).
         """
-        dose = self._cumulative_dose.get(sensor_id, 0.0)
-        dose += pm25 * duration_hours
-        self._cumulative_dose[sensor_id] = dose
+        i = self._sensor_index.get(sensor_id)
+        if i is None:
+            i = int(self._dose_indices([sensor_id])[0])
+        # One unboxed read and one store on the array slot
+        doses = self._dose_arr
+        dose = doses.item(i) + pm25 * duration_hours
+        doses[i] = dose
         return dose
 
+    def update_cumulative_dose_batch(
+        self,
+        sensor_ids: Sequence[str],
+        pm25: np.ndarray,
+        duration_hours: np.ndarray,
+    ) -> None:
+        """
+        Vectorized ``update_cumulative_dose`` for many sensors at once.
+
+        Parameters
+        ----------
+        sensor_ids : sequence of str
+            Sensor/location identifiers (repeats are accumulated).
+        pm25 : np.ndarray
+            PM2.5 concentration per entry in ug/m3.
+        duration_hours : np.ndarray or float
+            Exposure duration per entry in hours.
+        """
+        idx = self._dose_indices(sensor_ids)
+        dose = np.asarray(pm25, dtype=np.float64) * duration_hours
+        # add.at, unlike fancy-index +=, accumulates repeated indices
+        np.add.at(self._dose_arr, idx, dose)
+
     def get_cumulative_dose(self, sensor_id: str) -> float:
         """Return the accumulated exposure dose for a sensor location."""
-        return self._cumulative_dose.get(sensor_id, 0.0)
+        i = self._sensor_index.get(sensor_id)
+        return self._dose_arr.item(i) if i is not None else 0.0
+
+    def _dose_indices(self, sensor_ids: Sequence[str]) -> np.ndarray:
+        """
+        Resolve sensor IDs to dose-array slots, registering new sensors
+        and growing the array in ``_DOSE_CHUNK`` blocks as needed.
+        """
+        index = self._sensor_index
+        idx = np.empty(len(sensor_ids), dtype=np.intp)
+        for k, sid in enumerate(sensor_ids):
+            i = index.get(sid)
+            if i is None:
+                i = index[sid] = len(index)
+            idx[k] = i
+
+        if len(index) > self._dose_arr.shape[0]:
+            size = -(-len(index) // _DOSE_CHUNK) * _DOSE_CHUNK
+            grown = np.zeros(size, dtype=np.float64)
+            grown[:self._dose_arr.shape[0]] = self._dose_arr
+            self._dose_arr = grown
+        return idx
 
     # ==================================================================
     # Aggregate summary
@@ -363,40 +575,102 @@ class HealthService:
             Aggregated statistics including average score, worst risk level,
             average equivalent cigarettes, and per-level sensor counts.
         """
-        if not health_data_list:
+        n = len(health_data_list)
+        if n == 0:
+            return self.aggregate_health_arrays(
+                np.empty(0), np.empty(0), np.empty(0, dtype=np.int8)
+            )
+
+        if n >= _BINCOUNT_MIN_SENSORS:
+            # Column-wise: C-level map() passes for the sums, and the
+            # level histogram (and with it the worst level) from bincount
+            counts = np.bincount(
+                np.fromiter(
+                    map(RISK_RANK.__getitem__, map(_get_risk_level, health_data_list)),
+                    dtype=np.intp,
+                    count=n,
+                ),
+                minlength=len(RISK_LEVELS),
+            )
+            return {
+                "avg_score": round(sum(map(_get_score, health_data_list)) / n),
+                "worst_risk_level": RISK_LEVELS[int(np.flatnonzero(counts)[-1])],
+                "avg_equivalent_cigarettes": round(
+                    sum(map(_get_cigarettes, health_data_list)) / n, 2
+                ),
+                "advisory_count_by_level": dict(zip(RISK_LEVELS, counts.tolist())),
+                "sensor_count": n,
+            }
+
+        # Small lists: one fused pass over the records, accumulating in locals
+        score_sum = 0
+        cig_sum = 0.0
+        worst = 0
+        counts = dict.fromkeys(RISK_LEVELS, 0)
+        rank = RISK_RANK.__getitem__
+        for h in health_data_list:
+            level = h.risk_level
+            score_sum += h.score
+            cig_sum += h.equivalent_cigarettes
+            counts[level] += 1
+            r = rank(level)
+            if r > worst:
+                worst = r
+
+        return {
+            "avg_score": round(score_sum / n),
+            "worst_risk_level": RISK_LEVELS[worst],
+            "avg_equivalent_cigarettes": round(cig_sum / n, 2),
+            "advisory_count_by_level": counts,
+            "sensor_count": n,
+        }
+
+    @staticmethod
+    def aggregate_health_arrays(
+        scores: np.ndarray,
+        cigarettes: np.ndarray,
+        risk_idx: np.ndarray,
+    ) -> Dict:
+        """
+        Aggregate per-sensor health columns into a global summary.
+
+        Vectorized counterpart of ``get_aggregate_health_summary`` for
+        callers that already hold the data as parallel arrays.
+
+        Parameters
+        ----------
+        scores : np.ndarray
+            Health score per sensor.
+        cigarettes : np.ndarray
+            Equivalent cigarettes per sensor.
+        risk_idx : np.ndarray
+            Index into ``RISK_LEVELS`` per sensor.
+
+        Returns
+        -------
+        dict
+            Same structure as ``get_aggregate_health_summary``.
+        """
+        n = len(scores)
+        if n == 0:
             return {
                 "avg_score": 100,
                 "worst_risk_level": "Low",
                 "avg_equivalent_cigarettes": 0.0,
-                "advisory_count_by_level": {
-                    "Low": 0, "Moderate": 0, "High": 0,
-                    "Very High": 0, "Severe": 0,
-                },
+                "advisory_count_by_level": dict.fromkeys(RISK_LEVELS, 0),
                 "sensor_count": 0,
             }
 
-        scores = [h.score for h in health_data_list]
-        avg_score = round(sum(scores) / len(scores))
-
-        risk_order = ["Low", "Moderate", "High", "Very High", "Severe"]
-        worst_idx = max(risk_order.index(h.risk_level) for h in health_data_list)
-        worst_risk = risk_order[worst_idx]
-
-        avg_cigs = round(
-            sum(h.equivalent_cigarettes for h in health_data_list) / len(health_data_list),
-            2,
-        )
-
-        level_counts = {"Low": 0, "Moderate": 0, "High": 0, "Very High": 0, "Severe": 0}
-        for h in health_data_list:
-            level_counts[h.risk_level] = level_counts.get(h.risk_level, 0) + 1
+        counts = np.bincount(risk_idx, minlength=len(RISK_LEVELS))
 
         return {
-            "avg_score": avg_score,
-            "worst_risk_level": worst_risk,
-            "avg_equivalent_cigarettes": avg_cigs,
-            "advisory_count_by_level": level_counts,
-            "sensor_count": len(health_data_list),
+            "avg_score": round(float(scores.mean())),
+            "worst_risk_level": RISK_LEVELS[int(risk_idx.max())],
+            "avg_equivalent_cigarettes": round(float(cigarettes.mean()), 2),
+            "advisory_count_by_level": {
+                level: int(c) for level, c in zip(RISK_LEVELS, counts)
+            },
+            "sensor_count": n,
         }
 
     # ==================================================================
@@ -410,5 +684,5 @@ class HealthService:
             "vulnerability_groups": list(_VULNERABILITY_MULTIPLIERS.keys()),
             "who_pm25_guideline_ug_m3": _WHO_PM25_GUIDELINE,
             "cigarette_equivalence_ug_m3_24h": _PM25_PER_CIGARETTE,
-            "tracked_doses": len(self._cumulative_dose),
+            "tracked_doses": len(self._sensor_index),
         }
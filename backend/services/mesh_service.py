@@ -11,9 +11,9 @@ Algorithm overview:
     1. Given N sensor locations with PM2.5 readings.
     2. Compute the experimental semivariogram (spatial correlation structure).
     3. Fit a theoretical variogram model (spherical) to the empirical data.
-    4. For each target grid point, build and solve the Ordinary Kriging
-       system of equations to obtain interpolated values with estimation
-       variance.
+    4. LU-factorize the Ordinary Kriging system once (its left-hand side
+       depends only on the sensors), then solve it for the right-hand
+       side of each target grid point to obtain interpolated values.
 
 The Kriging system for Ordinary Kriging:
 
@@ -45,12 +45,26 @@ References:
 
 import math
 import logging
+import warnings
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+import scipy.linalg
+from scipy.spatial import cKDTree
+
 from models import GridData, SensorData
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT for the Kriging variogram matrices
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+    _prange = numba.prange
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    _prange = range
+
 # ---------------------------------------------------------------------------
 # Default grid bounds (NYC area)
 # ---------------------------------------------------------------------------
@@ -75,6 +89,32 @@ _IDW_POWER = 2.5
 # Minimum sensors required for Kriging (need enough for variogram)
 _MIN_SENSORS_FOR_KRIGING = 4
 
+# EPA AQI breakpoints for PM2.5: (bp_lo, bp_hi, aqi_lo, aqi_hi)
+_AQI_BREAKPOINTS: Tuple[Tuple[float, float, int, int], ...] = (
+    (0.0,   12.0,   0,  50),
+    (12.1,  35.4,  51, 100),
+    (35.5,  55.4, 101, 150),
+    (55.5, 150.4, 151, 200),
+    (150.5, 250.4, 201, 300),
+    (250.5, 500.4, 301, 500),
+)
+
+# The same table as columns for vectorized lookup, plus a flat sentinel
+# segment (slope 0, AQI 500) for concentrations above the last bound
+_AQI_BP_HI = np.array([bp[1] for bp in _AQI_BREAKPOINTS])
+_AQI_BP_LO = np.array([bp[0] for bp in _AQI_BREAKPOINTS] + [0.0])
+_AQI_LO = np.array([float(bp[2]) for bp in _AQI_BREAKPOINTS] + [500.0])
+_AQI_SLOPE = np.array(
+    [(hi - lo) / (bp_hi - bp_lo) for bp_lo, bp_hi, lo, hi in _AQI_BREAKPOINTS] + [0.0]
+)
+
+# From this many sensors on, each cell is kriged from its nearest
+# neighbours only (moving window) instead of from the full network.
+# Below it the single global factorization is faster (measured
+# crossover ~200 sensors on a 30x30 grid).
+_LOCAL_KRIGING_MIN_SENSORS = 200
+_LOCAL_KRIGING_NEIGHBOURS = 16
+
 
 def _haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """Haversine distance between two points in km."""
@@ -90,6 +130,192 @@ def _haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     return _EARTH_RADIUS_KM * c
 
 
+def _haversine_matrix(
+    lats1: np.ndarray,
+    lngs1: np.ndarray,
+    lats2: np.ndarray,
+    lngs2: np.ndarray,
+) -> np.ndarray:
+    """
+    Haversine distance in km between every pair of two point sets.
+
+    Parameters
+    ----------
+    lats1, lngs1 : np.ndarray
+        Coordinates of the M first points (degrees).
+    lats2, lngs2 : np.ndarray
+        Coordinates of the N second points (degrees).
+
+    Returns
+    -------
+    np.ndarray
+        (M, N) distance matrix.
+    """
+    lats1 = np.asarray(lats1, dtype=np.float64)[:, None]
+    lngs1 = np.asarray(lngs1, dtype=np.float64)[:, None]
+    lats2 = np.asarray(lats2, dtype=np.float64)[None, :]
+    lngs2 = np.asarray(lngs2, dtype=np.float64)[None, :]
+
+    a = (
+        np.sin(np.radians(lats2 - lats1) / 2) ** 2
+        + np.cos(np.radians(lats1))
+        * np.cos(np.radians(lats2))
+        * np.sin(np.radians(lngs2 - lngs1) / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return _EARTH_RADIUS_KM * c
+
+
+def _unit_vectors(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """(N, 3) Cartesian unit vectors for points given in degrees."""
+    lat = np.radians(lats)
+    lng = np.radians(lngs)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def _haversine_grid(
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    cell_lats: np.ndarray,
+    cell_lngs: np.ndarray,
+) -> np.ndarray:
+    """
+    Haversine distance in km from each of N points to every cell centre
+    of an R x C lat/lng grid, as an (N, R*C) row-major matrix.
+
+    Same result as ``_haversine_matrix`` against the flattened cell
+    centres, but the latitude terms are evaluated once per grid row and
+    the longitude term once per column; only the final arctan2 runs per
+    (point, cell).
+    """
+    lats = np.asarray(lats, dtype=np.float64)[:, None]
+    lngs = np.asarray(lngs, dtype=np.float64)[:, None]
+    cell_lats = np.asarray(cell_lats, dtype=np.float64)[None, :]
+    cell_lngs = np.asarray(cell_lngs, dtype=np.float64)[None, :]
+
+    dlat_term = np.sin(np.radians(cell_lats - lats) / 2) ** 2           # (N, R)
+    cos_term = np.cos(np.radians(lats)) * np.cos(np.radians(cell_lats))  # (N, R)
+    dlng_term = np.sin(np.radians(cell_lngs - lngs) / 2) ** 2           # (N, C)
+
+    a = dlat_term[:, :, None] + cos_term[:, :, None] * dlng_term[:, None, :]
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return (_EARTH_RADIUS_KM * c).reshape(lats.shape[0], -1)
+
+
+def _idw_weighted_mean(
+    target_lats: np.ndarray,
+    target_lngs: np.ndarray,
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    values: np.ndarray,
+    power: float,
+    dist: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Inverse-distance-weighted mean of ``values`` at each target point.
+
+    ``dist`` optionally supplies the precomputed (N, T) sensor-to-target
+    distances in km.
+    """
+    if dist is None:
+        dist = _haversine_matrix(lats, lngs, target_lats, target_lngs)
+    w = 1.0 / np.maximum(dist, _MIN_DISTANCE_KM) ** power
+    weight_total = w.sum(axis=0)
+    weighted_sum = values @ w
+    safe_total = np.where(weight_total == 0, 1.0, weight_total)
+    return np.where(weight_total == 0, 10.0, weighted_sum / safe_total)
+
+
+def _spherical_variogram_np(
+    h: np.ndarray,
+    nugget: float,
+    sill: float,
+    range_param: float,
+) -> np.ndarray:
+    """
+    Elementwise ``_spherical_variogram`` over an array of lags.
+
+    A single expression with no in-place masking, so it also accepts
+    scalars and read-only views.  The clip keeps the cubic bounded
+    for lags beyond the range, whose values ``np.where`` discards.
+    """
+    h = np.asarray(h, dtype=np.float64)
+    a = max(range_param, 1.0)
+    hr = np.clip(h / a, 0.0, 1.0)
+    return np.where(
+        h <= 0,
+        0.0,
+        np.where(h <= a, nugget + (sill - nugget) * (1.5 * hr - 0.5 * hr ** 3), sill),
+    )
+
+
+def _variogram_matrix_kernel(
+    lats1: np.ndarray,
+    lngs1: np.ndarray,
+    lats2: np.ndarray,
+    lngs2: np.ndarray,
+    nugget: float,
+    sill: float,
+    range_param: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Spherical variogram of the haversine lag between every pair of two
+    point sets, written into the ``(M, N)`` array ``out``.
+
+    Fuses the distance and the variogram so no intermediate lag matrix
+    is materialized.  Plain loops so Numba can compile it (rows run in
+    parallel); ``_variogram_matrix_broadcast`` is used when Numba is
+    not installed.
+    """
+    a_range = max(range_param, 1.0)
+    partial_sill = sill - nugget
+    for i in _prange(lats1.shape[0]):
+        cos1 = math.cos(math.radians(lats1[i]))
+        for j in range(lats2.shape[0]):
+            dlat = math.radians(lats2[j] - lats1[i])
+            dlng = math.radians(lngs2[j] - lngs1[i])
+            a = (
+                math.sin(dlat / 2) ** 2
+                + cos1 * math.cos(math.radians(lats2[j])) * math.sin(dlng / 2) ** 2
+            )
+            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+            h = _EARTH_RADIUS_KM * c * 1000.0
+
+            if h <= 0:
+                out[i, j] = 0.0
+            elif h <= a_range:
+                hr = h / a_range
+                out[i, j] = nugget + partial_sill * (1.5 * hr - 0.5 * hr ** 3)
+            else:
+                out[i, j] = sill
+    return out
+
+
+def _variogram_matrix_broadcast(
+    lats1: np.ndarray,
+    lngs1: np.ndarray,
+    lats2: np.ndarray,
+    lngs2: np.ndarray,
+    nugget: float,
+    sill: float,
+    range_param: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """NumPy equivalent of ``_variogram_matrix_kernel`` for when Numba is absent."""
+    lags = _haversine_matrix(lats1, lngs1, lats2, lngs2) * 1000.0
+    out[...] = _spherical_variogram_np(lags, nugget, sill, range_param)
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    # No fastmath: grid values must round exactly as on the NumPy path
+    _variogram_matrix = numba.njit(cache=True, parallel=True)(_variogram_matrix_kernel)
+else:
+    _variogram_matrix = _variogram_matrix_broadcast
+
+
 class MeshService:
     """
     Generates interpolated pollution grids using Ordinary Kriging
@@ -102,6 +328,13 @@ class MeshService:
         self._resolution = _DEFAULT_RESOLUTION
         self._variogram_params: Optional[Dict[str, float]] = None
 
+        if _NUMBA_AVAILABLE:
+            # Compile (or load the cached) kernel now, not on the first grid
+            _variogram_matrix(
+                np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1),
+                0.0, 1.0, 1.0, np.empty((1, 1)),
+            )
+
     def set_bounds(
         self, north: float, south: float, east: float, west: float
     ) -> None:
@@ -117,17 +350,6 @@ class MeshService:
         """Override the default grid resolution."""
         self._resolution = max(5, min(100, resolution))
 
-    # ==================================================================
-    # Haversine distance (meters, for variogram)
-    # ==================================================================
-
-    @staticmethod
-    def _haversine_meters(
-        lat1: float, lng1: float, lat2: float, lng2: float
-    ) -> float:
-        """Haversine distance in meters."""
-        return _haversine(lat1, lng1, lat2, lng2) * 1000.0
-
     # ==================================================================
     # Experimental Semivariogram
     # ==================================================================
@@ -170,71 +392,56 @@ class MeshService:
         if n < 2:
             return {"nugget": 0.0, "sill": 1.0, "range_param": 1000.0}
 
-        # Calculate all pairwise distances and squared differences
-        distances: List[float] = []
-        sq_diffs: List[float] = []
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                d = self._haversine_meters(
-                    locations[i][0], locations[i][1],
-                    locations[j][0], locations[j][1],
-                )
-                sq_diff = (values[i] - values[j]) ** 2
-                distances.append(d)
-                sq_diffs.append(sq_diff)
-
-        if not distances:
-            return {"nugget": 0.0, "sill": 1.0, "range_param": 1000.0}
+        # All pairwise distances and squared differences, upper triangle
+        pts = np.asarray(locations, dtype=np.float64)
+        vals = np.asarray(values, dtype=np.float64)
+        iu, ju = np.triu_indices(n, 1)
+        dist_km = _haversine_matrix(pts[:, 0], pts[:, 1], pts[:, 0], pts[:, 1])
+        distances = dist_km[iu, ju] * 1000.0
+        sq_diffs = (vals[iu] - vals[ju]) ** 2
 
         # Determine lag bins
-        max_dist = max(distances)
+        max_dist = float(distances.max())
         lag_width = max_dist / n_lags if max_dist > 0 else 100.0
         lag_width = max(lag_width, 10.0)  # minimum 10m bin width
 
-        # Compute empirical semivariogram
-        lag_centers: List[float] = []
-        gamma_values: List[float] = []
-
-        for lag_idx in range(n_lags):
-            h_low = lag_idx * lag_width
-            h_high = (lag_idx + 1) * lag_width
-            h_center = (h_low + h_high) / 2.0
-
-            # Find all pairs in this lag bin
-            bin_sq_diffs = [
-                sq_diffs[k]
-                for k in range(len(distances))
-                if h_low <= distances[k] < h_high
-            ]
-
-            if bin_sq_diffs:
-                # Matheron estimator: gamma(h) = (1/2N) * sum(z_i - z_j)^2
-                gamma_h = sum(bin_sq_diffs) / (2.0 * len(bin_sq_diffs))
-                lag_centers.append(h_center)
-                gamma_values.append(gamma_h)
-
-        if not gamma_values:
-            data_var = sum((v - sum(values) / n) ** 2 for v in values) / n
+        # Compute empirical semivariogram: bin k holds the pairs with
+        # edges[k] <= d < edges[k + 1]; pairs at or beyond the last edge
+        # fall outside every bin
+        edges = np.arange(n_lags + 1) * lag_width
+        bin_idx = np.searchsorted(edges, distances, side="right") - 1
+        in_range = bin_idx < n_lags
+        counts = np.bincount(bin_idx[in_range], minlength=n_lags)
+        sq_sums = np.bincount(
+            bin_idx[in_range], weights=sq_diffs[in_range], minlength=n_lags
+        )
+
+        # Matheron estimator: gamma(h) = (1/2N) * sum(z_i - z_j)^2,
+        # over the non-empty bins
+        filled = counts > 0
+        lag_centers = ((edges[:-1] + edges[1:]) / 2.0)[filled]
+        gamma_values = sq_sums[filled] / (2.0 * counts[filled])
+
+        data_variance = float(np.var(vals))
+
+        if not gamma_values.size:
             return {
                 "nugget": 0.0,
-                "sill": max(data_var, 1.0),
+                "sill": max(data_variance, 1.0),
                 "range_param": max_dist * 0.5 if max_dist > 0 else 1000.0,
             }
 
         # Fit spherical model by method-of-moments estimation
-        data_variance = sum((v - sum(values) / n) ** 2 for v in values) / n
-        sill = max(max(gamma_values), data_variance, 1.0)
+        sill = max(float(gamma_values.max()), data_variance, 1.0)
 
         # Nugget: extrapolate from smallest lag (near-origin intercept)
-        nugget = max(0.0, gamma_values[0] * 0.5) if gamma_values else 0.0
+        nugget = max(0.0, float(gamma_values[0]) * 0.5)
 
         # Range: lag at which gamma first exceeds 95% of sill
         range_param = max_dist * 0.5  # default to half max distance
-        for i, g in enumerate(gamma_values):
-            if g >= 0.95 * sill:
-                range_param = lag_centers[i]
-                break
+        reached = np.flatnonzero(gamma_values >= 0.95 * sill)
+        if reached.size:
+            range_param = float(lag_centers[reached[0]])
 
         range_param = max(range_param, 100.0)  # minimum 100m range
 
@@ -290,212 +497,269 @@ class MeshService:
         else:
             return sill
 
+    _spherical_variogram_np = staticmethod(_spherical_variogram_np)
+
     # ==================================================================
-    # Ordinary Kriging at a Single Point
+    # Ordinary Kriging system
     # ==================================================================
 
-    def _ordinary_kriging(
+    def _factor_kriging_system(
         self,
         known_points: List[Tuple[float, float]],
-        known_values: List[float],
-        target_point: Tuple[float, float],
         variogram_params: Dict[str, float],
-    ) -> float:
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        Ordinary Kriging interpolation at a single target point.
+        Build and LU-factorize the Ordinary Kriging left-hand side.
 
-        Builds and solves the Kriging system:
-            [Gamma + Lagrange] * [weights] = [gamma_target]
-
-        Uses Gauss-Jordan elimination to solve the (N+1) x (N+1) system
-        without requiring numpy.
+        The (N+1) x (N+1) matrix depends only on the sensor layout and
+        the variogram, so one factorization serves every target point of
+        a grid; each point then costs a single pair of triangular solves.
 
         Parameters
         ----------
         known_points : list of (lat, lng) tuples
             Known sensor locations.
-        known_values : list of float
-            PM2.5 values at each known location.
-        target_point : (lat, lng) tuple
-            Location to interpolate.
         variogram_params : dict
             Variogram model parameters (nugget, sill, range_param).
 
         Returns
         -------
-        float
-            Kriging estimate of PM2.5 at the target point.
+        tuple of np.ndarray or None
+            ``(lu, piv)`` as returned by ``scipy.linalg.lu_factor``, or
+            None if the system is singular.
         """
         n = len(known_points)
         nugget = variogram_params["nugget"]
         sill = variogram_params["sill"]
         range_p = variogram_params["range_param"]
 
-        # Build the (N+1) x (N+2) augmented matrix for the Kriging system
+        pts = np.asarray(known_points, dtype=np.float64)
+        lats, lngs = pts[:, 0], pts[:, 1]
+
         # Last row/col is the Lagrange multiplier constraint
         size = n + 1
+        matrix = np.ones((size, size), dtype=np.float64)
+        matrix[n, n] = 0.0
+        _variogram_matrix(lats, lngs, lats, lngs, nugget, sill, range_p, matrix[:n, :n])
+        # gamma(0) = 0 on diagonal
+        np.fill_diagonal(matrix[:n, :n], 0.0)
+
+        # Partial pivoting keeps every pivot on the diagonal of U; a
+        # vanishing one means the system is singular
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", scipy.linalg.LinAlgWarning)
+            lu, piv = scipy.linalg.lu_factor(matrix, overwrite_a=True, check_finite=False)
+        if np.abs(np.diag(lu)).min() < 1e-12:
+            return None
+        return lu, piv
+
+    def _solve_kriging(
+        self,
+        system: Tuple[np.ndarray, np.ndarray],
+        known_points: List[Tuple[float, float]],
+        known_values: List[float],
+        target_lats: np.ndarray,
+        target_lngs: np.ndarray,
+        variogram_params: Dict[str, float],
+        lags: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Kriging estimates at many target points from a factorized system.
 
-        # Initialize augmented matrix [A | b]
-        matrix = [[0.0] * (size + 1) for _ in range(size)]
-
-        # Fill the NxN gamma matrix
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    matrix[i][j] = 0.0  # gamma(0) = 0 on diagonal
-                else:
-                    h = self._haversine_meters(
-                        known_points[i][0], known_points[i][1],
-                        known_points[j][0], known_points[j][1],
-                    )
-                    matrix[i][j] = self._spherical_variogram(h, nugget, sill, range_p)
-
-        # Lagrange constraint: last row and column of 1s
-        for i in range(n):
-            matrix[i][n] = 1.0
-            matrix[n][i] = 1.0
-        matrix[n][n] = 0.0
-
-        # Right-hand side: gamma from target to each known point, plus 1
-        target_lat, target_lng = target_point
-        for i in range(n):
-            h = self._haversine_meters(
-                known_points[i][0], known_points[i][1],
-                target_lat, target_lng,
-            )
-            matrix[i][size] = self._spherical_variogram(h, nugget, sill, range_p)
-        matrix[n][size] = 1.0
+        The right-hand sides (gamma from each target to every known
+        point, plus the unbiasedness constraint) are stacked as columns
+        of one (N+1) x T matrix and solved in a single ``lu_solve``.
 
-        # Solve using Gauss-Jordan elimination with partial pivoting
-        solution = self._gauss_jordan(matrix, size)
+        Parameters
+        ----------
+        system : tuple of np.ndarray
+            ``(lu, piv)`` from ``_factor_kriging_system``.
+        known_points : list of (lat, lng) tuples
+            Known sensor locations.
+        known_values : list of float
+            PM2.5 values at each known location.
+        target_lats, target_lngs : np.ndarray
+            Coordinates of the T locations to interpolate.
+        variogram_params : dict
+            Variogram model parameters (nugget, sill, range_param).
+        lags : np.ndarray, optional
+            Precomputed (N, T) sensor-to-target lags in meters.
 
-        if solution is None:
-            # Fallback to IDW if Kriging system is singular
-            return self._idw_single(known_points, known_values, target_point)
+        Returns
+        -------
+        np.ndarray
+            Kriging estimate of PM2.5 at each target point, clamped at 0.
+        """
+        n = len(known_points)
+        pts = np.asarray(known_points, dtype=np.float64)
+        target_lats = np.asarray(target_lats, dtype=np.float64)
+        target_lngs = np.asarray(target_lngs, dtype=np.float64)
+        nugget = variogram_params["nugget"]
+        sill = variogram_params["sill"]
+        range_p = variogram_params["range_param"]
 
-        # Kriging estimate: weighted sum of known values
-        estimate = 0.0
-        for i in range(n):
-            estimate += solution[i] * known_values[i]
+        rhs = np.ones((n + 1, target_lats.shape[0]), dtype=np.float64)
+        if lags is not None:
+            rhs[:n] = _spherical_variogram_np(lags, nugget, sill, range_p)
+        else:
+            _variogram_matrix(
+                pts[:, 0], pts[:, 1], target_lats, target_lngs,
+                nugget, sill, range_p, rhs[:n],
+            )
 
-        # Clamp to reasonable range
-        return max(0.0, estimate)
+        # Both sides are built here from finite coordinates and readings,
+        # so LAPACK's input scan for NaN/inf is skipped
+        weights = scipy.linalg.lu_solve(system, rhs, overwrite_b=True, check_finite=False)
 
-    # ==================================================================
-    # Gauss-Jordan Elimination
-    # ==================================================================
+        # Kriging estimate: weighted sum of known values
+        estimates = np.asarray(known_values, dtype=np.float64) @ weights[:n]
+        return np.maximum(estimates, 0.0)
 
-    @staticmethod
-    def _gauss_jordan(
-        matrix: List[List[float]], size: int
-    ) -> Optional[List[float]]:
+    def _local_kriging(
+        self,
+        known_points: List[Tuple[float, float]],
+        known_values: List[float],
+        target_lats: np.ndarray,
+        target_lngs: np.ndarray,
+        variogram_params: Dict[str, float],
+        k: int = _LOCAL_KRIGING_NEIGHBOURS,
+    ) -> Optional[np.ndarray]:
         """
-        Solve a system of linear equations using Gauss-Jordan elimination
-        with partial pivoting.
+        Moving-window Ordinary Kriging from each target's k nearest sensors.
+
+        Distant sensors get negligible weight in a dense network, so each
+        target solves a (k+1) x (k+1) system over its neighbourhood
+        instead of the full (N+1) x (N+1) one.  Neighbours come from a
+        KD-tree over unit-sphere coordinates, where chord length orders
+        points exactly as great-circle distance does.  All T local
+        systems are stacked and solved in a single batched call.
 
         Parameters
         ----------
-        matrix : list of list of float
-            Augmented matrix [A | b] of shape (size, size+1).
-        size : int
-            Number of equations.
+        known_points : list of (lat, lng) tuples
+            Known sensor locations.
+        known_values : list of float
+            PM2.5 values at each known location.
+        target_lats, target_lngs : np.ndarray
+            Coordinates of the T locations to interpolate.
+        variogram_params : dict
+            Variogram model parameters (nugget, sill, range_param).
+        k : int
+            Neighbourhood size (capped at the number of sensors).
 
         Returns
         -------
-        list of float or None
-            Solution vector, or None if the system is singular.
+        np.ndarray or None
+            Kriging estimate at each target point, clamped at 0, or None
+            if any local system is singular.
         """
-        m = [row[:] for row in matrix]  # deep copy
-        n = size
-
-        for col in range(n):
-            # Partial pivoting: find row with largest absolute value in column
-            max_row = col
-            max_val = abs(m[col][col])
-            for row in range(col + 1, n):
-                if abs(m[row][col]) > max_val:
-                    max_val = abs(m[row][col])
-                    max_row = row
-
-            if max_val < 1e-12:
-                return None  # singular matrix
-
-            # Swap rows
-            m[col], m[max_row] = m[max_row], m[col]
-
-            # Eliminate column
-            pivot = m[col][col]
-            for j in range(n + 1):
-                m[col][j] /= pivot
-
-            for row in range(n):
-                if row == col:
-                    continue
-                factor = m[row][col]
-                for j in range(n + 1):
-                    m[row][j] -= factor * m[col][j]
-
-        # Extract solution
-        return [m[i][n] for i in range(n)]
+        nugget = variogram_params["nugget"]
+        sill = variogram_params["sill"]
+        range_p = variogram_params["range_param"]
 
-    # ==================================================================
-    # IDW fallback (for too few sensors)
-    # ==================================================================
+        pts = np.asarray(known_points, dtype=np.float64)
+        lats, lngs = pts[:, 0], pts[:, 1]
+        target_lats = np.asarray(target_lats, dtype=np.float64)
+        target_lngs = np.asarray(target_lngs, dtype=np.float64)
+        n = lats.shape[0]
+        t = target_lats.shape[0]
+        k = min(k, n)
+
+        sensor_xyz = _unit_vectors(lats, lngs)
+        target_xyz = _unit_vectors(target_lats, target_lngs)
+        chord, nbr = cKDTree(sensor_xyz).query(target_xyz, k=k)
+        chord = chord.reshape(t, k)
+        nbr = nbr.reshape(t, k)
+
+        # Great-circle lags within each neighbourhood from the chord
+        # lengths (2*asin(c/2) is the haversine central angle), so only
+        # O(T k^2) distances are evaluated rather than all sensor pairs
+        nbr_xyz = sensor_xyz[nbr]                                   # (T, k, 3)
+        diff = nbr_xyz[:, :, None, :] - nbr_xyz[:, None, :, :]      # (T, k, k, 3)
+        pair_chord = np.sqrt(np.einsum("tijc,tijc->tij", diff, diff))
+        to_m = _EARTH_RADIUS_KM * 1000.0 * 2.0
+
+        # Stacked (T, k+1, k+1) systems; last row/col is the Lagrange constraint
+        lhs = np.ones((t, k + 1, k + 1), dtype=np.float64)
+        lhs[:, :k, :k] = _spherical_variogram_np(
+            to_m * np.arcsin(np.minimum(pair_chord / 2.0, 1.0)), nugget, sill, range_p
+        )
+        lhs[:, k, k] = 0.0
+        rhs = np.ones((t, k + 1, 1), dtype=np.float64)
+        rhs[:, :k, 0] = _spherical_variogram_np(
+            to_m * np.arcsin(np.minimum(chord / 2.0, 1.0)), nugget, sill, range_p
+        )
 
-    @staticmethod
-    def _idw_single(
+        try:
+            weights = np.linalg.solve(lhs, rhs)[:, :k, 0]
+        except np.linalg.LinAlgError:
+            return None
+
+        values = np.asarray(known_values, dtype=np.float64)
+        estimates = np.einsum("tk,tk->t", weights, values[nbr])
+        return np.maximum(estimates, 0.0)
+
+    def _ordinary_kriging(
+        self,
         known_points: List[Tuple[float, float]],
         known_values: List[float],
         target_point: Tuple[float, float],
-        power: float = _IDW_POWER,
+        variogram_params: Dict[str, float],
     ) -> float:
-        """Inverse Distance Weighting interpolation at a single point."""
-        if not known_points:
-            return 10.0
+        """
+        Ordinary Kriging interpolation at a single target point.
 
-        weighted_sum = 0.0
-        weight_total = 0.0
+        Builds and solves the Kriging system:
+            [Gamma + Lagrange] * [weights] = [gamma_target]
 
-        target_lat, target_lng = target_point
-        for i, (lat, lng) in enumerate(known_points):
-            dist = _haversine(target_lat, target_lng, lat, lng)
-            dist = max(dist, _MIN_DISTANCE_KM)
-            w = 1.0 / (dist ** power)
-            weighted_sum += w * known_values[i]
-            weight_total += w
+        For many targets, factor once with ``_factor_kriging_system``
+        and pass them all to ``_solve_kriging`` instead.
 
-        if weight_total == 0:
-            return 10.0
-        return weighted_sum / weight_total
+        Parameters
+        ----------
+        known_points : list of (lat, lng) tuples
+            Known sensor locations.
+        known_values : list of float
+            PM2.5 values at each known location.
+        target_point : (lat, lng) tuple
+            Location to interpolate.
+        variogram_params : dict
+            Variogram model parameters (nugget, sill, range_param).
+
+        Returns
+        -------
+        float
+            Kriging estimate of PM2.5 at the target point.
+        """
+        system = self._factor_kriging_system(known_points, variogram_params)
+        if system is None:
+            # Fallback to IDW if Kriging system is singular
+            return self._idw_single(known_points, known_values, target_point)
+        return float(self._solve_kriging(
+            system, known_points, known_values,
+            [target_point[0]], [target_point[1]], variogram_params,
+        )[0])
 
     # ==================================================================
-    # IDW interpolation for full grid (fallback path)
+    # IDW fallback (for too few sensors)
     # ==================================================================
 
-    def _idw_interpolate(
-        self,
-        target_lat: float,
-        target_lng: float,
-        sensors: List[SensorData],
+    @staticmethod
+    def _idw_single(
+        known_points: List[Tuple[float, float]],
+        known_values: List[float],
+        target_point: Tuple[float, float],
         power: float = _IDW_POWER,
     ) -> float:
-        """IDW interpolation from SensorData objects."""
-        if not sensors:
+        """Inverse Distance Weighting interpolation at a single point."""
+        if not known_points:
             return 10.0
 
-        weighted_sum = 0.0
-        weight_total = 0.0
-
-        for sensor in sensors:
-            dist = _haversine(target_lat, target_lng, sensor.lat, sensor.lng)
-            dist = max(dist, _MIN_DISTANCE_KM)
-            w = 1.0 / (dist ** power)
-            weighted_sum += w * sensor.pollution.pm25
-            weight_total += w
-
-        if weight_total == 0:
-            return 10.0
-        return weighted_sum / weight_total
+        pts = np.asarray(known_points, dtype=np.float64)
+        return float(_idw_weighted_mean(
+            [target_point[0]], [target_point[1]], pts[:, 0], pts[:, 1],
+            np.asarray(known_values, dtype=np.float64), power,
+        )[0])
 
     # ==================================================================
     # Public API: Generate Interpolated Grid
@@ -527,6 +791,27 @@ class MeshService:
         GridData
             Grid with bounds, resolution, and 2D array of PM2.5 values.
         """
+        grid_bounds, grid_res, grid = self._pm25_grid_array(sensors, bounds, resolution)
+
+        # Nested lists are only built at the model boundary
+        return GridData.model_construct(
+            bounds=grid_bounds,
+            resolution=grid_res,
+            values=grid.tolist(),
+        )
+
+    def _pm25_grid_array(
+        self,
+        sensors: List[SensorData],
+        bounds: Optional[dict] = None,
+        resolution: Optional[int] = None,
+    ) -> Tuple[dict, int, np.ndarray]:
+        """
+        Interpolated PM2.5 grid as a ``(resolution, resolution)`` array,
+        clamped at 0 and rounded to 0.1, along with the bounds and
+        resolution actually used.  Shared by ``generate_grid`` and
+        ``generate_aqi_grid``.
+        """
         grid_bounds = bounds or self._bounds
         grid_res = resolution or self._resolution
 
@@ -555,32 +840,50 @@ class MeshService:
         else:
             vparams = None
 
-        # Generate the grid
-        grid_values: List[List[float]] = []
-
-        for row in range(grid_res):
-            lat = north - (row + 0.5) * lat_step
-            row_values: List[float] = []
+        # Cell centres, row-major from the north-west corner
+        cell_lats = north - (np.arange(grid_res) + 0.5) * lat_step
+        cell_lngs = west + (np.arange(grid_res) + 0.5) * lng_step
+        target_lats = np.repeat(cell_lats, grid_res)
+        target_lngs = np.tile(cell_lngs, grid_res)
 
-            for col in range(grid_res):
-                lng = west + (col + 0.5) * lng_step
+        sensor_lats = np.array([loc[0] for loc in locations], dtype=np.float64)
+        sensor_lngs = np.array([loc[1] for loc in locations], dtype=np.float64)
 
-                if use_kriging and vparams is not None:
-                    pm25 = self._ordinary_kriging(
-                        locations, values, (lat, lng), vparams
-                    )
-                else:
-                    pm25 = self._idw_interpolate(lat, lng, sensors)
+        pm25: Optional[np.ndarray] = None
+        dist_km: Optional[np.ndarray] = None
+        if vparams is not None and len(sensors) >= _LOCAL_KRIGING_MIN_SENSORS:
+            pm25 = self._local_kriging(
+                locations, values, target_lats, target_lngs, vparams
+            )
+        elif vparams is not None:
+            # Sensor-to-cell distances, shared by the Kriging RHS and the
+            # IDW fallback
+            dist_km = _haversine_grid(sensor_lats, sensor_lngs, cell_lats, cell_lngs)
+            # The LHS is shared by every grid cell: factor it once and
+            # solve every cell's right-hand side together
+            system = self._factor_kriging_system(locations, vparams)
+            if system is not None:
+                pm25 = self._solve_kriging(
+                    system, locations, values, target_lats, target_lngs, vparams,
+                    lags=dist_km * 1000.0,
+                )
 
-                row_values.append(round(max(0.0, pm25), 1))
+        if pm25 is None and sensors:
+            # Too few sensors, or a singular Kriging system
+            if dist_km is None:
+                dist_km = _haversine_grid(sensor_lats, sensor_lngs, cell_lats, cell_lngs)
+            pm25 = _idw_weighted_mean(
+                target_lats, target_lngs, sensor_lats, sensor_lngs,
+                np.array(values, dtype=np.float64), _IDW_POWER, dist=dist_km,
+            )
+        elif pm25 is None:
+            pm25 = np.full(target_lats.shape, 10.0)
 
-            grid_values.append(row_values)
-
-        return GridData(
-            bounds=grid_bounds,
-            resolution=grid_res,
-            values=grid_values,
-        )
+        # Clamp and round the whole grid in place, then convert once
+        grid = pm25.reshape(grid_res, grid_res)
+        np.maximum(grid, 0.0, out=grid)
+        np.round(grid, 1, out=grid)
+        return grid_bounds, grid_res, grid
 
     # ==================================================================
     # AQI Grid (converted from PM2.5 grid)
@@ -607,20 +910,12 @@ class MeshService:
         GridData
             Grid of AQI values.
         """
-        pm25_grid = self.generate_grid(sensors, bounds, resolution)
-
-        aqi_values: List[List[float]] = []
-        for row in pm25_grid.values:
-            aqi_row: List[float] = []
-            for pm25 in row:
-                aqi = self._pm25_to_aqi(pm25)
-                aqi_row.append(float(aqi))
-            aqi_values.append(aqi_row)
-
-        return GridData(
-            bounds=pm25_grid.bounds,
-            resolution=pm25_grid.resolution,
-            values=aqi_values,
+        grid_bounds, grid_res, pm25 = self._pm25_grid_array(sensors, bounds, resolution)
+
+        return GridData.model_construct(
+            bounds=grid_bounds,
+            resolution=grid_res,
+            values=self._pm25_to_aqi_np(pm25).tolist(),
         )
 
     # ==================================================================
@@ -630,21 +925,29 @@ class MeshService:
     @staticmethod
     def _pm25_to_aqi(pm25: float) -> int:
         """Convert PM2.5 (ug/m3) to EPA AQI using standard breakpoints."""
-        breakpoints = [
-            (0.0,   12.0,   0,  50),
-            (12.1,  35.4,  51, 100),
-            (35.5,  55.4, 101, 150),
-            (55.5, 150.4, 151, 200),
-            (150.5, 250.4, 201, 300),
-            (250.5, 500.4, 301, 500),
-        ]
         pm25 = max(0.0, pm25)
-        for bp_lo, bp_hi, aqi_lo, aqi_hi in breakpoints:
+        for bp_lo, bp_hi, aqi_lo, aqi_hi in _AQI_BREAKPOINTS:
             if pm25 <= bp_hi:
                 aqi = ((aqi_hi - aqi_lo) / (bp_hi - bp_lo)) * (pm25 - bp_lo) + aqi_lo
                 return round(aqi)
         return 500
 
+    @staticmethod
+    def _pm25_to_aqi_np(pm25: np.ndarray) -> np.ndarray:
+        """
+        Elementwise ``_pm25_to_aqi``, as float AQI values.
+
+        The breakpoint scan becomes one ``searchsorted`` on the upper
+        bounds (the first segment whose upper bound is >= pm25); values
+        past the last bound land on a sentinel segment that evaluates
+        to 500.
+        """
+        pm25 = np.maximum(pm25, 0.0)
+        seg = np.searchsorted(_AQI_BP_HI, pm25, side="left")
+        aqi = _AQI_SLOPE[seg] * (pm25 - _AQI_BP_LO[seg]) + _AQI_LO[seg]
+        # np.round, like round(), rounds halves to even
+        return np.round(aqi)
+
     # ==================================================================
     # Diagnostics
     # ==================================================================
@@ -37,13 +37,58 @@ import math
 import random
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, TypedDict
 
-from models import VehicleCounts, PollutionData, WeatherData, ParticleData, GridData
+import numpy as np
+
+from models import VehicleCounts, PollutionData, WeatherData, GridData
 
 logger = logging.getLogger(__name__)
 
 
+_rng = np.random.default_rng()
+
+
+# ---------------------------------------------------------------------------
+# Particle batches (structure-of-arrays)
+# ---------------------------------------------------------------------------
+class ParticleBatch(TypedDict):
+    """Columnar particle storage: one array per ``ParticleData`` field."""
+
+    x: np.ndarray
+    y: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    concentration: np.ndarray
+    age: np.ndarray
+    source_id: np.ndarray
+
+
+_PARTICLE_FLOAT_FIELDS = ("x", "y", "vx", "vy", "concentration", "age")
+_PARTICLE_FIELDS = _PARTICLE_FLOAT_FIELDS + ("source_id",)
+
+
+def new_particle_batch(size: int) -> ParticleBatch:
+    """Allocate an uninitialised batch with room for ``size`` particles."""
+    batch = {name: np.empty(size, dtype=np.float64) for name in _PARTICLE_FLOAT_FIELDS}
+    batch["source_id"] = np.empty(size, dtype=object)
+    return batch
+
+
+def particles_to_records(batch: Optional[ParticleBatch]) -> List[Dict]:
+    """
+    Convert a particle batch to plain ``ParticleData``-shaped dicts.
+
+    Only needed at the serialization boundary (WebSocket frames), where
+    pydantic-core encodes plain dicts several times faster than it can
+    build and dump one model per particle.
+    """
+    if not batch:
+        return []
+    columns = [batch[name].tolist() for name in _PARTICLE_FIELDS]
+    return [dict(zip(_PARTICLE_FIELDS, row)) for row in zip(*columns)]
+
+
 # ---------------------------------------------------------------------------
 # EPA-derived emission factors (grams per vehicle per second)
 # Approximated from EPA AP-42 and MOVES for urban stop-and-go (~25 km/h)
@@ -379,7 +424,7 @@ class PhysicsEngine:
         aqi = self.pm25_to_aqi(pm25)
         category = self.get_aqi_category(aqi)
 
-        return PollutionData(
+        return PollutionData.model_construct(
             pm25=pm25,
             pm10=pm10,
             no2=no2,
@@ -553,7 +598,9 @@ class PhysicsEngine:
         pollution: PollutionData,
         weather: WeatherData,
         count: int = 15,
-    ) -> List[ParticleData]:
+        out: Optional[ParticleBatch] = None,
+        start: int = 0,
+    ) -> ParticleBatch:
         """
         Generate visualization particles representing pollutant dispersion
         from a sensor location. Particles drift with the wind and include
@@ -571,12 +618,20 @@ class PhysicsEngine:
             Current weather conditions.
         count : int
             Number of particles to generate.
+        out : ParticleBatch, optional
+            Preallocated batch to write into; a new one of size ``count``
+            is allocated when omitted.
+        start : int
+            Offset within ``out`` of the first particle written.
 
         Returns
         -------
-        list of ParticleData
+        ParticleBatch
+            ``out`` (or the new batch), with ``[start:start + count]`` filled.
         """
-        particles: List[ParticleData] = []
+        if out is None:
+            out = new_particle_batch(count)
+        sl = slice(start, start + count)
 
         # Wind vector in coordinate-space units
         wind_rad = math.radians(weather.wind_direction)
@@ -586,30 +641,24 @@ class PhysicsEngine:
         # Concentration factor for particle opacity
         concentration_factor = min(pollution.pm25 / 50.0, 1.0)
 
-        for _ in range(count):
-            # Random offset from sensor center
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(0.0001, 0.003)
-            dx = radius * math.cos(angle)
-            dy = radius * math.sin(angle)
-
-            # Turbulent diffusion component
-            turbulence_x = random.gauss(0, 0.000005)
-            turbulence_y = random.gauss(0, 0.000005)
-
-            particles.append(
-                ParticleData(
-                    x=lng + dx,
-                    y=lat + dy,
-                    vx=wind_vx + turbulence_x,
-                    vy=wind_vy + turbulence_y,
-                    concentration=concentration_factor * random.uniform(0.3, 1.0),
-                    age=random.uniform(0, 10),
-                    source_id=sensor_id,
-                )
-            )
+        # Random offset from sensor center
+        angle = _rng.uniform(0, 2 * math.pi, count)
+        radius = _rng.uniform(0.0001, 0.003, count)
+        np.multiply(radius, np.cos(angle), out=out["x"][sl])
+        out["x"][sl] += lng
+        np.multiply(radius, np.sin(angle), out=out["y"][sl])
+        out["y"][sl] += lat
+
+        # Turbulent diffusion component
+        out["vx"][sl] = _rng.normal(wind_vx, 0.000005, count)
+        out["vy"][sl] = _rng.normal(wind_vy, 0.000005, count)
+
+        out["concentration"][sl] = _rng.uniform(0.3, 1.0, count)
+        out["concentration"][sl] *= concentration_factor
+        out["age"][sl] = _rng.uniform(0, 10, count)
+        out["source_id"][sl] = sensor_id
 
-        return particles
+        return out
 
     # ==================================================================
     # Diagnostics
@@ -25,7 +25,7 @@ References:
 import math
 import heapq
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Dict, Tuple, Optional
 
 from models import GreenRoute, SensorData
 
@@ -83,8 +83,15 @@ class RoutingService:
 
     def __init__(self) -> None:
         self._sensor_cache: List[SensorData] = []
+        self._sensor_version: Optional[int] = None
+        # Per-sensor (lat, lng, cos(lat), pm25) for interpolation
+        self._sensor_terms: List[Tuple[float, float, float, float]] = []
 
-    def update_sensors(self, sensors: List[SensorData]) -> None:
+    def update_sensors(
+        self,
+        sensors: Iterable[SensorData],
+        version: Optional[int] = None,
+    ) -> None:
         """
         Update the internal sensor cache for pollution interpolation.
 
@@ -93,10 +100,21 @@ class RoutingService:
 
         Parameters
         ----------
-        sensors : list of SensorData
+        sensors : iterable of SensorData
             Current sensor readings with positions and pollution data.
+        version : int, optional
+            State version the readings belong to.  When it matches the
+            version of the cached readings the call is a no-op, so
+            per-request callers can pass it unconditionally.
         """
+        if version is not None and version == self._sensor_version:
+            return
         self._sensor_cache = list(sensors)
+        self._sensor_version = version
+        self._sensor_terms = [
+            (s.lat, s.lng, math.cos(math.radians(s.lat)), s.pollution.pm25)
+            for s in self._sensor_cache
+        ]
 
     # ==================================================================
     # Pollution interpolation (IDW)
@@ -117,17 +135,26 @@ class RoutingService:
         float
             Interpolated PM2.5 in ug/m3.
         """
-        if not self._sensor_cache:
+        if not self._sensor_terms:
             return 15.0  # default urban background
 
         weighted_sum = 0.0
         weight_total = 0.0
 
-        for sensor in self._sensor_cache:
-            dist = _haversine(lat, lng, sensor.lat, sensor.lng)
+        # _haversine inlined: the target's cosine is computed once per
+        # call and each sensor's once per update_sensors
+        sin, atan2, sqrt, radians = math.sin, math.atan2, math.sqrt, math.radians
+        cos_lat = math.cos(radians(lat))
+
+        for s_lat, s_lng, s_cos_lat, pm25 in self._sensor_terms:
+            a = (
+                sin(radians(s_lat - lat) / 2) ** 2
+                + cos_lat * s_cos_lat * sin(radians(s_lng - lng) / 2) ** 2
+            )
+            dist = _EARTH_RADIUS_KM * (2 * atan2(sqrt(a), sqrt(1 - a)))
             dist = max(dist, 0.01)  # prevent singularity
             w = 1.0 / (dist ** 2)
-            weighted_sum += w * sensor.pollution.pm25
+            weighted_sum += w * pm25
             weight_total += w
 
         if weight_total == 0:
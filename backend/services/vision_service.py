@@ -179,7 +179,7 @@ class VisionService:
         motorcycles = int(detections.count(self._COCO_MOTORCYCLE))
         total = trucks + cars + buses + motorcycles
 
-        return VehicleCounts(
+        return VehicleCounts.model_construct(
             trucks=trucks,
             cars=cars,
             buses=buses,
@@ -247,7 +247,7 @@ class VisionService:
         buses = _noisy_count(profile["bus_base"])
         motorcycles = _noisy_count(profile["moto_base"])
 
-        return VehicleCounts(
+        return VehicleCounts.model_construct(
             trucks=trucks,
             cars=cars,
             buses=buses,
@@ -272,7 +272,7 @@ class VisionService:
         buses = round(alpha * new.buses + (1 - alpha) * prev.buses)
         motorcycles = round(alpha * new.motorcycles + (1 - alpha) * prev.motorcycles)
 
-        return VehicleCounts(
+        return VehicleCounts.model_construct(
             trucks=trucks,
             cars=cars,
             buses=buses,
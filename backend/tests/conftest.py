@@ -144,7 +144,7 @@ def app_state(mock_sensor, mock_sensor_b) -> dict:
     return {
         "sensors": sensors,
         "grid": grid,
-        "particles": [],
+        "particles": None,
         "stats": stats,
         "forecast": [],
         "services": {
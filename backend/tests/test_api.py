@@ -109,7 +109,7 @@ def _build_test_state() -> dict:
     return {
         "sensors": sensors,
         "grid": grid,
-        "particles": [],
+        "particles": None,
         "stats": stats,
         "forecast": [],
         "services": {
@@ -284,3 +284,94 @@ async def test_sensors_response_structure(test_app):
     # Pollution fields
     for pkey in ("pm25", "pm10", "no2", "co", "aqi", "category"):
         assert pkey in sensor["pollution"]
+
+
+@pytest.mark.asyncio
+async def test_stats_reused_within_a_state_version():
+    """GET /api/stats should serve the cached body until the version changes."""
+    app = _create_test_app()
+    state = _build_test_state()
+    state["version"] = 1
+    set_rest_state(state)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = (await client.get("/api/stats")).json()
+        state["stats"] = GlobalStats(active_sensors=99)
+        cached = (await client.get("/api/stats")).json()
+        state["version"] = 2
+        refreshed = (await client.get("/api/stats")).json()
+
+    assert cached == first
+    assert refreshed["active_sensors"] == 99
+
+
+def _build_test_soa(sensors: dict) -> dict:
+    """Fill a columnar snapshot from the test sensors, as the sim loop does."""
+    from main import new_sensor_soa, fill_sensor_soa
+
+    cameras = [{"id": s.id, "name": s.name} for s in sensors.values()]
+    soa = new_sensor_soa(cameras)
+    for i, sensor in enumerate(sensors.values()):
+        fill_sensor_soa(soa, i, sensor)
+    return soa
+
+
+def test_compute_global_stats_matches_sensor_state():
+    """compute_global_stats should aggregate the columnar snapshot."""
+    from main import compute_global_stats
+
+    state = _build_test_state()
+    stats = compute_global_stats(_build_test_soa(state["sensors"]))
+
+    assert stats.active_sensors == 2
+    assert stats.avg_aqi == 100.5
+    assert stats.avg_pm25 == 35.1
+    assert stats.avg_noise_db == 70.2
+    assert stats.total_vehicles_detected == 140
+    assert stats.healthiest_zone == "Connaught Place"
+    assert stats.most_polluted_zone == "India Gate"
+
+
+def test_compute_global_stats_empty():
+    """compute_global_stats should return defaults when no sensors exist."""
+    from main import compute_global_stats, new_sensor_soa
+
+    assert compute_global_stats(new_sensor_soa([])).active_sensors == 0
+
+
+@pytest.mark.asyncio
+async def test_health_impact_uses_columnar_snapshot():
+    """GET /api/health-impact should give the same summary from the snapshot."""
+    app = _create_test_app()
+    state = _build_test_state()
+    set_rest_state(state)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        from_list = (await client.get("/api/health-impact")).json()
+        state["sensors_soa"] = _build_test_soa(state["sensors"])
+        from_soa = (await client.get("/api/health-impact")).json()
+
+    assert from_soa["summary"] == from_list["summary"]
+
+
+@pytest.mark.asyncio
+async def test_versioned_endpoints_support_etag_revalidation():
+    """A matching If-None-Match should get an empty 304 until the version changes."""
+    app = _create_test_app()
+    state = _build_test_state()
+    state["version"] = 7
+    set_rest_state(state)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for path in ("/api/sensors", "/api/stats", "/api/grid"):
+            first = await client.get(path)
+            etag = first.headers["etag"]
+            revalidated = await client.get(path, headers={"If-None-Match": etag})
+            assert revalidated.status_code == 304
+            assert revalidated.content == b""
+
+        state["version"] = 8
+        changed = await client.get("/api/stats", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
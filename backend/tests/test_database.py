@@ -0,0 +1,87 @@
+"""
+Tests for the Eco-Lens persistence layer (database.py).
+
+Each test runs against a fresh SQLite file in a temporary directory.
+"""
+
+import sys
+import os
+
+import pytest
+import pytest_asyncio
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+import database
+from config import settings
+
+
+@pytest_asyncio.fixture
+async def temp_db(tmp_path, monkeypatch):
+    """Point the database module at a throwaway SQLite file."""
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setattr(database, "_async_engine", None)
+    monkeypatch.setattr(database, "_async_session_factory", None)
+    await database.init_db()
+    yield
+    await database.close_db()
+
+
+class TestSaveReadings:
+    @pytest.mark.asyncio
+    async def test_save_reading_round_trip(self, temp_db):
+        await database.save_reading("cam-001", pm25=42.0, aqi=117)
+
+        history = await database.get_history("cam-001", hours=1)
+        row = dict(zip(history["columns"], history["rows"][0]))
+
+        assert len(history["rows"]) == 1
+        assert row["pm25"] == 42.0
+        assert row["aqi"] == 117
+
+    @pytest.mark.asyncio
+    async def test_save_readings_batch_inserts_all_rows(self, temp_db):
+        await database.save_readings_batch([
+            {"sensor_id": "cam-001", "pm25": 42.0, "aqi": 117},
+            {"sensor_id": "cam-002", "pm25": 28.0, "aqi": 84},
+        ])
+
+        latest = await database.get_latest_readings()
+
+        assert set(latest) == {"cam-001", "cam-002"}
+        assert latest["cam-002"]["pm25"] == 28.0
+        assert latest["cam-002"]["temperature"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_save_readings_batch_ignores_empty_input(self, temp_db):
+        await database.save_readings_batch([])
+
+        assert await database.get_latest_readings() == {}
+
+
+class TestLatestReadings:
+    @pytest.mark.asyncio
+    async def test_returns_newest_row_per_sensor(self, temp_db):
+        await database.save_reading("cam-001", pm25=10.0)
+        await database.save_reading("cam-001", pm25=20.0)
+        await database.save_reading("cam-002", pm25=30.0)
+
+        latest = await database.get_latest_readings()
+
+        assert latest["cam-001"]["pm25"] == 20.0
+        assert latest["cam-002"]["pm25"] == 30.0
+
+
+class TestEngine:
+    @pytest.mark.asyncio
+    async def test_sqlite_pragmas_applied(self, temp_db):
+        async with database._get_engine().connect() as conn:
+            journal = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+            synchronous = (await conn.exec_driver_sql("PRAGMA synchronous")).scalar()
+            temp_store = (await conn.exec_driver_sql("PRAGMA temp_store")).scalar()
+
+        assert journal == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2   # MEMORY
@@ -9,6 +9,7 @@ import sys
 import os
 from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 _BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -23,6 +24,7 @@ from models import (
     HealthData,
     SensorData,
     GridData,
+    ParticleData,
     ForecastPoint,
     GreenRoute,
 )
@@ -35,6 +37,15 @@ from services import (
     RoutingService,
     MeshService,
 )
+from services.health_service import RISK_RANK
+from services.mesh_service import (
+    _haversine,
+    _haversine_grid,
+    _haversine_matrix,
+    _variogram_matrix_broadcast,
+    _variogram_matrix_kernel,
+)
+from services.physics_engine import new_particle_batch, particles_to_records
 
 
 # ===================================================================
@@ -222,11 +233,27 @@ class TestPhysicsEngine:
             sensor_id="cam-001", lat=28.6129, lng=77.2295,
             pollution=pollution, weather=weather, count=10,
         )
-        assert len(particles) == 10
-        for p in particles:
-            assert p.source_id == "cam-001"
-            assert p.concentration >= 0.0
-            assert p.age >= 0.0
+        assert len(particles["x"]) == 10
+        assert (particles["source_id"] == "cam-001").all()
+        assert (particles["concentration"] >= 0.0).all()
+        assert (particles["age"] >= 0.0).all()
+
+    def test_generate_particles_fills_slice_of_shared_batch(self):
+        engine = PhysicsEngine()
+        pollution = PollutionData(pm25=40.0, pm10=70.0, no2=30.0, co=400.0, aqi=112, category="USG")
+        weather = WeatherData(wind_speed=3.0, wind_direction=220.0, temperature=30.0, humidity=55.0)
+        batch = new_particle_batch(8)
+        for i, cam_id in enumerate(("cam-001", "cam-002")):
+            engine.generate_particles(
+                sensor_id=cam_id, lat=28.6, lng=77.2,
+                pollution=pollution, weather=weather, count=4, out=batch, start=i * 4,
+            )
+
+        records = particles_to_records(batch)
+        assert [p["source_id"] for p in records] == ["cam-001"] * 4 + ["cam-002"] * 4
+        assert records[5]["x"] == batch["x"][5]
+        assert abs(records[0]["x"] - 77.2) < 0.01
+        ParticleData.model_validate(records[0])
 
 
 # ===================================================================
@@ -274,6 +301,73 @@ class TestAcousticService:
         valid_categories = {"Quiet", "Moderate", "Loud", "Very Loud", "Extreme"}
         assert result.category in valid_categories
 
+    def test_db_add_is_energy_sum(self):
+        from services.acoustic_service import _db_add
+
+        # Two equal incoherent sources add ~3 dB; non-positive slots are ignored
+        assert _db_add(np.array([60.0, 60.0, 0.0])) == pytest.approx(63.0103, abs=1e-3)
+        assert _db_add(np.zeros(3)) == 0.0
+
+    def test_noise_grid_is_loudest_near_source(self):
+        service = AcousticService()
+        bounds = {"north": 28.70, "south": 28.60, "east": 77.30, "west": 77.20}
+        sensors = [{"lat": 28.695, "lng": 77.205, "db_level": 80.0}]
+        grid = service.calculate_noise_grid(sensors, bounds, resolution=10)
+        assert len(grid.values) == 10
+        assert all(len(row) == 10 for row in grid.values)
+        # Source sits in the north-west cell; the far corner is at ambient
+        assert grid.values[0][0] > grid.values[-1][-1]
+        assert grid.values[-1][-1] >= 35.0
+
+    def test_noise_grid_broadcast_matches_loop_kernel(self):
+        from services.acoustic_service import _noise_grid_broadcast, _noise_grid_kernel
+
+        lats = np.array([28.61, 28.63, 28.65])
+        lngs = np.array([77.21, 77.24, 77.30])
+        dbs = np.array([70.0, 82.0, 65.0])
+        args = (lats, lngs, dbs, np.cos(np.radians(lats)), 28.70, 77.05, 0.0075, 0.015, 12)
+        np.testing.assert_allclose(
+            _noise_grid_broadcast(*args, np.empty((12, 12))),
+            _noise_grid_kernel(*args, np.empty((12, 12))),
+            rtol=1e-12,
+        )
+
+    def test_noise_grid_reuses_buffer_between_calls(self):
+        service = AcousticService()
+        bounds = {"north": 28.70, "south": 28.60, "east": 77.30, "west": 77.20}
+        loud = service.calculate_noise_grid(
+            [{"lat": 28.65, "lng": 77.25, "db_level": 90.0}], bounds, resolution=8
+        )
+        buf = service._grid_buf[8]
+        quiet = service.calculate_noise_grid(
+            [{"lat": 28.65, "lng": 77.25, "db_level": 50.0}], bounds, resolution=8
+        )
+
+        assert service._grid_buf[8] is buf
+        # Returned values are copies, so the earlier grid is unaffected
+        assert loud.values[4][4] > quiet.values[4][4]
+
+    def test_estimate_noise_fast_matches_estimate_noise(self):
+        import random
+
+        service = AcousticService()
+        vehicles = VehicleCounts(trucks=3, cars=40, buses=0, motorcycles=7, total=50)
+        single = service.precompute_single_levels()
+        random.seed(7)
+        expected = service.estimate_noise(vehicles)
+        random.seed(7)
+        assert service.estimate_noise_fast(vehicles, single) == expected
+
+    def test_estimate_noise_fast_applies_given_jitter(self):
+        service = AcousticService()
+        vehicles = VehicleCounts(trucks=3, cars=40, buses=0, motorcycles=7, total=50)
+        single = service.precompute_single_levels()
+
+        base = service.estimate_noise_fast(vehicles, single, jitter=0.0).db_level
+        shifted = service.estimate_noise_fast(vehicles, single, jitter=1.5).db_level
+
+        assert shifted == pytest.approx(base + 1.5, abs=0.11)
+
     def test_zero_vehicles_returns_ambient(self):
         """With zero vehicles, noise should reflect ambient background only."""
         service = AcousticService()
@@ -282,6 +376,22 @@ class TestAcousticService:
         # Ambient background is ~45 dB plus some noise; result should be >= 30 dB
         assert result.db_level >= 30.0
 
+    def test_categorize_noise_boundaries(self):
+        """A level equal to a category bound belongs to the next category."""
+        categorize = AcousticService._categorize_noise
+        assert categorize(44.9) == "Quiet"
+        assert categorize(45.0) == "Moderate"
+        assert categorize(64.9) == "Loud"
+        assert categorize(75.0) == "Extreme"
+        assert categorize(1200.0) == "Extreme"
+
+    def test_status_is_built_once(self):
+        service = AcousticService()
+        status = service.get_status()
+        assert status["service"] == "AcousticService"
+        assert set(status["reference_levels"]) == {"trucks", "cars", "buses", "motorcycles"}
+        assert service.get_status() is status
+
 
 # ===================================================================
 # HealthService
@@ -313,6 +423,31 @@ class TestHealthService:
         assert result.score >= 80
         assert result.risk_level == "Low"
 
+    def test_batch_scores_match_scalar(self):
+        service = HealthService()
+        rng = np.random.default_rng(2)
+        pm25, pm10, no2 = rng.uniform(0, 250, (3, 200))
+        noise = rng.uniform(30, 95, 200)
+
+        batch = service._compute_health_scores_batch(pm25, pm10, no2, noise)
+        expected = [
+            service._compute_health_score(a, b, c, d)
+            for a, b, c, d in zip(pm25.tolist(), pm10.tolist(), no2.tolist(), noise.tolist())
+        ]
+        assert batch.tolist() == expected
+
+    def test_health_impact_batch_matches_scalar(self):
+        service = HealthService()
+        pollutions = [
+            PollutionData(pm25=42.0, pm10=78.0, no2=35.0, co=450.0, aqi=117, category="USG"),
+            PollutionData(pm25=3.0, pm10=8.0, no2=5.0, co=100.0, aqi=12, category="Good"),
+        ]
+        noises = [NoiseData(db_level=72.0, category="Very Loud"), NoiseData(db_level=40.0, category="Quiet")]
+
+        batch = service.calculate_health_impact_batch(pollutions, noises)
+        single = [service.calculate_health_impact(p, n) for p, n in zip(pollutions, noises)]
+        assert [h.model_dump() for h in batch] == [h.model_dump() for h in single]
+
     def test_dirty_air_gives_low_score(self):
         service = HealthService()
         pollution = PollutionData(pm25=200.0, pm10=300.0, no2=150.0, co=2000.0, aqi=300, category="Hazardous")
@@ -355,6 +490,55 @@ class TestHealthService:
         assert isinstance(result.vulnerable_advisory, str)
         assert len(result.vulnerable_advisory) > 0
 
+    def test_advisory_notes_follow_band_and_exposure(self):
+        advisory = HealthService._generate_advisory
+        assert advisory(85, 80.0, 90.0) == "Safe for all groups"
+        assert advisory(65, 10.0, 71.0).endswith("Hearing protection recommended for extended exposure")
+        assert "Hearing" not in advisory(65, 10.0, 70.0)
+        assert advisory(45, 56.0, 90.0).endswith("Consider wearing N95 masks outdoors")
+        assert "N95" not in advisory(45, 55.0, 90.0)
+        assert advisory(25, 80.0, 90.0).startswith("Health alert")
+        assert advisory(0, 80.0, 90.0).startswith("Emergency conditions")
+
+    def test_advisory_without_notes_is_the_band_literal(self):
+        advisory = HealthService._generate_advisory
+        assert advisory(65, 10.0, 70.0) is advisory(65, 80.0, 10.0)
+        assert advisory(45, 10.0, 90.0) is advisory(45, 55.0, 10.0)
+        assert advisory(65, 10.0, 71.0) is advisory(65, 10.0, 90.0)
+
+    def test_risk_level_boundaries(self):
+        levels = [HealthService._determine_risk_level(s) for s in (0, 19, 20, 39, 40, 59, 60, 79, 80, 100)]
+        assert levels == [
+            "Severe", "Severe", "Very High", "Very High", "High",
+            "High", "Moderate", "Moderate", "Low", "Low",
+        ]
+        batch = HealthService._risk_levels_batch(np.array([0, 20, 40, 60, 80, 100]))
+        assert batch.tolist() == ["Severe", "Very High", "High", "Moderate", "Low", "Low"]
+
+    def test_risk_levels_are_the_interned_constants(self):
+        import sys
+
+        service = HealthService()
+        pollution = PollutionData(pm25=60.0, pm10=78.0, no2=35.0, co=450.0, aqi=117, category="USG")
+        noise = NoiseData(db_level=72.0, category="Very Loud")
+
+        level = service.calculate_health_impact(pollution, noise).risk_level
+        assert level == "Very High"
+        assert level is sys.intern("Very High")
+
+    def test_cumulative_dose_scalar_and_batch_updates_share_state(self):
+        service = HealthService()
+        assert service.get_cumulative_dose("cam-001") == 0.0
+
+        assert service.update_cumulative_dose("cam-001", 40.0, 0.5) == 20.0
+        service.update_cumulative_dose_batch(
+            ["cam-001", "cam-002", "cam-001"], np.array([10.0, 30.0, 20.0]), 1.0,
+        )
+
+        assert service.get_cumulative_dose("cam-001") == 50.0
+        assert service.get_cumulative_dose("cam-002") == 30.0
+        assert service.get_status()["tracked_doses"] == 2
+
     def test_aggregate_health_summary(self):
         service = HealthService()
         health_list = [
@@ -367,6 +551,41 @@ class TestHealthService:
         assert summary["avg_score"] == 65
         assert summary["avg_equivalent_cigarettes"] == 1.5
 
+    def test_aggregate_summary_matches_array_form(self):
+        service = HealthService()
+        health_list = [
+            HealthData(score=80, risk_level="Low", equivalent_cigarettes=0.5),
+            HealthData(score=35, risk_level="Very High", equivalent_cigarettes=4.2),
+            HealthData(score=50, risk_level="High", equivalent_cigarettes=2.5),
+        ]
+
+        summary = service.get_aggregate_health_summary(health_list)
+        from_arrays = service.aggregate_health_arrays(
+            np.array([h.score for h in health_list], dtype=np.float64),
+            np.array([h.equivalent_cigarettes for h in health_list]),
+            np.array([RISK_RANK[h.risk_level] for h in health_list], dtype=np.int8),
+        )
+        assert summary == from_arrays
+        assert service.get_aggregate_health_summary([])["sensor_count"] == 0
+
+    def test_large_aggregate_summary_matches_small_path(self):
+        service = HealthService()
+        health_list = [
+            HealthData(score=80, risk_level="Low", equivalent_cigarettes=0.5),
+            HealthData(score=35, risk_level="Very High", equivalent_cigarettes=4.2),
+            HealthData(score=50, risk_level="High", equivalent_cigarettes=2.5),
+        ]
+        small = service.get_aggregate_health_summary(health_list)
+
+        large = service.get_aggregate_health_summary(health_list * 100)
+
+        assert large["sensor_count"] == 300
+        assert large["advisory_count_by_level"] == {
+            level: 100 * c for level, c in small["advisory_count_by_level"].items()
+        }
+        for key in ("avg_score", "worst_risk_level", "avg_equivalent_cigarettes"):
+            assert large[key] == small[key]
+
 
 # ===================================================================
 # ForecastService
@@ -387,6 +606,55 @@ class TestForecastService:
         assert len(result) > 0
         assert all(isinstance(p, ForecastPoint) for p in result)
 
+    def test_holt_winters_reproduces_pure_seasonal_pattern(self):
+        service = ForecastService()
+        season = [30.0 + (h % 6) for h in range(24)]
+
+        forecasts, mse, n_resid = service._holt_winters(season * 3, 24, 0.3, 0.1, 0.2)
+
+        assert len(forecasts) == 24
+        assert n_resid == 48
+        assert forecasts == pytest.approx(season)
+        assert mse == pytest.approx(0.0, abs=1e-12)
+
+    def test_holt_winters_kernel_matches_method(self):
+        from services.forecast_service import _hw_init, _hw_kernel
+
+        service = ForecastService()
+        rng = np.random.default_rng(3)
+        data = (40.0 + 8.0 * np.sin(np.arange(72) * 2 * np.pi / 24) + rng.normal(0, 2, 72)).tolist()
+
+        forecasts, mse, n_resid = service._holt_winters(data, 24, 0.3, 0.1, 0.2)
+        k_forecasts, k_mse, k_n_resid = _hw_kernel(
+            np.asarray(data), 24, 0.3, 0.1, 0.2, *_hw_init(data, 24)
+        )
+
+        # Same initialization and operation order, so the results are identical
+        np.testing.assert_array_equal(k_forecasts, forecasts)
+        assert k_mse == mse
+        assert k_n_resid == n_resid == 48
+
+    def test_holt_winters_matches_full_trajectory_reference(self):
+        """Scalar level/trend and the m-slot seasonal ring lose no information."""
+        rng = np.random.default_rng(11)
+        data = (30.0 + 6.0 * np.cos(np.arange(60) * 2 * np.pi / 24) + rng.normal(0, 1, 60)).tolist()
+        m, alpha, beta, gamma = 24, 0.3, 0.1, 0.2
+
+        levels = [sum(data[:m]) / m]
+        trends = [sum(data[m + i] - data[i] for i in range(m)) / (m * m)]
+        seasonals = [v - levels[0] for v in data[:m]]
+        for t in range(m, len(data)):
+            levels.append(alpha * (data[t] - seasonals[t - m]) + (1 - alpha) * (levels[-1] + trends[-1]))
+            trends.append(beta * (levels[-1] - levels[-2]) + (1 - beta) * trends[-1])
+            seasonals.append(gamma * (data[t] - levels[-1]) + (1 - gamma) * seasonals[t - m])
+        expected = [
+            levels[-1] + h * trends[-1] + seasonals[len(data) - m + (h - 1) % m]
+            for h in range(1, m + 1)
+        ]
+
+        forecasts, _, _ = ForecastService()._holt_winters(data, m, alpha, beta, gamma)
+        assert forecasts == pytest.approx(expected, rel=1e-12)
+
     def test_forecast_point_count(self):
         """6 hours at 30-minute intervals = 12 forecast points."""
         service = ForecastService()
@@ -427,6 +695,43 @@ class TestForecastService:
         last_width = result[-1].confidence_upper - result[-1].confidence_lower
         assert last_width > first_width, "Confidence intervals should widen for further forecasts"
 
+    def test_forecast_points_hold_plain_floats(self):
+        """Vectorized predictions are unboxed before building the points."""
+        service = ForecastService()
+        for _ in range(30):
+            service.record_observation("cam-001", 45.0)
+
+        point = service.generate_forecast("cam-001", hours_ahead=1, interval_minutes=30)[0]
+        assert type(point.predicted_pm25) is float
+        assert type(point.confidence_upper) is float
+        assert point.model_dump_json()
+
+    def test_seeded_generator_makes_forecast_repeatable(self):
+        from datetime import datetime, timedelta, timezone
+
+        # Holt-Winters path: independent of the wall-clock hour
+        service = ForecastService()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for h in range(48):
+            service.add_reading("cam-001", start + timedelta(hours=h), 30.0 + (h % 24))
+
+        runs = []
+        for _ in range(2):
+            service._rng = np.random.default_rng(7)
+            runs.append([
+                p.predicted_pm25
+                for p in service.generate_forecast("cam-001", hours_ahead=2, interval_minutes=30)
+            ])
+        assert runs[0] == runs[1]
+
+    def test_vectorized_hour_adjustment_matches_scalar(self):
+        hours = np.linspace(0.0, 23.99, 97)
+        expected = [ForecastService._hour_of_day_adjustment(h) for h in hours.tolist()]
+
+        np.testing.assert_allclose(
+            ForecastService._hour_of_day_adjustment_vec(hours), expected, rtol=1e-12,
+        )
+
     def test_no_observations_returns_fallback_forecast(self):
         """Even with no observations, a forecast should be generated (using defaults)."""
         service = ForecastService()
@@ -434,11 +739,176 @@ class TestForecastService:
         assert isinstance(result, list)
         assert len(result) == 2
 
+    def test_history_ring_buffer_keeps_newest_values_in_order(self):
+        from services.forecast_service import _RingBuffer
+
+        ring = _RingBuffer(4)
+        for x in range(6):
+            ring.append(float(x))
+
+        assert len(ring) == 4
+        assert ring.latest().tolist() == [2.0, 3.0, 4.0, 5.0]
+        assert ring.latest(3).tolist() == [3.0, 4.0, 5.0]
+
+    def test_readings_are_stored_as_float32(self):
+        service = ForecastService()
+        service.record_observation("cam-001", 42.5)
+
+        state = service._sensors["cam-001"]
+        assert state.hourly.latest().dtype == np.float32
+        assert state.residuals.latest().dtype == np.float64
+
+    def test_history_length_is_capped(self):
+        from services.forecast_service import _MAX_HISTORY
+
+        service = ForecastService()
+        for _ in range(_MAX_HISTORY + 5):
+            service.record_observation("cam-001", 40.0)
+
+        assert service.get_history_length("cam-001") == _MAX_HISTORY
+        assert service.get_status()["history_lengths"]["cam-001"] == _MAX_HISTORY
+
+    def test_ring_buffer_latest_is_a_view_after_wrapping(self):
+        from services.forecast_service import _RingBuffer
+
+        ring = _RingBuffer(4)
+        for x in range(7):
+            ring.append(float(x))
+
+        latest = ring.latest()
+        assert latest.tolist() == [3.0, 4.0, 5.0, 6.0]
+        assert latest.base is not None
+
+    def test_hourly_history_is_capped_at_72_hours(self):
+        from datetime import datetime, timedelta, timezone
+
+        service = ForecastService()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for h in range(80):
+            service.add_reading("cam-001", start + timedelta(hours=h), float(h))
+
+        assert service.get_hourly_history_length("cam-001") == 72
+        assert service._sensors["cam-001"].hourly.latest()[0] == 8.0
+
+    def test_residual_std_tracks_rolling_window(self):
+        service = ForecastService()
+        rng = np.random.default_rng(5)
+        for x in 40.0 + rng.normal(0, 6.0, 500):
+            service.record_observation("cam-001", float(x))
+
+        window = service._sensors["cam-001"].residuals.latest()
+        assert window.size == 60
+        assert service._compute_residual_std("cam-001") == pytest.approx(float(window.std()))
+
+    def test_residual_std_defaults_with_few_observations(self):
+        service = ForecastService()
+        for _ in range(5):
+            service.record_observation("cam-001", 40.0)
+        assert service._compute_residual_std("cam-001") == 3.0
+
+    def test_hour_rollover_commits_hourly_mean(self, monkeypatch):
+        from services import forecast_service
+
+        clock = [10 * 3600 + 5.0]
+        monkeypatch.setattr(forecast_service, "_time", lambda: clock[0])
+        service = ForecastService()
+        service.record_observation("cam-001", 30.0)
+        service.record_observation("cam-001", 50.0)
+
+        clock[0] += 3600
+        service.record_observation("cam-001", 99.0)
+
+        state = service._sensors["cam-001"]
+        assert state.hourly.latest().tolist() == [40.0]
+        assert state.hourly_ts.latest().tolist() == [10 * 3600]
+
+    def test_hourly_accumulator_restarts_after_a_gap(self, monkeypatch):
+        from services import forecast_service
+
+        clock = [10 * 3600 + 5.0]
+        monkeypatch.setattr(forecast_service, "_time", lambda: clock[0])
+        service = ForecastService()
+        service.record_observation("cam-001", 30.0)
+
+        # Three silent hours: only the hour that saw readings is committed
+        clock[0] += 3 * 3600
+        service.record_observation("cam-001", 60.0)
+
+        state = service._sensors["cam-001"]
+        assert state.hourly.latest().tolist() == [30.0]
+        assert (state.hour_sum, state.hour_n, state.last_hour) == (60.0, 1, 13)
+
+    def test_generate_forecast_uses_full_hourly_history(self):
+        from datetime import datetime, timedelta, timezone
+
+        service = ForecastService()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for h in range(72):
+            service.add_reading("cam-001", start + timedelta(hours=h), 30.0 + (h % 24))
+
+        result = service.generate_forecast("cam-001", hours_ahead=3, interval_minutes=60)
+
+        # Holt-Winters continues the seasonal ramp into the next day
+        assert [p.predicted_pm25 for p in result] == pytest.approx([30.0, 31.0, 32.0], abs=0.2)
+
+    def test_forecast_arrays_are_columnar(self):
+        service = ForecastService()
+        for _ in range(30):
+            service.record_observation("cam-001", 45.0)
+
+        arrays = service.generate_forecast_arrays("cam-001", hours_ahead=6, interval_minutes=30)
+
+        assert arrays["timestamps"].dtype == np.int64
+        assert arrays["predicted"].dtype == np.float32
+        assert all(len(col) == 12 for col in arrays.values())
+        assert np.all(np.diff(arrays["timestamps"]) == 30 * 60_000)
+        assert np.all(arrays["lower"] <= arrays["predicted"])
+        assert np.all(arrays["upper"] >= arrays["predicted"])
+
+    def test_holt_winters_fit_is_reused_until_next_hourly_bin(self, monkeypatch):
+        from datetime import datetime, timedelta, timezone
+
+        service = ForecastService()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for h in range(48):
+            service.add_reading("cam-001", start + timedelta(hours=h), 30.0 + (h % 24))
+
+        calls = []
+        fit = service._holt_winters
+        monkeypatch.setattr(service, "_holt_winters", lambda *a: calls.append(1) or fit(*a))
+
+        service.generate_forecast("cam-001")
+        service.generate_forecast("cam-001")
+        assert len(calls) == 1
+
+        service.add_reading("cam-001", start + timedelta(hours=48), 30.0)
+        service.generate_forecast("cam-001")
+        assert len(calls) == 2
+
+    def test_bulk_forecast_covers_every_sensor(self):
+        from datetime import datetime, timedelta, timezone
+
+        service = ForecastService()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for h in range(72):
+            service.add_reading("cam-001", start + timedelta(hours=h), 30.0 + (h % 24))
+        for _ in range(30):
+            service.record_observation("cam-002", 45.0)
+
+        result = service.generate_forecasts_bulk(
+            ["cam-001", "cam-002", "cam-never-seen"], hours_ahead=3, interval_minutes=60,
+        )
+
+        assert list(result) == ["cam-001", "cam-002", "cam-never-seen"]
+        assert all(len(points) == 3 for points in result.values())
+        # Seasonal sensor gets the same Holt-Winters forecast as the single path
+        assert [p.predicted_pm25 for p in result["cam-001"]] == pytest.approx([30.0, 31.0, 32.0], abs=0.2)
+
     def test_record_observation_updates_level(self):
         service = ForecastService()
         service.record_observation("cam-001", 50.0)
         # After one observation, the level should be close to 50
-        assert abs(service._level["cam-001"] - 50.0) < 1.0
+        assert abs(service._sensors["cam-001"].level - 50.0) < 1.0
 
 
 # ===================================================================
@@ -526,6 +996,153 @@ class TestMeshService:
         result = service.generate_grid(sensors, bounds=custom_bounds, resolution=5)
         assert result.bounds == custom_bounds
 
+    def test_kriging_honours_sensor_values(self):
+        service = MeshService()
+        sensors = self._make_sensors()
+        locations = [(s.lat, s.lng) for s in sensors]
+        values = [s.pollution.pm25 for s in sensors]
+        vparams = service._calculate_semivariogram(locations, values)
+
+        system = service._factor_kriging_system(locations, vparams)
+
+        assert system is not None
+        estimates = service._solve_kriging(
+            system, locations, values,
+            np.array([loc[0] for loc in locations]),
+            np.array([loc[1] for loc in locations]),
+            vparams,
+        )
+        np.testing.assert_allclose(estimates, values, atol=1e-6)
+
+    def test_vectorized_variogram_matches_scalar(self):
+        lags = np.array([0.0, 50.0, 400.0, 999.0, 1000.0, 2500.0])
+
+        gamma = MeshService._spherical_variogram_np(lags, 2.0, 30.0, 1000.0)
+
+        expected = [MeshService._spherical_variogram(h, 2.0, 30.0, 1000.0) for h in lags]
+        np.testing.assert_allclose(gamma, expected, rtol=1e-12)
+
+    def test_semivariogram_of_uniform_field_is_flat(self):
+        service = MeshService()
+        locations = [(28.60 + 0.01 * i, 77.20 + 0.02 * (i % 3)) for i in range(8)]
+
+        vparams = service._calculate_semivariogram(locations, [30.0] * 8)
+
+        assert vparams["nugget"] == 0.0
+        assert vparams["sill"] == 1.0
+        assert vparams["range_param"] >= 100.0
+
+    def test_vectorized_aqi_matches_scalar_breakpoints(self):
+        pm25 = np.array([-3.0, 0.0, 12.0, 12.05, 12.1, 35.4, 35.45, 55.5, 150.4, 500.4, 612.0])
+
+        aqi = MeshService._pm25_to_aqi_np(pm25)
+
+        assert aqi.tolist() == [float(MeshService._pm25_to_aqi(v)) for v in pm25]
+
+    def test_aqi_grid_converts_pm25_grid(self):
+        service = MeshService()
+        sensors = self._make_sensors()
+
+        pm25_grid = service.generate_grid(sensors, resolution=6)
+        aqi_grid = service.generate_aqi_grid(sensors, resolution=6)
+
+        assert aqi_grid.values == [
+            [float(MeshService._pm25_to_aqi(v)) for v in row] for row in pm25_grid.values
+        ]
+
+    def test_haversine_grid_matches_flattened_matrix(self):
+        lats = np.array([28.6129, 28.6315, 28.5733])
+        lngs = np.array([77.2295, 77.2167, 77.0659])
+        cell_lats = np.array([28.70, 28.65, 28.60, 28.55])
+        cell_lngs = np.array([77.05, 77.20, 77.35])
+
+        grid = _haversine_grid(lats, lngs, cell_lats, cell_lngs)
+
+        flat = _haversine_matrix(
+            lats, lngs, np.repeat(cell_lats, 3), np.tile(cell_lngs, 4)
+        )
+        assert grid.shape == (3, 12)
+        np.testing.assert_allclose(grid, flat, rtol=1e-12)
+
+    def test_variogram_kernel_matches_broadcast(self):
+        """The Numba kernel (run interpreted here) agrees with the NumPy path."""
+        lats = np.array([28.6129, 28.6315, 28.5733, 28.6506])
+        lngs = np.array([77.2295, 77.2167, 77.0659, 77.2302])
+        targets_lat = np.array([28.6129, 28.60, 28.70])
+        targets_lng = np.array([77.2295, 77.20, 77.30])
+        args = (lats, lngs, targets_lat, targets_lng, 2.0, 30.0, 5000.0)
+
+        looped = _variogram_matrix_kernel(*args, np.empty((4, 3)))
+        broadcast = _variogram_matrix_broadcast(*args, np.empty((4, 3)))
+
+        assert looped[0, 0] == 0.0
+        np.testing.assert_allclose(looped, broadcast, rtol=1e-12)
+
+    def test_vectorized_variogram_accepts_scalars(self):
+        for h in (0.0, 250.0, 5000.0):
+            gamma = MeshService._spherical_variogram_np(h, 2.0, 30.0, 1000.0)
+            assert float(gamma) == MeshService._spherical_variogram(h, 2.0, 30.0, 1000.0)
+
+    def test_local_kriging_with_every_sensor_matches_global(self):
+        service = MeshService()
+        sensors = self._make_sensors()
+        locations = [(s.lat, s.lng) for s in sensors]
+        values = [s.pollution.pm25 for s in sensors]
+        vparams = service._calculate_semivariogram(locations, values)
+        lats = np.array([28.60, 28.62, 28.64])
+        lngs = np.array([77.10, 77.22, 77.30])
+
+        local = service._local_kriging(locations, values, lats, lngs, vparams, k=len(sensors))
+
+        system = service._factor_kriging_system(locations, vparams)
+        expected = service._solve_kriging(system, locations, values, lats, lngs, vparams)
+        np.testing.assert_allclose(local, expected, rtol=1e-6)
+
+    def test_dense_network_uses_moving_window(self):
+        service = MeshService()
+        base = self._make_sensors()[0]
+        rng = np.random.default_rng(7)
+        sensors = [
+            base.model_copy(update={
+                "id": f"cam-{i:03d}",
+                "lat": 28.55 + 0.15 * rng.random(),
+                "lng": 77.05 + 0.30 * rng.random(),
+                "pollution": PollutionData(pm25=float(10 + 60 * rng.random())),
+            })
+            for i in range(250)
+        ]
+
+        result = service.generate_grid(sensors, resolution=10)
+
+        flat = [v for row in result.values for v in row]
+        assert len(flat) == 100
+        assert all(0.0 <= v <= 80.0 for v in flat)
+
+    def test_colocated_sensors_fall_back_to_idw(self):
+        service = MeshService()
+        sensors = self._make_sensors()
+        sensors.append(sensors[0].model_copy(update={"id": "cam-007"}))
+        locations = [(s.lat, s.lng) for s in sensors]
+        values = [s.pollution.pm25 for s in sensors]
+        vparams = service._calculate_semivariogram(locations, values)
+
+        assert service._factor_kriging_system(locations, vparams) is None
+        result = service.generate_grid(sensors, resolution=5)
+        assert all(v >= 0.0 for row in result.values for v in row)
+
+    def test_haversine_matrix_matches_scalar_haversine(self):
+        lats = np.array([28.6129, 28.6315, 28.5733])
+        lngs = np.array([77.2295, 77.2167, 77.0659])
+
+        dist = _haversine_matrix(lats, lngs, lats[:2], lngs[:2])
+
+        assert dist.shape == (3, 2)
+        for i in range(3):
+            for j in range(2):
+                assert dist[i, j] == pytest.approx(
+                    _haversine(lats[i], lngs[i], lats[j], lngs[j]), abs=1e-9
+                )
+
 
 # ===================================================================
 # RoutingService
@@ -593,6 +1210,24 @@ class TestRoutingService:
         assert result.estimated_exposure >= 0
         assert result.avg_pollution >= 0
 
+    def test_update_sensors_skips_same_version(self):
+        service = RoutingService()
+        service.update_sensors(self._make_sensors(), version=1)
+        service.update_sensors([], version=1)
+        assert service.get_status()["sensors_cached"] == 2
+        service.update_sensors([], version=2)
+        assert service.get_status()["sensors_cached"] == 0
+
+    def test_interpolation_matches_haversine_idw(self):
+        service = RoutingService()
+        sensors = self._make_sensors()
+        service.update_sensors(sensors)
+
+        weights = [1.0 / max(_haversine(28.62, 77.22, s.lat, s.lng), 0.01) ** 2 for s in sensors]
+        expected = sum(w * s.pollution.pm25 for w, s in zip(weights, sensors)) / sum(weights)
+
+        assert service._interpolate_pollution_at(28.62, 77.22) == pytest.approx(expected, rel=1e-12)
+
     def test_route_without_sensors_uses_default_pollution(self):
         """Even with no sensors, routing should not crash."""
         service = RoutingService()
@@ -0,0 +1,331 @@
+"""
+Tests for the Eco-Lens WebSocket handler (api/ws_handler.py).
+
+Exercises frame construction and the connection manager directly,
+without opening real sockets.
+"""
+
+import sys
+import os
+import json
+import zlib
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_DIR not in sys.path:
+    sys.path.insert(0, _BACKEND_DIR)
+
+from api import ws_handler
+from models import WebSocketDelta, WebSocketMessage
+from services.physics_engine import new_particle_batch
+from api.ws_handler import (
+    CLIENT_QUEUE_SIZE,
+    ConnectionManager,
+    _build_ws_delta,
+    _build_ws_message,
+    broadcast_update,
+    broadcaster_loop,
+    has_active_clients,
+    notify_update,
+    set_state as set_ws_state,
+)
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.sent: list = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_bytes(self, data: bytes) -> None:
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(data)
+
+
+async def _drain() -> None:
+    """Let relay tasks flush their queues."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def ws_state(app_state) -> dict:
+    """Inject the shared mock state into the WebSocket handler."""
+    state = dict(app_state, version=1)
+    set_ws_state(state)
+    return state
+
+
+class TestBuildWsMessage:
+    def test_frame_contains_current_sensors(self, ws_state):
+        frame = json.loads(_build_ws_message())
+        assert frame["type"] == "sensor_update"
+        assert {s["id"] for s in frame["sensors"]} == {"cam-001", "cam-002"}
+
+    def test_frame_uses_published_sensor_order(self, ws_state):
+        ws_state["sensor_list"] = list(ws_state["sensors"].values())[::-1]
+        frame = json.loads(_build_ws_message())
+        assert [s["id"] for s in frame["sensors"]] == ["cam-002", "cam-001"]
+
+    def test_frame_is_reused_within_a_version(self, ws_state):
+        first = _build_ws_message()
+        assert _build_ws_message() is first
+
+    def test_frame_is_rebuilt_when_version_changes(self, ws_state):
+        first = _build_ws_message()
+        ws_state["version"] += 1
+        assert _build_ws_message() is not first
+
+    def test_frame_matches_message_schema(self, ws_state):
+        batch = new_particle_batch(3)
+        for name in ("x", "y", "vx", "vy", "concentration", "age"):
+            batch[name][:] = 0.5
+        batch["source_id"][:] = "cam-001"
+        ws_state["particles"] = batch
+
+        frame = WebSocketMessage.model_validate_json(_build_ws_message())
+        assert [p.source_id for p in frame.particles] == ["cam-001"] * 3
+
+    def test_frame_uses_cycle_timestamp(self, ws_state):
+        ws_state["timestamp_iso"] = "2025-01-01T00:00:00+00:00"
+        frame = json.loads(_build_ws_message())
+        assert frame["timestamp"] == "2025-01-01T00:00:00+00:00"
+
+
+class TestBuildWsDelta:
+    def test_delta_carries_only_dirty_sensors(self, ws_state):
+        ws_state["dirty"] = {"sensors": ["cam-002"], "grid": False}
+        frame = json.loads(_build_ws_delta())
+        assert frame["type"] == "sensor_delta"
+        assert [s["id"] for s in frame["sensors"]] == ["cam-002"]
+        assert frame["grid"] is None
+
+    def test_delta_includes_grid_when_rebuilt(self, ws_state):
+        ws_state["dirty"] = {"sensors": [], "grid": True}
+        frame = json.loads(_build_ws_delta())
+        assert frame["sensors"] == []
+        assert frame["grid"] is not None
+        assert frame["stats"]["active_sensors"] == 2
+
+    def test_delta_matches_delta_schema(self, ws_state):
+        ws_state["dirty"] = {"sensors": ["cam-001"], "grid": False}
+        WebSocketDelta.model_validate_json(_build_ws_delta())
+
+    def test_delta_without_dirty_info_sends_everything(self, ws_state):
+        frame = json.loads(_build_ws_delta())
+        assert {s["id"] for s in frame["sensors"]} == {"cam-001", "cam-002"}
+
+
+class TestConnectionManager:
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_client(self):
+        manager = ConnectionManager()
+        clients = [FakeWebSocket() for _ in range(120)]
+        for ws in clients:
+            await manager.connect(ws)
+
+        await manager.broadcast(b"hello")
+        await _drain()
+
+        assert all(ws.sent == [b"hello"] for ws in clients)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_clients(self):
+        manager = ConnectionManager()
+        healthy, broken = FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect(healthy)
+        await manager.connect(broken)
+
+        await manager.broadcast(b"hello")
+        await _drain()
+
+        assert healthy.sent == [b"hello"]
+        assert manager.client_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_keeps_only_newest_frames(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        # No yield between broadcasts: the relay never gets to run
+        for i in range(CLIENT_QUEUE_SIZE + 10):
+            await manager.broadcast(str(i).encode())
+        await _drain()
+
+        assert len(ws.sent) == CLIENT_QUEUE_SIZE
+        assert ws.sent[-1] == str(CLIENT_QUEUE_SIZE + 9).encode()
+        assert ws.sent[0] == b"10"
+
+    @pytest.mark.asyncio
+    async def test_client_that_lost_a_delta_gets_full_state(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        def full() -> bytes:
+            return b"full"
+
+        # Overflow the queue so one delta is dropped
+        for i in range(CLIENT_QUEUE_SIZE + 1):
+            await manager.broadcast(str(i).encode(), full=full)
+        await _drain()
+        await manager.broadcast(b"delta", full=full)
+        await manager.broadcast(b"next", full=full)
+        await _drain()
+
+        assert ws.sent[-2:] == [b"full", b"next"]
+
+    @pytest.mark.asyncio
+    async def test_full_state_broadcast_clears_pending_resync(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        for i in range(CLIENT_QUEUE_SIZE + 1):
+            await manager.broadcast(str(i).encode(), full=lambda: b"full")
+        await manager.broadcast(b"state")
+        await _drain()
+        await manager.broadcast(b"delta", full=lambda: b"full")
+        await _drain()
+
+        assert ws.sent[-2:] == [b"state", b"delta"]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_is_idempotent(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        await manager.disconnect(ws)
+        await manager.disconnect(ws)
+
+        assert manager.client_count == 0
+
+    @pytest.mark.asyncio
+    async def test_deflate_clients_get_compressed_frames(self):
+        manager = ConnectionManager()
+        plain, deflating = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(plain)
+        await manager.connect(deflating, deflate=True)
+
+        await manager.broadcast(b"hello" * 100)
+        await _drain()
+
+        assert plain.sent == [b"hello" * 100]
+        assert zlib.decompress(deflating.sent[0]) == b"hello" * 100
+
+    @pytest.mark.asyncio
+    async def test_broadcast_skips_disconnected_clients(self):
+        manager = ConnectionManager()
+        stays, leaves = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(stays)
+        await manager.connect(leaves)
+
+        await manager.disconnect(leaves)
+        await manager.broadcast(b"hello")
+        await _drain()
+
+        assert stays.sent == [b"hello"]
+        assert leaves.sent == []
+
+
+class TestBroadcaster:
+    @pytest.mark.asyncio
+    async def test_deltas_follow_consecutive_versions(self, ws_state):
+        ws = FakeWebSocket()
+        await ws_handler.manager.connect(ws)
+        try:
+            for version in (1, 2, 4):
+                ws_state["version"] = version
+                await broadcast_update()
+            await _drain()
+        finally:
+            await ws_handler.manager.disconnect(ws)
+
+        types = [json.loads(frame)["type"] for frame in ws.sent]
+        # First broadcast and the one after a skipped version are full
+        assert types == ["sensor_update", "sensor_delta", "sensor_update"]
+
+    @pytest.mark.asyncio
+    async def test_frame_is_serialized_once_for_all_clients(self, ws_state):
+        clients = [FakeWebSocket() for _ in range(3)]
+        for ws in clients:
+            await ws_handler.manager.connect(ws)
+        try:
+            await broadcast_update()
+            await _drain()
+        finally:
+            for ws in clients:
+                await ws_handler.manager.disconnect(ws)
+
+        frame = clients[0].sent[0]
+        assert isinstance(frame, bytes)
+        assert all(ws.sent[0] is frame for ws in clients)
+
+    @pytest.mark.asyncio
+    async def test_burst_of_notifications_is_coalesced(self, ws_state, monkeypatch):
+        monkeypatch.setattr(ws_handler, "COALESCE_DELAY", 0.01)
+        ws = FakeWebSocket()
+        await ws_handler.manager.connect(ws)
+        task = asyncio.create_task(broadcaster_loop())
+        try:
+            for _ in range(3):
+                notify_update()
+            await asyncio.sleep(0.05)
+            await _drain()
+        finally:
+            task.cancel()
+            await ws_handler.manager.disconnect(ws)
+
+        assert len(ws.sent) == 1
+
+
+class TestWebSocketEndpoint:
+    def test_sends_full_state_then_answers_ping(self, ws_state):
+        app = FastAPI()
+        app.include_router(ws_handler.router)
+
+        with TestClient(app).websocket_connect("/ws") as ws:
+            first = json.loads(ws.receive_bytes())
+            ws.send_text("ping")
+            pong = json.loads(ws.receive_bytes())
+
+        assert first["type"] == "sensor_update"
+        assert pong == {"type": "pong"}
+
+    def test_deflate_encoding_compresses_every_frame(self, ws_state):
+        app = FastAPI()
+        app.include_router(ws_handler.router)
+
+        with TestClient(app).websocket_connect("/ws?encoding=deflate") as ws:
+            first = json.loads(zlib.decompress(ws.receive_bytes()))
+            ws.send_text("ping")
+            pong = json.loads(zlib.decompress(ws.receive_bytes()))
+
+        assert first["type"] == "sensor_update"
+        assert pong == {"type": "pong"}
+
+
+class TestActiveClients:
+    @pytest.mark.asyncio
+    async def test_tracks_connected_clients(self):
+        ws = FakeWebSocket()
+        assert not has_active_clients()
+
+        await ws_handler.manager.connect(ws)
+        try:
+            assert has_active_clients()
+        finally:
+            await ws_handler.manager.disconnect(ws)
+
+        assert not has_active_clients()
@@ -143,7 +143,12 @@ describe('fetchStats', () => {
 // ---------------------------------------------------------------------------
 describe('fetchSensorHistory', () => {
   it('calls /api/sensors/{id}/history with sensor ID', async () => {
-    const fakeHistory = [{ timestamp: '2025-01-01', pm25: 30, aqi: 80 }];
+    const fakeHistory = {
+      sensor_id: 'cam-003',
+      hours: 24,
+      columns: ['timestamp', 'pm25', 'aqi'],
+      rows: [['2025-01-01', 30, 80]],
+    };
     mockFetch.mockResolvedValueOnce(mockOkResponse(fakeHistory));
 
     const result = await fetchSensorHistory('cam-003');
@@ -1,12 +1,52 @@
 'use client';
 
 import { useState, useEffect, useRef, useCallback } from 'react';
-import type { WebSocketMessage } from '@/types';
+import type { WebSocketDelta, WebSocketMessage } from '@/types';
 
 const WS_URL = process.env.NEXT_PUBLIC_WS_URL || 'ws://localhost:40881/ws';
 const INITIAL_RECONNECT_DELAY = 1000;
 const MAX_RECONNECT_DELAY = 30000;
 
+/** Ask the backend for frames it compresses once per broadcast. */
+function withDeflate(url: string): string {
+  const parsed = new URL(url);
+  parsed.searchParams.set('encoding', 'deflate');
+  return parsed.toString();
+}
+
+/** Inflate a zlib-compressed binary frame to its JSON text. */
+function inflateFrame(data: ArrayBuffer): Promise<string> {
+  const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('deflate'));
+  return new Response(stream).text();
+}
+
+/**
+ * Merge a delta into the last full state; deltas before the first full frame are ignored.
+ * Unchanged sensors were still read this cycle, so they take the delta's timestamp.
+ */
+function applyDelta(
+  prev: WebSocketMessage | null,
+  delta: WebSocketDelta
+): WebSocketMessage | null {
+  if (!prev) return prev;
+  const changed = new Map(delta.sensors.map((s) => [s.id, s]));
+  const sensors = prev.sensors.map(
+    (s) => changed.get(s.id) ?? { ...s, timestamp: delta.timestamp }
+  );
+  for (const s of delta.sensors) {
+    if (!prev.sensors.some((p) => p.id === s.id)) sensors.push(s);
+  }
+  return {
+    ...prev,
+    timestamp: delta.timestamp,
+    sensors,
+    grid: delta.grid ?? prev.grid,
+    particles: delta.particles,
+    stats: delta.stats,
+    forecast: delta.forecast,
+  };
+}
+
 interface UseWebSocketReturn {
   data: WebSocketMessage | null;
   isConnected: boolean;
@@ -21,12 +61,15 @@ export function useWebSocket(): UseWebSocketReturn {
   const reconnectDelayRef = useRef(INITIAL_RECONNECT_DELAY);
   const reconnectTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
   const mountedRef = useRef(true);
+  // Frames inflate asynchronously; chain them so deltas apply in order
+  const pendingRef = useRef<Promise<void>>(Promise.resolve());
 
   const connect = useCallback(() => {
     if (wsRef.current?.readyState === WebSocket.OPEN) return;
 
     try {
-      const ws = new WebSocket(WS_URL);
+      const ws = new WebSocket(withDeflate(WS_URL));
+      ws.binaryType = 'arraybuffer';
       wsRef.current = ws;
 
       ws.onopen = () => {
@@ -38,12 +81,21 @@ export function useWebSocket(): UseWebSocketReturn {
 
       ws.onmessage = (event) => {
         if (!mountedRef.current) return;
-        try {
-          const message: WebSocketMessage = JSON.parse(event.data);
-          setData(message);
-        } catch (e) {
-          console.error('Failed to parse WebSocket message:', e);
-        }
+        pendingRef.current = pendingRef.current.then(async () => {
+          try {
+            const raw =
+              typeof event.data === 'string' ? event.data : await inflateFrame(event.data);
+            if (!mountedRef.current) return;
+            const message: WebSocketMessage | WebSocketDelta = JSON.parse(raw);
+            if (message.type === 'sensor_delta') {
+              setData((prev) => applyDelta(prev, message as WebSocketDelta));
+            } else if (message.type === 'sensor_update') {
+              setData(message as WebSocketMessage);
+            }
+          } catch (e) {
+            console.error('Failed to parse WebSocket message:', e);
+          }
+        });
       };
 
       ws.onerror = () => {
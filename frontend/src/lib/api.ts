@@ -5,6 +5,7 @@ import type {
   GridData,
   GlobalStats,
   HealthImpactData,
+  SensorHistory,
 } from '@/types';
 
 // Use relative paths through Next.js proxy rewrites by default.
@@ -53,9 +54,9 @@ export async function fetchStats(): Promise<GlobalStats> {
 export async function fetchSensorHistory(
   sensorId: string,
   hours?: number
-): Promise<{ timestamp: string; pm25: number; aqi: number }[]> {
+): Promise<SensorHistory> {
   const query = hours ? `?hours=${hours}` : '';
-  return fetchJSON(`/api/sensors/${sensorId}/history${query}`);
+  return fetchJSON<SensorHistory>(`/api/sensors/${sensorId}/history${query}`);
 }
 
 export async function fetchHealthImpact(sensorId?: string): Promise<HealthImpactData> {
@@ -103,6 +103,26 @@ export interface WebSocketMessage {
   forecast: ForecastPoint[];
 }
 
+/** Per-cycle update: only changed sensors; grid is null when unchanged. */
+export interface WebSocketDelta {
+  type: 'sensor_delta';
+  /** Cycle time; also the reading time of every sensor left out of `sensors`. */
+  timestamp: string;
+  sensors: SensorData[];
+  grid: GridData | null;
+  particles: ParticleData[];
+  stats: GlobalStats;
+  forecast: ForecastPoint[];
+}
+
+/** Columnar history: each row holds values in `columns` order. */
+export interface SensorHistory {
+  sensor_id: string;
+  hours: number;
+  columns: string[];
+  rows: (string | number | null)[][];
+}
+
 export interface HealthImpactData {
   score: number;
   risk_level: string;